@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+from operator import attrgetter
+
+from openpyxl.utils.cell import coordinate_from_string
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from openpyxl.worksheet.datavalidation import DataValidation
+
+
+class RangeDataValidation(DataValidation):
+    """
+    DataValidation that merges cells added in row order into column ranges
+    (C2, C3, ..., C5000 -> C2:C5000) instead of keeping one range per cell.
+    """
+    __attrs__ = DataValidation.__attrs__
+    __elements__ = DataValidation.__elements__
+    __nested__ = DataValidation.__nested__
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ranges = list(self.sqref.ranges)
+        self._last_ranges = {}
+
+    def add(self, cell):
+        if hasattr(cell, 'coordinate'):
+            cell = cell.coordinate
+        column, row = coordinate_from_string(cell)
+        last_range = self._last_ranges.get(column)
+        if last_range and last_range.min_row <= row <= last_range.max_row:
+            return
+        if last_range and row == last_range.max_row + 1:
+            last_range.expand(down=1)
+        elif cell in self.sqref:
+            return
+        else:
+            cell_range = CellRange(cell)
+            self._ranges.append(cell_range)
+            self._last_ranges[column] = cell_range
+        # MultiCellRange keeps its ranges in a list or a set depending on the
+        # openpyxl version, so it is rebuilt instead of being changed in place
+        self.sqref = MultiCellRange(
+            sorted(self._ranges, key=attrgetter('min_col', 'min_row')),
+        )
@@ -5,10 +5,10 @@ from iso3166 import countries
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill
 from openpyxl.styles.colors import Color
-from openpyxl.worksheet.datavalidation import DataValidation
 from tqdm import trange
 
 from connect.cli.core.constants import DEFAULT_BAR_FORMAT
+from connect.cli.core.datavalidation import RangeDataValidation
 from connect.cli.core.http import (
     handle_http_error,
 )
@@ -50,6 +50,10 @@ def dump_customers(api_url, api_key, account_id, output_file, silent, verbose=Fa
         _prepare_worksheet(wb.create_sheet('Customers'))
         _add_countries(wb.create_sheet('Countries'))
 
+        action_validation, search_criteria_validation = _get_validations()
+        wb['Customers'].add_data_validation(action_validation)
+        wb['Customers'].add_data_validation(search_criteria_validation)
+
         customers = client.ns('tier').accounts.all()
         row_idx = 2
         count = customers.count()
@@ -57,7 +61,13 @@ def dump_customers(api_url, api_key, account_id, output_file, silent, verbose=Fa
         for customer in customers:
             progress.set_description(f'Processing customer {customer["id"]}')
             progress.update(1)
-            _fill_customer_row(wb['Customers'], row_idx, customer)
+            _fill_customer_row(
+                wb['Customers'],
+                row_idx,
+                customer,
+                action_validation,
+                search_criteria_validation,
+            )
             row_idx += 1
     except ClientError as error:
         handle_http_error(error)
@@ -69,8 +79,8 @@ def dump_customers(api_url, api_key, account_id, output_file, silent, verbose=Fa
     return output_file
 
 
-def _fill_customer_row(ws, row_idx, customer):
-    action_validation = DataValidation(
+def _get_validations():
+    action_validation = RangeDataValidation(
         type='list',
         formula1='"-,create,update"',
         allow_blank=False,
@@ -79,7 +89,7 @@ def _fill_customer_row(ws, row_idx, customer):
     action_validation.errorTitle = str('Invalid action')
     action_validation.prompt = str('Please choose action from list')
     action_validation.promptTitle = str('List of choices')
-    search_criteria_validation = DataValidation(
+    search_criteria_validation = RangeDataValidation(
         type='list',
         formula1='"-,id,external_id,external_uid"',
         allow_blank=False,
@@ -89,9 +99,10 @@ def _fill_customer_row(ws, row_idx, customer):
     search_criteria_validation.prompt = str('Please choose search criteria from list')
     search_criteria_validation.promptTitle = str('List of choices')
 
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(search_criteria_validation)
+    return action_validation, search_criteria_validation
+
 
+def _fill_customer_row(ws, row_idx, customer, action_validation, search_criteria_validation):
     ws.cell(row_idx, 1, value=customer.get('id', '-'))
     ws.cell(row_idx, 2, value=customer.get('external_id', '-'))
     ws.cell(row_idx, 3, value=customer.get('external_uid', '-'))
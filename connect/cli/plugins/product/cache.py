@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from threading import get_ident, Lock
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+from connect.cli.plugins.product.constants import MEDIA_CACHE_MAX_SIZE
+
+
+@contextmanager
+def _file_lock(path):
+    with open(path, 'a') as f:
+        f.seek(0)
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class MediaCache:
+    """
+    Media cache that can be shared by several processes: the index is merged
+    with the one on disk under a file lock when saved, and an object evicted
+    by another process is reported as a cache miss.
+    """
+    def __init__(self, path, max_size=MEDIA_CACHE_MAX_SIZE):
+        self._path = path
+        self._objects_path = os.path.join(path, 'objects')
+        self._index_file = os.path.join(path, 'index.json')
+        self._lock_file = os.path.join(path, 'index.lock')
+        self._max_size = max_size
+        self._lock = Lock()
+        os.makedirs(self._objects_path, exist_ok=True)
+        self._urls, self._objects = self._load()
+        self._updated_urls = set()
+
+    @property
+    def size(self):
+        return sum(obj['size'] for obj in self._objects.values())
+
+    def get(self, url):
+        with self._lock:
+            entry = self._urls.get(url)
+            if not entry or not os.path.isfile(self._object_path(entry['digest'])):
+                return None
+            return dict(entry)
+
+    def put(self, url, file_path, digest, size, etag=None, last_modified=None):
+        with self._lock:
+            object_path = self._object_path(digest)
+            if not os.path.isfile(object_path):
+                partial_path = f'{object_path}.{os.getpid()}.{get_ident()}.part'
+                shutil.copyfile(file_path, partial_path)
+                os.replace(partial_path, object_path)
+            self._objects[digest] = {'size': size, 'accessed': time.time()}
+            self._urls[url] = {
+                'digest': digest,
+                'size': size,
+                'etag': etag,
+                'last_modified': last_modified,
+            }
+            self._updated_urls.add(url)
+
+    def copy(self, entry, destination):
+        with self._lock:
+            self._objects[entry['digest']]['accessed'] = time.time()
+        try:
+            shutil.copyfile(self._object_path(entry['digest']), destination)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def save(self):
+        with self._lock, _file_lock(self._lock_file):
+            self._merge(*self._load())
+            self._evict()
+            partial_file = f'{self._index_file}.part'
+            with open(partial_file, 'w') as f:
+                json.dump({'urls': self._urls, 'objects': self._objects}, f)
+            os.replace(partial_file, self._index_file)
+
+    @staticmethod
+    def get_validation_headers(entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _load(self):
+        if not os.path.isfile(self._index_file):
+            return {}, {}
+        try:
+            with open(self._index_file, 'r') as f:
+                data = json.load(f)
+            return data['urls'], data['objects']
+        except (ValueError, KeyError):
+            return {}, {}
+
+    def _merge(self, urls, objects):
+        for digest, obj in self._objects.items():
+            if digest in objects:
+                obj = dict(obj, accessed=max(obj['accessed'], objects[digest]['accessed']))
+            objects[digest] = obj
+        for url in self._updated_urls:
+            urls[url] = self._urls[url]
+        self._objects = {
+            digest: obj for digest, obj in objects.items()
+            if os.path.isfile(self._object_path(digest))
+        }
+        self._urls = urls
+        self._updated_urls = set()
+
+    def _evict(self):
+        total = self.size
+        by_access = sorted(self._objects.items(), key=lambda obj: obj[1]['accessed'])
+        for digest, obj in by_access:
+            if total <= self._max_size:
+                break
+            object_path = self._object_path(digest)
+            if os.path.isfile(object_path):
+                os.remove(object_path)
+            del self._objects[digest]
+            total -= obj['size']
+        self._urls = {
+            url: entry for url, entry in self._urls.items()
+            if entry['digest'] in self._objects
+        }
+
+    def _object_path(self, digest):
+        return os.path.join(self._objects_path, digest)
@@ -1,160 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
+from urllib import parse
 
-from click import ClickException, echo as clickecho
-from fs.tempfs import TempFS
-from openpyxl import load_workbook
-
-from connect.cli.plugins.product.export import dump_product
-from connect.cli.plugins.product.sync import (
-    ActionsSynchronizer,
-    CapabilitiesSynchronizer,
-    GeneralSynchronizer,
-    ItemSynchronizer,
-    MediaSynchronizer,
-    ParamsSynchronizer,
-    TemplatesSynchronizer,
-)
+import requests
+from click import ClickException
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+from connect.cli.plugins.product.constants import CLONE_WORKERS
+from connect.cli.plugins.product.schema import CAPABILITIES_SCHEMA, get_capabilities_rows
+from connect.cli.plugins.product.sync.units import get_unit_resolver
+from connect.cli.plugins.product.utils import apply_capability, cleanup_product_for_update
 from connect.client import ClientError, ConnectClient, RequestLogger
 
 
-class ProductCloner:
-    def __init__(self, config, source_account, destination_account, product_id):
-        self.fs = TempFS(identifier=f'_clone_{product_id}')
-        self.config = config
-        self.source_account = (source_account if source_account else config.active.id)
-        self.destination_account = (destination_account if destination_account else config.active.id)
-        self.product_id = product_id
-        self.destination_product = None
-        self.wb = None
-
-    def dump(self):
-        dump_product(
-            api_url=self.config.active.endpoint,
-            api_key=self.config.active.api_key,
-            product_id=self.product_id,
-            output_path=self.fs.root_path,
-            output_file='',
-            silent=self.config.silent,
-            verbose=self.config.verbose,
-        )
+_CLONED_CAPABILITIES = 9
 
-    def inject(self):  # noqa: CCR001
-        try:
-            self.config.activate(self.destination_account)
-            input_file = f'{self.fs.root_path}/{self.product_id}/{self.product_id}.xlsx'
-            client = ConnectClient(
-                api_key=self.config.active.api_key,
-                endpoint=self.config.active.endpoint,
-                use_specs=False,
-                max_retries=3,
-                logger=RequestLogger() if self.config.verbose else None,
-            )
-            synchronizer = GeneralSynchronizer(
-                client,
-                self.config.silent,
-            )
+_PARAM_PHASES = ('ordering', 'fulfillment', 'configuration')
 
-            synchronizer.open(input_file, 'General Information')
-            synchronizer.sync()
-            clickecho('\n')
-            synchronizer = ItemSynchronizer(
-                client,
-                self.config.silent,
-            )
-            product_id = synchronizer.open(input_file, 'Items')
-            items = client.products[product_id].items.all()
-            for item in items:
-                client.products[product_id].items[item['id']].delete()
-            synchronizer.sync()
-            clickecho('\n')
-            synchronizer = CapabilitiesSynchronizer(
-                client,
-                self.config.silent,
-            )
-            synchronizer.open(input_file, 'Capabilities')
-            synchronizer.sync()
-            clickecho('\n')
-            templates = client.products[product_id].templates.all()
-            sample_templates = []
-            for template in templates:
-                sample_templates.append(template['id'])
-
-            synchronizer = TemplatesSynchronizer(
-                client,
-                self.config.silent,
-            )
 
-            synchronizer.open(input_file, 'Templates')
-            synchronizer.sync()
+def get_item_payload(item, unit_id):
+    payload = {
+        'mpn': item['mpn'],
+        'name': item.get('display_name') or item['name'],
+        'description': item['description'],
+        'type': item['type'],
+        'precision': item['precision'],
+        'unit': {'id': unit_id},
+        'period': item.get('period', 'monthly'),
+        'ui': {'visibility': True},
+    }
+    if item['type'] == 'reservation':
+        payload['commitment'] = {'count': (item.get('commitment') or {}).get('count', 1)}
+    return payload
 
-            for template in sample_templates:
-                try:
-                    client.products[product_id].templates[template].delete()
-                except ClientError:
-                    # done intentionally till fulfillment in progress template not on public api
-                    pass
 
-            clickecho('\n')
-            synchronizer = ParamsSynchronizer(
-                client,
-                self.config.silent,
-            )
+def get_param_payload(param):
+    return {
+        key: value for key, value in param.items()
+        if key not in ('id', 'position', 'events')
+    }
 
-            synchronizer.open(input_file, "Ordering Parameters")
-            synchronizer.sync()
-            clickecho('\n')
-            synchronizer.open(input_file, "Fulfillment Parameters")
-            synchronizer.sync()
-            clickecho('\n')
-            synchronizer.open(input_file, "Configuration Parameters")
-            synchronizer.sync()
-            clickecho('\n')
-
-            synchronizer = ActionsSynchronizer(
-                client,
-                self.config.silent,
-            )
 
-            synchronizer.open(input_file, 'Actions')
-            synchronizer.sync()
-            clickecho('\n')
+def get_template_payload(template):
+    payload = {
+        'name': template['title'],
+        'scope': template['scope'],
+        'body': template['body'],
+        'type': template.get('type', 'fulfillment'),
+    }
+    if template['scope'] == 'asset':
+        payload['title'] = template['title']
+    return payload
 
-            synchronizer = MediaSynchronizer(
-                client,
-                self.config.silent,
-            )
 
-            synchronizer.open(input_file, 'Media')
-            synchronizer.sync()
-            clickecho('\n')
+def get_action_payload(action):
+    return {
+        'action': action['action'],
+        'name': action['name'],
+        'type': 'button',
+        'scope': action['scope'],
+        'description': action['description'],
+        'title': action['title'],
+    }
 
-            self.config.activate(self.source_account)
-        except ClientError as e:
-            raise ClickException(f"Error while cloning product: {str(e)}")
 
-    def load_wb(self):
-        self.wb = load_workbook(
-            f'{self.fs.root_path}/{self.product_id}/{self.product_id}.xlsx',
-            data_only=True,
-        )
+class ProductCloner:
+    def __init__(self, config, source_account, destination_account, product_id, workers=CLONE_WORKERS):
+        self.config = config
+        self.source_account = (source_account if source_account else config.active.id)
+        self.destination_account = (destination_account if destination_account else config.active.id)
+        self.product_id = product_id
+        self.destination_product = None
+        self.source = None
+        self.id_map = {}
+        self._workers = workers
+        self._files = {}
+        self._lock = Lock()
+
+    def load(self):
+        client = self._get_client(self.source_account)
+        product = client.products[self.product_id]
+        collections = {
+            'product': product.get,
+            'items': lambda: list(product.items.all()),
+            'parameters': lambda: list(product.parameters.all()),
+            'templates': lambda: list(product.templates.all()),
+            'actions': lambda: list(product.actions.all()),
+            'media': lambda: list(product.media.all()),
+        }
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                futures = {name: executor.submit(load) for name, load in collections.items()}
+                self.source = {name: future.result() for name, future in futures.items()}
+                locations = [self.source['product']['icon']]
+                locations.extend(media['thumbnail'] for media in self.source['media'])
+                with requests.Session() as session:
+                    files = executor.map(
+                        lambda location: self._download(session, client, location),
+                        locations,
+                    )
+                    self._files = dict(zip(locations, files))
+        except ClientError as e:
+            raise ClickException(f'Error while reading product {self.product_id}: {str(e)}')
 
     def create_product(self, name=None):
         if not name:
             time = datetime.today().strftime('%Y-%m-%d-%H:%M:%S')
             name = f"Clone of {self.product_id} {time}"
-        ws = self.wb['General Information']
-        ws['B6'].value = name
-        self.config.activate(self.destination_account)
-
         try:
-            client = ConnectClient(
-                api_key=self.config.active.api_key,
-                endpoint=self.config.active.endpoint,
-                use_specs=False,
-                max_retries=3,
-                logger=RequestLogger() if self.config.verbose else None,
-            )
-            category = self._get_cat_id(client, ws['B8'].value)
+            client = self._get_client(self.destination_account)
+            category = self._get_cat_id(client, self.source['product']['category']['name'])
             product = client.products.create(
                 {
                     "name": name,
@@ -163,58 +119,121 @@ class ProductCloner:
                     },
                 },
             )
-            if name:
-                ws['B6'].value = name
-            ws['B5'].value = product['id']
             self.destination_product = product['id']
-            self.wb.save(f'{self.fs.root_path}/{self.product_id}/{self.product_id}.xlsx')
         except ClientError as e:
             raise ClickException(f'Error on product creation: {str(e)}')
 
-    def clean_wb(self):
-        ws = self.wb['Capabilities']
-        for row in range(2, 11):
-            ws[f'B{row}'].value = 'update'
-
-        ws = self.wb['Embedding Static Resources']
-        for row in range(2, ws.max_row + 1):
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Media']
-        for row in range(2, ws.max_row + 1):
-            ws[f'B{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Templates']
-        for row in range(2, ws.max_row + 1):
-            ws[f'A{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Items']
-        for row in range(2, ws.max_row + 1):
-            ws[f'A{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Ordering Parameters']
-        for row in range(2, ws.max_row + 1):
-            ws[f'A{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Fulfillment Parameters']
-        for row in range(2, ws.max_row + 1):
-            ws[f'A{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Configuration Parameters']
-        for row in range(2, ws.max_row + 1):
-            ws[f'A{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-
-        ws = self.wb['Actions']
-        for row in range(2, ws.max_row + 1):
-            ws[f'A{row}'].value = ''
-            ws[f'C{row}'].value = 'create'
-        self.wb.save(f'{self.fs.root_path}/{self.product_id}/{self.product_id}.xlsx')
+    def clone(self):
+        client = self._get_client(self.destination_account)
+        units = get_unit_resolver(client)
+        tasks = [
+            lambda: self._clone_general(client),
+            lambda: self._clone_items(client, units),
+            lambda: self._clone_templates(client),
+            lambda: self._clone_objects(client, 'actions', self.source['actions'], get_action_payload),
+            lambda: self._clone_media(client),
+        ]
+        for phase in _PARAM_PHASES:
+            params = [param for param in self.source['parameters'] if param['phase'] == phase]
+            tasks.append(
+                lambda params=params: self._clone_objects(client, 'parameters', params, get_param_payload),
+            )
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                futures = [executor.submit(task) for task in tasks]
+                for future in futures:
+                    future.result()
+        except ClientError as e:
+            raise ClickException(f"Error while cloning product: {str(e)}")
+
+    def _clone_general(self, client):
+        source = self.source['product']
+        product = cleanup_product_for_update(client.products[self.destination_product].get())
+        product['short_description'] = source['short_description'].replace('\n', '')
+        product['detailed_description'] = source['detailed_description']
+        product['customer_ui_settings']['description'] = source['customer_ui_settings']['description']
+        product['customer_ui_settings']['getting_started'] = (
+            source['customer_ui_settings']['getting_started']
+        )
+        capabilities = get_capabilities_rows(source['capabilities'])[:_CLONED_CAPABILITIES]
+        for capability, value in capabilities:
+            apply_capability(product, CAPABILITIES_SCHEMA.row_type(capability, 'update', value))
+        # Solution for v22 to avoid issue while updating capabilities
+        del product['capabilities']['subscription']['change']['editable_ordering_parameters']
+        client.products[self.destination_product].update(product)
+
+        icon = source['icon']
+        self._upload(
+            client.products[self.destination_product].update,
+            {'icon': (icon.rsplit('/', 1)[-1], self._files[icon])},
+        )
+
+    def _clone_items(self, client, units):
+        product = client.products[self.destination_product]
+        for item in list(product.items.all()):
+            product.items[item['id']].delete()
+        for item in self.source['items']:
+            unit_id = units.get_or_create(item['unit']['id'], item['type'])
+            self._map_id(item, product.items.create(get_item_payload(item, unit_id)))
+
+    def _clone_templates(self, client):
+        product = client.products[self.destination_product]
+        default_templates = [template['id'] for template in product.templates.all()]
+        self._clone_objects(client, 'templates', self.source['templates'], get_template_payload)
+        for template_id in default_templates:
+            try:
+                product.templates[template_id].delete()
+            except ClientError:
+                # done intentionally till fulfillment in progress template not on public api
+                pass
+
+    def _clone_objects(self, client, collection, objects, get_payload):
+        resources = client.products[self.destination_product].collection(collection)
+        for obj in objects:
+            self._map_id(obj, resources.create(get_payload(obj)))
+
+    def _clone_media(self, client):
+        resources = client.products[self.destination_product].media
+        for media in self.source['media']:
+            fields = {
+                'type': (media['type'], media['type']),
+                'position': (str(media['position']), str(media['position'])),
+                'thumbnail': (media['thumbnail'].rsplit('/', 1)[-1], self._files[media['thumbnail']]),
+            }
+            if media['type'] == 'video':
+                fields['url'] = media['url']
+            self._map_id(media, self._upload(resources.create, fields))
+
+    def _map_id(self, source, destination):
+        with self._lock:
+            self.id_map[source['id']] = destination['id']
+
+    def _get_client(self, account_id):
+        account = self.config.accounts[account_id]
+        return ConnectClient(
+            api_key=account.api_key,
+            endpoint=account.endpoint,
+            use_specs=False,
+            max_retries=3,
+            logger=RequestLogger() if self.config.verbose else None,
+        )
+
+    @staticmethod
+    def _download(session, client, location):
+        api_location = parse.urlparse(client.endpoint)
+        url = f'{api_location.scheme}://{api_location.netloc}{location}'
+        response = session.get(url)
+        if response.status_code != 200:
+            raise ClickException(f"Error obtaining image from {url}")
+        return response.content
+
+    @staticmethod
+    def _upload(send, fields):
+        payload = MultipartEncoder(fields=fields)
+        return send(
+            data=payload,
+            headers={'Content-Type': payload.content_type},
+        )
 
     @staticmethod
     def _get_cat_id(client, category_name):
@@ -3,16 +3,32 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
+import glob
+import os
+import time
+from collections import Counter
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from copy import copy
+
 import click
 from click.exceptions import ClickException
 from cmr import render
+from tqdm import trange
 
 from connect.cli.core import group
 from connect.cli.core.config import pass_config
+from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.core.utils import continue_or_quit
 from connect.cli.plugins.exceptions import SheetNotFoundError
 from connect.cli.plugins.product.clone import ProductCloner
-from connect.cli.plugins.product.export import dump_product
+from connect.cli.plugins.product.constants import (
+    BATCH_EXPORT_WORKERS,
+    BATCH_SYNC_WORKERS,
+    EXPORT_FORMATS,
+    SYNC_SHEET_WORKERS,
+)
+from connect.cli.plugins.product.export import dump_product, dump_products
+from connect.cli.plugins.product.formats import get_files_format
 from connect.cli.plugins.product.sync import (
     ActionsSynchronizer,
     CapabilitiesSynchronizer,
@@ -22,6 +38,8 @@ from connect.cli.plugins.product.sync import (
     MediaSynchronizer,
     ParamsSynchronizer,
     StaticResourcesSynchronizer,
+    SyncScheduler,
+    SyncSession,
     TemplatesSynchronizer,
 )
 from connect.client import ClientError, ConnectClient, R, RequestLogger
@@ -100,7 +118,13 @@ def cmd_list_products(config, query, page_size, always_continue):
     short_help='Export a product to an excel file.',
 )
 
-@click.argument('product_id', metavar='product_id', nargs=1, required=True)  # noqa: E304
+@click.argument('product_ids', metavar='product_id', nargs=-1)  # noqa: E304
+@click.option(
+    '--query',
+    '-q',
+    'query',
+    help='RQL query expression to select the products to export.',
+)
 @click.option(
     '--out',
     '-o',
@@ -115,8 +139,59 @@ def cmd_list_products(config, query, page_size, always_continue):
     type=click.Path(exists=True, file_okay=False, dir_okay=True),
     help='Directory where to store the export.',
 )
+@click.option(
+    '--jobs',
+    '-j',
+    'jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of product collections to fetch concurrently.',
+)
+@click.option(
+    '--media-cache',
+    '-m',
+    'media_cache',
+    type=click.Path(exists=False, file_okay=False, dir_okay=True),
+    help='Directory where to cache downloaded media between exports.',
+)
+@click.option(
+    '--format',
+    '-f',
+    'output_format',
+    type=click.Choice(EXPORT_FORMATS),
+    default='xlsx',
+    help='Output format, ndjson, json and parquet write one file per resource type.',
+)
+@click.option(
+    '--incremental',
+    '-i',
+    'incremental',
+    is_flag=True,
+    help='Fetch only the objects changed since the previous export of the product.',
+)
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(min=1),
+    default=BATCH_EXPORT_WORKERS,
+    help='Number of products to export in parallel when exporting many products.',
+)
 @pass_config
-def cmd_dump_products(config, product_id, output_file, output_path):
+def cmd_dump_products(
+    config,
+    product_ids,
+    query,
+    output_file,
+    output_path,
+    jobs,
+    media_cache,
+    output_format,
+    incremental,
+    workers,
+):
+    if not product_ids and not query:
+        raise ClickException('Provide one or more product ids or a query to select the products.')
     acc_id = config.active.id
     acc_name = config.active.name
     if not config.silent:
@@ -126,6 +201,38 @@ def cmd_dump_products(config, product_id, output_file, output_path):
                 fg='blue',
             ),
         )
+    if query or len(product_ids) > 1:
+        if output_file:
+            raise ClickException('The output file name can not be set when exporting many products.')
+        if query:
+            client = ConnectClient(
+                api_key=config.active.api_key,
+                endpoint=config.active.endpoint,
+                use_specs=False,
+                max_retries=3,
+                logger=RequestLogger() if config.verbose else None,
+            )
+            product_ids = product_ids + tuple(
+                product['id'] for product in client.products.filter(query)
+                if product['id'] not in product_ids
+            )
+        results = dump_products(
+            config.active.endpoint,
+            config.active.api_key,
+            product_ids,
+            config.silent,
+            config.verbose,
+            output_path,
+            jobs,
+            media_cache,
+            output_format,
+            incremental,
+            workers,
+        )
+        print_export_results(config.silent, results)
+        return
+
+    product_id = product_ids[0]
     outfile = dump_product(
         config.active.endpoint,
         config.active.api_key,
@@ -134,6 +241,10 @@ def cmd_dump_products(config, product_id, output_file, output_path):
         config.silent,
         config.verbose,
         output_path,
+        jobs,
+        media_cache,
+        output_format,
+        incremental,
     )
     if not config.silent:
         click.echo(
@@ -144,6 +255,45 @@ def cmd_dump_products(config, product_id, output_file, output_path):
         )
 
 
+SYNC_SHEETS = (
+    ('Items', ItemSynchronizer, 'Items'),
+    ('Capabilities', CapabilitiesSynchronizer, 'Capabilities'),
+    ('Static Resources', StaticResourcesSynchronizer, 'Embedding Static Resources'),
+    ('Templates', TemplatesSynchronizer, 'Templates'),
+    ('Ordering Parameters', ParamsSynchronizer, 'Ordering Parameters'),
+    ('Fulfillment Parameters', ParamsSynchronizer, 'Fulfillment Parameters'),
+    ('Configuration Parameters', ParamsSynchronizer, 'Configuration Parameters'),
+    ('Actions', ActionsSynchronizer, 'Actions'),
+    ('Media', MediaSynchronizer, 'Media'),
+    ('Configuration', ConfigurationValuesSynchronizer, 'Configuration'),
+)
+
+
+@grp_product.command(
+    name='validate',
+    short_help='Validate a product excel file without synchronizing it.',
+)
+@click.argument('input_file', metavar='input_file', nargs=1, required=True)  # noqa: E304
+@pass_config
+def cmd_validate_product(config, input_file):
+    input_file = get_sync_input_file(input_file)
+    session = SyncSession(None, input_file)
+    results = validate_sync(config, input_file, session)
+    session.close()
+    if results:
+        print_validation_errors(results)
+        raise ClickException(
+            f'{sum(len(result["errors"]) for result in results)} rows of {input_file} have errors.',
+        )
+    if not config.silent:
+        click.echo(
+            click.style(
+                f'No errors have been found in {input_file}.',
+                fg='green',
+            ),
+        )
+
+
 @grp_product.command(
     name='sync',
     short_help='Synchronize a product from an excel file.',
@@ -156,21 +306,64 @@ def cmd_dump_products(config, product_id, output_file, output_path):
     is_flag=True,
     help='Answer yes to all questions.',
 )
+@click.option(
+    '--jobs',
+    '-j',
+    'jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of rows to synchronize concurrently.',
+)
+@click.option(
+    '--plan',
+    'plan',
+    is_flag=True,
+    help='Print the changes to apply without synchronizing the product.',
+)
+@click.option(
+    '--resume',
+    'resume',
+    is_flag=True,
+    help='Resume an interrupted synchronization skipping the rows already processed.',
+)
+@click.option(
+    '--workers',
+    '-w',
+    'workers',
+    type=click.IntRange(min=1),
+    default=BATCH_SYNC_WORKERS,
+    help='Number of products to synchronize in parallel when synchronizing many workbooks.',
+)
 @pass_config
-def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
+def cmd_sync_products(config, input_file, yes, jobs, plan, resume, workers):  # noqa: CCR001
     acc_id = config.active.id
     acc_name = config.active.name
 
-    if '.xlsx' not in input_file:
-        input_file = f'{input_file}/{input_file}.xlsx'
+    input_files = get_batch_input_files(input_file)
+    if input_files is not None:
+        if not input_files:
+            raise ClickException(f'No workbooks to synchronize have been found in {input_file}.')
+        if plan:
+            raise ClickException('The changes can not be planned when synchronizing many workbooks.')
+        if not config.silent:
+            click.echo(
+                click.style(
+                    f'Current active account: {acc_id} - {acc_name}\n',
+                    fg='blue',
+                ),
+            )
+        if not yes:
+            click.confirm(
+                f'Are you sure you want to synchronize the {len(input_files)} products '
+                f'of {input_file} ?',
+                abort=True,
+            )
+            click.echo('')
+        results = sync_products(config, input_files, jobs, resume, workers)
+        print_sync_results(config.silent, results)
+        return
 
-    if not config.silent:
-        click.echo(
-            click.style(
-                f'Current active account: {acc_id} - {acc_name}\n',
-                fg='blue',
-            ),
-        )
+    input_file = get_sync_input_file(input_file)
     client = ConnectClient(
         api_key=config.active.api_key,
         endpoint=config.active.endpoint,
@@ -178,13 +371,38 @@ def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
         max_retries=3,
         logger=RequestLogger() if config.verbose else None,
     )
+    # the same session validates and synchronizes, so the workbook is parsed once
+    session = SyncSession(client, input_file, jobs, resume)
+    validation_results = validate_sync(config, input_file, session)
+    if validation_results:
+        session.close()
+        print_validation_errors(validation_results)
+        raise ClickException(
+            'The product has not been synchronized, please fix the errors and try again.',
+        )
 
+    if not config.silent:
+        click.echo(
+            click.style(
+                f'Current active account: {acc_id} - {acc_name}\n',
+                fg='blue',
+            ),
+        )
     synchronizer = GeneralSynchronizer(
         client,
         config.silent,
+        session,
     )
     product_id = synchronizer.open(input_file, 'General Information')
 
+    if plan:
+        print_plan(
+            product_id=product_id,
+            plan=plan_sync(client, config, input_file, session),
+        )
+        session.close()
+        return
+
     if not yes:
         click.confirm(
             'Are you sure you want to synchronize '
@@ -201,135 +419,104 @@ def cmd_sync_products(config, input_file, yes):  # noqa: CCR001
                 fg='magenta',
             ),
         )
-    results_tracker = []
+    results_tracker = sync_sheets(client, config, input_file, session)
 
-    try:
-        results_tracker.append(item_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
-    try:
-        results_tracker.append(capabilities_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
-
-    try:
-        results_tracker.append(static_resources_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
+    print_results(
+        product_id=product_id,
+        silent=config.silent,
+        results_tracker=results_tracker,
+    )
 
-    try:
-        results_tracker.append(templates_sync(client, config, input_file))
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
 
-    results_tracker.append(
-        param_task(
-            client,
-            config,
-            input_file,
-            product_id,
-            'Ordering Parameters',
-        ),
+def sync_sheets(client, config, input_file, session):
+    scheduler = SyncScheduler(SYNC_SHEET_WORKERS)
+    scheduler.add('Items', sheet_task(item_sync, client, config, input_file, session))
+    scheduler.add('Capabilities', sheet_task(capabilities_sync, client, config, input_file, session))
+    # both sheets put the whole product document, the second update must see the first one
+    scheduler.add(
+        'Static Resources',
+        sheet_task(static_resources_sync, client, config, input_file, session),
+        depends_on=('Capabilities',),
     )
-    results_tracker.append(
-        param_task(
-            client,
-            config,
-            input_file,
-            product_id,
-            'Fulfillment Parameters',
-        ),
-    )
-    results_tracker.append(
-        param_task(
-            client,
-            config,
-            input_file,
-            product_id,
-            'Configuration Parameters',
-        ),
+    scheduler.add('Templates', sheet_task(templates_sync, client, config, input_file, session))
+    for param_type in ('Ordering Parameters', 'Fulfillment Parameters', 'Configuration Parameters'):
+        scheduler.add(
+            param_type,
+            sheet_task(params_sync, client, config, input_file, session, param_type),
+        )
+    scheduler.add('Actions', sheet_task(actions_sync, client, config, input_file, session))
+    scheduler.add('Media', sheet_task(media_sync, client, config, input_file, session))
+    scheduler.add(
+        'Configuration',
+        sheet_task(config_values_sync, client, config, input_file, session),
+        depends_on=('Items', 'Configuration Parameters'),
     )
+    results_tracker = [result for result in scheduler.run() if result]
 
-    try:
-        results_tracker.append(
-            actions_sync(
-                client,
-                config,
-                input_file,
-            ),
-        )
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
+    session.save()
+    return results_tracker
 
-    try:
-        results_tracker.append(
-            media_sync(
-                client,
-                config,
-                input_file,
-            ),
-        )
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
 
+def _sync_product_task(config, input_file, jobs, resume):
+    started_at = time.monotonic()
+    config = copy(config)
+    config.silent = True
+    product_id = None
+    results = []
+    error = None
     try:
-        results_tracker.append(
-            config_values_sync(
-                client,
-                config,
-                input_file,
-            ),
+        input_file = get_sync_input_file(input_file)
+        client = ConnectClient(
+            api_key=config.active.api_key,
+            endpoint=config.active.endpoint,
+            use_specs=False,
+            max_retries=3,
         )
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
+        session = SyncSession(client, input_file, jobs, resume)
+        validation_results = validate_sync(config, input_file, session)
+        if validation_results:
+            session.close()
+            raise ClickException(
+                f'{sum(len(result["errors"]) for result in validation_results)} rows have errors.',
             )
+        synchronizer = GeneralSynchronizer(client, True, session)
+        product_id = synchronizer.open(input_file, 'General Information')
+        general_errors = synchronizer.sync()
+        results = sync_sheets(client, config, input_file, session)
+        if general_errors:
+            error = f'Error synchronizing general product information: {".".join(general_errors)}'
+    except Exception as e:
+        error = str(e)
+    return {
+        'input_file': input_file,
+        'product_id': product_id,
+        'results': results,
+        'elapsed': time.monotonic() - started_at,
+        'error': error,
+    }
 
-    print_results(
-        product_id=product_id,
-        silent=config.silent,
-        results_tracker=results_tracker,
+
+def sync_products(config, input_files, jobs, resume, workers=BATCH_SYNC_WORKERS):
+    results = {}
+    progress = trange(
+        0,
+        len(input_files),
+        disable=config.silent,
+        leave=True,
+        bar_format=DEFAULT_BAR_FORMAT,
     )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_sync_product_task, config, input_file, jobs, resume): input_file
+            for input_file in input_files
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            progress.set_description(f'Synchronized {futures[future]}')
+            progress.update(1)
+    progress.close()
+
+    return [results[input_file] for input_file in input_files]
 
 
 @grp_product.command(
@@ -436,14 +623,13 @@ def cmd_clone_products(config, source_product_id, source_account, destination_ac
     if not config.silent:
         click.echo(
             click.style(
-                f'Dumping Product {synchronizer.product_id} from account '
+                f'Reading Product {synchronizer.product_id} from account '
                 f'{synchronizer.source_account}\n',
                 fg='blue',
             ),
         )
 
-    synchronizer.dump()
-    synchronizer.load_wb()
+    synchronizer.load()
 
     if not config.silent:
         click.echo(
@@ -454,17 +640,16 @@ def cmd_clone_products(config, source_product_id, source_account, destination_ac
         )
 
     synchronizer.create_product(name=name)
-    synchronizer.clean_wb()
 
     if not config.silent:
         click.echo(
             click.style(
-                'Injecting Product information',
+                'Copying Product information',
                 fg='blue',
             ),
         )
 
-    synchronizer.inject()
+    synchronizer.clone()
 
     if not config.silent:
         click.echo(
@@ -483,32 +668,34 @@ def cmd_clone_products(config, source_product_id, source_account, destination_ac
         )
 
 
-def param_task(client, config, input_file, product_id, param_type):
-    try:
-        result = params_sync(client, config, input_file, param_type)
-    except SheetNotFoundError as e:
-        if not config.silent:
-            click.echo(
-                click.style(
-                    str(e),
-                    fg='blue',
-                ),
-            )
-    return result
+def sheet_task(sync, client, config, input_file, session, *args):
+    def task():
+        try:
+            return sync(client, config, input_file, session, *args)
+        except SheetNotFoundError as e:
+            if not config.silent:
+                click.echo(
+                    click.style(
+                        str(e),
+                        fg='blue',
+                    ),
+                )
+    return task
 
 
-def media_sync(client, config, input_file):
+def media_sync(client, config, input_file, session):
     synchronizer = MediaSynchronizer(
         client,
         config.silent,
+        session,
     )
 
     synchronizer.open(input_file, 'Media')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Media", synchronizer)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
-
     return {
         "module": "Media",
         "created": created,
@@ -516,16 +703,21 @@ def media_sync(client, config, input_file):
         "deleted": deleted,
         "skipped": skipped,
         "errors": errors,
+        "uploaded_bytes": synchronizer.uploaded_bytes,
+        "elapsed": synchronizer.elapsed,
     }
 
 
-def actions_sync(client, config, input_file):
+def actions_sync(client, config, input_file, session):
     synchronizer = ActionsSynchronizer(
         client,
         config.silent,
+        session,
     )
 
     synchronizer.open(input_file, 'Actions')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Actions", synchronizer)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
@@ -539,17 +731,19 @@ def actions_sync(client, config, input_file):
     }
 
 
-def templates_sync(client, config, input_file):
+def templates_sync(client, config, input_file, session):
     synchronizer = TemplatesSynchronizer(
         client,
         config.silent,
+        session,
     )
 
     synchronizer.open(input_file, 'Templates')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Templates", synchronizer)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
     return {
         "module": "Templates",
         "created": created,
@@ -560,18 +754,19 @@ def templates_sync(client, config, input_file):
     }
 
 
-def params_sync(client, config, input_file, param_type):
+def params_sync(client, config, input_file, session, param_type):
     synchronizer = ParamsSynchronizer(
         client,
         config.silent,
+        session,
     )
 
     synchronizer.open(input_file, param_type)
+    if not synchronizer.has_changes():
+        return get_skipped_result(param_type, synchronizer)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
-
     return {
         "module": param_type,
         "created": created,
@@ -582,12 +777,15 @@ def params_sync(client, config, input_file, param_type):
     }
 
 
-def static_resources_sync(client, config, input_file):
+def static_resources_sync(client, config, input_file, session):
     synchronizer = StaticResourcesSynchronizer(
         client,
         config.silent,
+        session,
     )
     synchronizer.open(input_file, 'Embedding Static Resources')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Static Resources", synchronizer)
 
     skipped, created, deleted, errors = synchronizer.sync()
 
@@ -601,13 +799,16 @@ def static_resources_sync(client, config, input_file):
     }
 
 
-def capabilities_sync(client, config, input_file):
+def capabilities_sync(client, config, input_file, session):
 
     synchronizer = CapabilitiesSynchronizer(
         client,
         config.silent,
+        session,
     )
     synchronizer.open(input_file, 'Capabilities')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Capabilities", synchronizer)
 
     skipped, updated, errors = synchronizer.sync()
 
@@ -621,12 +822,15 @@ def capabilities_sync(client, config, input_file):
     }
 
 
-def config_values_sync(client, config, input_file):
+def config_values_sync(client, config, input_file, session):
     synchronizer = ConfigurationValuesSynchronizer(
         client,
         config.silent,
+        session,
     )
     synchronizer.open(input_file, 'Configuration')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Configuration", synchronizer)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
@@ -640,16 +844,18 @@ def config_values_sync(client, config, input_file):
     }
 
 
-def item_sync(client, config, input_file):
+def item_sync(client, config, input_file, session):
     synchronizer = ItemSynchronizer(
         client,
         config.silent,
+        session,
     )
     synchronizer.open(input_file, 'Items')
+    if not synchronizer.has_changes():
+        return get_skipped_result("Items", synchronizer)
 
     skipped, created, updated, deleted, errors = synchronizer.sync()
 
-    synchronizer.save(input_file)
     return {
         "module": "Items",
         "created": created,
@@ -660,6 +866,65 @@ def item_sync(client, config, input_file):
     }
 
 
+def get_batch_input_files(input_file):
+    if any(char in input_file for char in '*?['):
+        return sorted(glob.glob(input_file))
+    if not os.path.isdir(input_file) or get_files_format(input_file):
+        return None
+    if os.path.isfile(f'{input_file}/{os.path.basename(os.path.normpath(input_file))}.xlsx'):
+        return None
+    return sorted(
+        path for path in glob.glob(os.path.join(input_file, '**', '*.xlsx'), recursive=True)
+        if not os.path.basename(path).startswith('~$')
+    )
+
+
+def get_sync_input_file(input_file):
+    if get_files_format(input_file):
+        return input_file
+    if '.xlsx' not in input_file:
+        return f'{input_file}/{input_file}.xlsx'
+    return input_file
+
+
+def open_sheets(client, config, input_file, session):
+    for module, synchronizer_class, worksheet in SYNC_SHEETS:
+        synchronizer = synchronizer_class(client, config.silent, session)
+        try:
+            synchronizer.open(input_file, worksheet)
+        except SheetNotFoundError:
+            continue
+        if synchronizer.has_changes():
+            yield module, synchronizer
+
+
+def plan_sync(client, config, input_file, session):
+    return [
+        {'module': module, 'changes': synchronizer.plan()}
+        for module, synchronizer in open_sheets(client, config, input_file, session)
+    ]
+
+
+def validate_sync(config, input_file, session):
+    results = []
+    for module, synchronizer in open_sheets(None, config, input_file, session):
+        errors = synchronizer.validate()
+        if errors:
+            results.append({'module': module, 'errors': errors})
+    return results
+
+
+def get_skipped_result(module, synchronizer):
+    return {
+        "module": module,
+        "created": 0,
+        "updated": 0,
+        "deleted": 0,
+        "skipped": synchronizer.get_skipped_count(),
+        "errors": {},
+    }
+
+
 def print_results(  # noqa: CCR001
         silent,
         product_id,
@@ -670,26 +935,15 @@ def print_results(  # noqa: CCR001
 # Results of synchronizing {product_id}
 
 
-| Module | Processed | Created | Updated | Deleted | Skipped | Errors |
-|:--------|--------:| --------:|--------:|----------:|----------:|----------:|
+| Module | Processed | Created | Updated | Deleted | Skipped | Errors | Uploaded | KB/s |
+|:--------|--------:| --------:|--------:|----------:|----------:|----------:|----------:|----------:|
         '''
         errors = 0
         for result in results_tracker:
-            errors_count = len(result['errors'])
-            errors += errors_count
-            processed = result['skipped'] + result['created']
-            processed += result['updated'] + result['deleted']
-            processed += errors_count
-            row = '|{module}|{processed}|{created}|{updated}|{deleted}|{skipped}|{errors}|\n'
-            msg += row.format(
-                module=result['module'],
-                processed=processed,
-                created=result['created'],
-                updated=result['updated'],
-                deleted=result['deleted'],
-                skipped=result['skipped'],
-                errors=errors_count,
-            )
+            counts = get_result_counts(result)
+            errors += counts['errors']
+            row = '|{module}|{processed}|{created}|{updated}|{deleted}|{skipped}|{errors}|{uploaded}|{throughput}|\n'
+            msg += row.format(module=result['module'], **counts, **get_upload_columns(result))
         click.echo(
             f'\n{render(msg)}\n',
         )
@@ -700,19 +954,167 @@ def print_results(  # noqa: CCR001
 
             click.echo(click.style(msg, fg=fg))
 
-            print_errors = continue_or_quit()
-
-            if print_errors:
-                for result in results_tracker:
-                    if len(result['errors']) > 0:
-                        click.echo(
-                            click.style(f'\nModule {result["module"]}:\n', fg='magenta'),
-                        )
-                        for row_idx, messages in result["errors"].items():
-                            click.echo(f'  Errors at row #{row_idx}')
-                            for msg in messages:
-                                click.echo(f'    - {msg}')
-                            click.echo(' ')
+            if continue_or_quit():
+                print_errors(results_tracker)
+
+
+def get_result_counts(result):
+    counts = {
+        'created': result['created'],
+        'updated': result['updated'],
+        'deleted': result['deleted'],
+        'skipped': result['skipped'],
+        'errors': len(result['errors']),
+    }
+    counts['processed'] = sum(counts.values())
+    return counts
+
+
+def get_upload_columns(result):
+    uploaded = result.get('uploaded_bytes')
+    if not uploaded:
+        return {'uploaded': '-', 'throughput': '-'}
+    elapsed = result['elapsed']
+    return {
+        'uploaded': uploaded,
+        'throughput': f'{uploaded / elapsed / 1024:.2f}' if elapsed else '-',
+    }
+
+
+def print_sync_results(silent, results):  # noqa: CCR001
+    if silent:
+        return
+    msg = '''
+# Results of synchronizing products
+
+
+| Product | Module | Processed | Created | Updated | Deleted | Skipped | Errors | Uploaded | KB/s | Time (s) |
+|:--------|:--------|--------:|--------:|--------:|--------:|--------:|--------:|--------:|--------:|--------:|
+'''
+    row = (
+        '|{product}|{module}|{processed}|{created}|{updated}|{deleted}|{skipped}|{errors}'
+        '|{uploaded}|{throughput}|{elapsed}|\n'
+    )
+    fields = ('processed', 'created', 'updated', 'deleted', 'skipped', 'errors')
+    errors = 0
+    for result in results:
+        product = result['product_id'] or result['input_file']
+        totals = Counter()
+        for module_result in result['results']:
+            counts = get_result_counts(module_result)
+            totals.update(counts)
+            totals['uploaded'] += module_result.get('uploaded_bytes', 0)
+            msg += row.format(
+                product=product,
+                module=module_result['module'],
+                elapsed='-',
+                **counts,
+                **get_upload_columns(module_result),
+            )
+        errors += totals['errors']
+        if result['error']:
+            totals = dict.fromkeys(fields, '-')
+        msg += row.format(
+            product=product,
+            module='Failed' if result['error'] else 'Total',
+            elapsed=f'{result["elapsed"]:.2f}',
+            uploaded='-' if result['error'] else totals['uploaded'] or '-',
+            throughput='-',
+            **{name: totals[name] for name in fields},
+        )
+    click.echo(f'\n{render(msg)}\n')
+
+    failed = [result for result in results if result['error']]
+    for result in failed:
+        click.echo(
+            click.style(f'{result["input_file"]}: {result["error"]}', fg='magenta'),
+        )
+    if failed:
+        click.echo(
+            click.style(f'{len(failed)} of {len(results)} products could not be synchronized.', fg='magenta'),
+        )
+
+    if errors > 0:
+        click.echo(
+            click.style(f'\nSync operation had {errors} errors, do you want to see them?', fg='yellow'),
+        )
+        if continue_or_quit():
+            for result in results:
+                if any(module_result['errors'] for module_result in result['results']):
+                    click.echo(click.style(f'\nProduct {result["product_id"]}:', fg='blue'))
+                    print_errors(result['results'])
+
+
+def print_errors(results):
+    for result in results:
+        if len(result['errors']) > 0:
+            click.echo(
+                click.style(f'\nModule {result["module"]}:\n', fg='magenta'),
+            )
+            for row_idx, messages in result["errors"].items():
+                click.echo(f'  Errors at row #{row_idx}')
+                for msg in messages:
+                    click.echo(f'    - {msg}')
+                click.echo(' ')
+
+
+def print_validation_errors(results):
+    errors = sum(len(result['errors']) for result in results)
+    click.echo(
+        click.style(f'\nValidation found errors in {errors} rows:', fg='yellow'),
+    )
+    print_errors(results)
+
+
+def print_plan(product_id, plan):
+    msg = f'''
+# Plan for synchronizing {product_id}
+
+
+| Module | Row | Operation | Details |
+|:--------|--------:|:--------|:--------|
+'''
+    operations = Counter()
+    for module_plan in plan:
+        for row_idx, change in module_plan['changes'].items():
+            if isinstance(change, list):
+                operation = 'error'
+                details = ' '.join(change)
+            else:
+                operation = change.operation
+                details = change.current['id'] if change.current else '-'
+            operations[operation] += 1
+            msg += f'|{module_plan["module"]}|{row_idx}|{operation}|{details}|\n'
+    click.echo(f'\n{render(msg)}\n')
+    summary = ', '.join(f'{count} {operation}' for operation, count in sorted(operations.items()))
+    click.echo(
+        click.style(f'Planned operations: {summary or "none"}.', fg='blue'),
+    )
+
+
+def print_export_results(silent, results):
+    if silent:
+        return
+    msg = '''
+# Results of exporting products
+
+
+| Product | Status | Time (s) | Output |
+|:--------|:--------|--------:|:--------|
+'''
+    for result in results:
+        msg += '|{product_id}|{status}|{elapsed:.2f}|{output}|\n'.format(
+            product_id=result['product_id'],
+            status='Failed' if result['error'] else 'Exported',
+            elapsed=result['elapsed'],
+            output=result['error'] or result['output_file'],
+        )
+    click.echo(f'\n{render(msg)}\n')
+    failed = len([result for result in results if result['error']])
+    if failed:
+        click.echo(
+            click.style(f'{failed} of {len(results)} products could not be exported.', fg='magenta'),
+        )
 
 
 def get_group():
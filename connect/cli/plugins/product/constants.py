@@ -3,97 +3,6 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
-ITEMS_COLS_HEADERS = {
-    'A': 'ID',
-    'B': 'MPN',
-    'C': 'Action',
-    'D': 'Name',
-    'E': 'Description',
-    'F': 'Type',
-    'G': 'Precision',
-    'H': 'Unit',
-    'I': 'Billing Period',
-    'J': 'Commitment',
-    'K': 'Status',
-    'L': 'Created',
-    'M': 'Modified',
-}
-
-PARAMS_COLS_HEADERS = {
-    'A': 'Verbose ID',
-    'B': 'ID',
-    'C': 'Action',
-    'D': 'Title',
-    'E': 'Description',
-    'F': 'Phase',
-    'G': 'Scope',
-    'H': 'Type',
-    'I': 'Required',
-    'J': 'Unique',
-    'K': 'Hidden',
-    'L': 'JSON Properties',
-    'M': 'Created',
-    'N': 'Modified',
-}
-
-MEDIA_COLS_HEADERS = {
-    'A': 'Position',
-    'B': 'ID',
-    'C': 'Action',
-    'D': 'Type',
-    'E': 'Image File',
-    'F': 'Video URL Location',
-}
-
-CAPABILITIES_COLS_HEADERS = {
-    'A': 'Capability',
-    'B': 'Action',
-    'C': 'Value',
-}
-
-STATIC_LINK_HEADERS = {
-    'A': 'Type',
-    'B': 'Title',
-    'C': 'Action',
-    'D': 'Url',
-}
-
-TEMPLATES_HEADERS = {
-    'A': 'ID',
-    'B': 'Title',
-    'C': 'Action',
-    'D': 'Scope',
-    'E': 'Type',
-    'F': 'Content',
-    'G': 'Created',
-    'H': 'Modified',
-}
-
-CONFIGURATION_HEADERS = {
-    'A': 'ID',
-    'B': 'Parameter',
-    'C': 'Scope',
-    'D': 'Action',
-    'E': 'Item ID',
-    'F': 'Item Name',
-    'G': 'Marketplace ID',
-    'H': 'Marketplace Name',
-    'I': 'Value',
-}
-
-ACTIONS_HEADERS = {
-    'A': 'Verbose ID',
-    'B': 'ID',
-    'C': 'Action',
-    'D': 'Name',
-    'E': 'Title',
-    'F': 'Description',
-    'G': 'Scope',
-    'H': 'Created',
-    'I': 'Modified',
-}
-
-
 PARAM_TYPES = [
     'email',
     'address',
@@ -133,3 +42,44 @@ CAPABILITIES = (
     'Tier Accounts Sync',
     'Administrative Hold',
 )
+
+MEDIA_DOWNLOAD_WORKERS = 4
+MEDIA_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MEDIA_CACHE_MAX_SIZE = 512 * 1024 * 1024
+MEDIA_CHECKSUMS_FILE = 'checksums.json'
+
+GENERAL_INFORMATION_HEADERS = {
+    'A': 'Field',
+    'B': 'Value',
+}
+
+EXPORT_FORMATS = ('xlsx', 'ndjson', 'json', 'parquet')
+PARQUET_BATCH_SIZE = 1000
+PARQUET_JSON_METADATA = {b'encoding': b'json'}
+
+RESOURCE_FILES = (
+    ('general', 'General Information'),
+    ('capabilities', 'Capabilities'),
+    ('static_resources', 'Embedding Static Resources'),
+    ('media', 'Media'),
+    ('templates', 'Templates'),
+    ('items', 'Items'),
+    ('parameters', None),
+    ('actions', 'Actions'),
+    ('configurations', 'Configuration'),
+)
+
+PARAMS_SHEETS = {
+    'ordering': 'Ordering Parameters',
+    'fulfillment': 'Fulfillment Parameters',
+    'configuration': 'Configuration Parameters',
+}
+
+BATCH_EXPORT_WORKERS = 4
+BATCH_SYNC_WORKERS = 4
+
+CLONE_WORKERS = 8
+
+SYNC_SHEET_WORKERS = 4
+
+PIPELINE_BUFFER_SIZE = 500
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import requests
+from click import ClickException
+from requests.adapters import HTTPAdapter
+
+from connect.cli.plugins.product.cache import MediaCache
+from connect.cli.plugins.product.constants import (
+    MEDIA_CHECKSUMS_FILE,
+    MEDIA_DOWNLOAD_CHUNK_SIZE,
+    MEDIA_DOWNLOAD_WORKERS,
+)
+
+
+class MediaDownloader:
+    def __init__(
+        self,
+        media_path,
+        workers=MEDIA_DOWNLOAD_WORKERS,
+        chunk_size=MEDIA_DOWNLOAD_CHUNK_SIZE,
+        cache=None,
+    ):
+        self._media_path = media_path
+        self._chunk_size = chunk_size
+        self._cache = cache
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures = []
+        self._lock = Lock()
+        self._started_at = time.monotonic()
+        self._closed = False
+        self.count = 0
+        self.cached = 0
+        self.total_bytes = 0
+        self.elapsed = 0
+        self.checksums = {}
+
+    def download(self, location, name):
+        self._futures.append(
+            self._executor.submit(self._download, location, name),
+        )
+
+    def wait(self):
+        for future in self._futures:
+            future.result()
+        self.elapsed = time.monotonic() - self._started_at
+        with open(os.path.join(self._media_path, MEDIA_CHECKSUMS_FILE), 'w') as f:
+            json.dump(self.checksums, f, indent=4, sort_keys=True)
+        return self.count, self.total_bytes, self.elapsed
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        if self._cache:
+            self._cache.save()
+
+    def _download(self, location, name):
+        path = os.path.join(self._media_path, name)
+        entry = self._cache.get(location) if self._cache else None
+
+        if entry and not MediaCache.get_validation_headers(entry) and self._has_same_size(location, entry):
+            if self._copy_from_cache(entry, path):
+                return
+            entry = None
+        self._fetch(location, path, entry)
+
+    def _fetch(self, location, path, entry=None):
+        headers = MediaCache.get_validation_headers(entry) if entry else {}
+        with self._session.get(location, headers=headers, stream=True) as response:
+            if entry and response.status_code == 304:
+                if self._copy_from_cache(entry, path):
+                    return
+            elif response.status_code == 200:
+                self._write(location, response, path)
+                return
+            else:
+                raise ClickException(f"Error obtaining image from {location}")
+        # the cached object has been evicted by another export sharing the cache
+        self._fetch(location, path)
+
+    def _write(self, location, response, path):
+        partial_path = f'{path}.part'
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(partial_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self._chunk_size):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        except Exception:
+            os.remove(partial_path)
+            raise
+        if self._cache:
+            self._cache.put(
+                location,
+                partial_path,
+                digest.hexdigest(),
+                size,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+            )
+        os.replace(partial_path, path)
+        with self._lock:
+            self.count += 1
+            self.total_bytes += size
+            self.checksums[os.path.basename(path)] = digest.hexdigest()
+
+    def _has_same_size(self, location, entry):
+        response = self._session.head(location)
+        if response.status_code != 200:
+            return False
+        return response.headers.get('Content-Length') == str(entry['size'])
+
+    def _copy_from_cache(self, entry, path):
+        if not self._cache.copy(entry, path):
+            return False
+        with self._lock:
+            self.count += 1
+            self.cached += 1
+            self.checksums[os.path.basename(path)] = entry['digest']
+        return True
@@ -4,850 +4,613 @@
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
 import os
-import json
+import time
+from concurrent.futures import as_completed, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from urllib import parse
 
-import requests
+import click
 from click import ClickException
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.styles.colors import Color, WHITE
 from openpyxl.utils import quote_sheetname
-from openpyxl.worksheet.datavalidation import DataValidation
-from tqdm import trange
+from tqdm import tqdm, trange
 
 from connect.cli.core.constants import DEFAULT_BAR_FORMAT
+from connect.cli.core.datavalidation import RangeDataValidation
 from connect.cli.core.http import (
     format_http_status,
     handle_http_error,
 )
-from connect.cli.plugins.product.constants import PARAM_TYPES
-from connect.cli.plugins.product.utils import (
-    get_col_headers_by_ws_type,
-    get_col_limit_by_ws_type,
-    get_json_object_for_param,
+from connect.cli.plugins.product.cache import MediaCache
+from connect.cli.plugins.product.constants import BATCH_EXPORT_WORKERS
+from connect.cli.plugins.product.downloader import MediaDownloader
+from connect.cli.plugins.product.formats import (
+    FILE_WRITERS,
+    get_resource_file,
+    get_resource_headers,
+)
+from connect.cli.plugins.product.pipeline import ExportPipeline
+from connect.cli.plugins.product.snapshot import ExportSnapshot
+from connect.cli.plugins.product.schema import (
+    ACTIONS_SCHEMA,
+    calculate_configuration_id,
+    CAPABILITIES_SCHEMA,
+    CONFIGURATION_SCHEMA,
+    FINGERPRINT_HEADER,
+    get_capabilities_rows,
+    get_media_file_name,
+    ITEMS_SCHEMA,
+    MEDIA_SCHEMA,
+    PARAMS_SCHEMA,
+    SCHEMAS,
+    STATIC_LINKS_SCHEMA,
+    TEMPLATES_SCHEMA,
+)
+from connect.cli.plugins.product.writer import (
+    create_workbook,
+    HEADER_STYLE,
+    ICON_LABEL_STYLE,
+    LABEL_STYLE,
+    LABEL_TOP_STYLE,
+    LABEL_WRAP_STYLE,
+    SheetWriter,
+    TITLE_STYLE,
+    WRAP_STYLE,
 )
 from connect.client import ClientError, ConnectClient, R, RequestLogger
 
 
-def _setup_cover_sheet(ws, product, location, client, media_path):
-    ws.title = 'General Information'
-    ws.column_dimensions['A'].width = 50
-    ws.column_dimensions['B'].width = 180
-    ws.merge_cells('A1:B1')
-    cell = ws['A1']
-    cell.fill = PatternFill('solid', start_color=Color('1565C0'))
-    cell.font = Font(sz=24, color=WHITE)
-    cell.alignment = Alignment(horizontal='center', vertical='center')
-    cell.value = 'Product information'
-    for i in range(3, 13):
-        ws[f'A{i}'].font = Font(sz=12)
-        ws[f'B{i}'].font = Font(sz=12)
-    ws['A3'].value = 'Account ID'
-    ws['B3'].value = product['owner']['id']
-    ws['A4'].value = 'Account Name'
-    ws['B4'].value = product['owner']['name']
-    ws['A5'].value = 'Product ID'
-    ws['B5'].value = product['id']
-    ws['A6'].value = 'Product Name'
-    ws['B6'].value = product['name']
-    ws['A7'].value = 'Export datetime'
-    ws['B7'].value = datetime.now().isoformat()
-    ws['A8'].value = 'Product Category'
-    ws['B8'].value = product['category']['name']
-    ws['A9'].value = 'Product Icon file name'
-    ws['A9'].font = Font(sz=14)
-    ws['B9'].value = f'{product["id"]}.{product["icon"].split(".")[-1]}'
-    _dump_image(
+CATEGORIES_COL_IDX = 27
+
+
+def _setup_cover_sheet(writer, product, location, client, downloader):
+    writer.set_column_width('A', 50)
+    writer.set_column_width('B', 180)
+    writer.merge_cells('A1:B1')
+
+    icon_name = _get_icon_name(product)
+    downloader.download(
         f'{location}{product["icon"]}',
-        f'{product["id"]}.{product["icon"].split(".")[-1]}',
-        media_path,
-    )
-    ws['A10'].value = 'Product Short Description'
-    ws['A10'].alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws['B10'].value = product['short_description']
-    ws['B10'].alignment = Alignment(
-        wrap_text=True,
-    )
-    ws['A11'].value = 'Product Detailed Description'
-    ws['A11'].alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws['B11'].value = product['detailed_description']
-    ws['B11'].alignment = Alignment(
-        wrap_text=True,
-    )
-    ws['A12'].value = 'Embedding description'
-    ws['B12'].value = product['customer_ui_settings']['description']
-    ws['B12'].alignment = Alignment(
-        wrap_text=True,
-    )
-    ws['A13'].value = 'Embedding getting started'
-    ws['B13'].value = product['customer_ui_settings']['getting_started']
-    ws['B13'].alignment = Alignment(
-        wrap_text=True,
-    )
+        icon_name,
+    )
+    label = (LABEL_STYLE, LABEL_STYLE)
+    general_styles = (
+        label,
+        label,
+        label,
+        label,
+        label,
+        label,
+        (ICON_LABEL_STYLE, LABEL_STYLE),
+        (LABEL_TOP_STYLE, LABEL_WRAP_STYLE),
+        (LABEL_TOP_STYLE, LABEL_WRAP_STYLE),
+        (LABEL_STYLE, LABEL_WRAP_STYLE),
+        (None, WRAP_STYLE),
+    )
+    rows = [(('Product information',), (TITLE_STYLE,)), ((), ())]
+    rows.extend(zip(_get_general_rows(product, icon_name), general_styles))
 
     categories = client.categories.all()
     unassignable_cat = ['Cloud Services', 'All Categories']
     categories_list = [
         cat['name'] for cat in categories if cat['name'] not in unassignable_cat
     ]
-    ws['AA1'].value = 'Categories'
-    cat_row_idx = 2
-    for cat in categories_list:
-        ws[f'AA{cat_row_idx}'].value = cat
-        cat_row_idx += 1
-    categories_validation = DataValidation(
+    categories_validation = RangeDataValidation(
         type='list',
         formula1=f'{quote_sheetname("General Information")}!$AA$2:$AA${len(categories_list)}',
         allow_blank=False,
     )
-    ws.add_data_validation(categories_validation)
+    writer.add_data_validation(categories_validation)
     categories_validation.add('B8')
 
+    categories_column = ['Categories'] + categories_list
+    for row_idx in range(max(len(rows), len(categories_column))):
+        values, styles = rows[row_idx] if row_idx < len(rows) else ((), ())
+        values = list(values)
+        if row_idx < len(categories_column):
+            values.extend([None] * (CATEGORIES_COL_IDX - 1 - len(values)))
+            values.append(categories_column[row_idx])
+        writer.append(values, styles)
 
-def _dump_image(image_location, image_name, media_path):
-    image = requests.get(image_location)
-    if image.status_code == 200:
-        with open(os.path.join(media_path, image_name), 'wb') as f:
-            f.write(image.content)
-    else:
-        raise ClickException(f"Error obtaining image from {image_location}")
-
-
-def _setup_ws_header(ws, ws_type=None):  # noqa: CCR001
-    if not ws_type:
-        ws_type = 'items'
-
-    color = Color('d3d3d3')
-    fill = PatternFill('solid', color)
-    cels = ws['A1': '{cell}1'.format(
-        cell=get_col_limit_by_ws_type(ws_type),
-    )]
-    col_headers = get_col_headers_by_ws_type(ws_type)
-    for cel in cels[0]:
-        ws.column_dimensions[cel.column_letter].width = 25
-        ws.column_dimensions[cel.column_letter].auto_size = True
-        cel.fill = fill
-        cel.value = col_headers[cel.column_letter]
-        if ws_type == 'params' and cel.value == 'JSON Properties':
-            ws.column_dimensions[cel.column_letter].width = 100
-        elif ws_type == 'capabilities' and cel.value == 'Capability':
-            ws.column_dimensions[cel.column_letter].width = 50
-        elif ws_type == 'static_links' and cel.value == 'Url':
-            ws.column_dimensions[cel.column_letter].width = 100
-        elif ws_type == 'templates':
-            if cel.value == 'Content':
-                ws.column_dimensions[cel.column_letter].width = 100
-            if cel.value == 'Title':
-                ws.column_dimensions[cel.column_letter].width = 50
-
-
-def _calculate_commitment(item):
-    period = item.get('period')
-    if not period:
-        return '-'
-    commitment = item.get('commitment')
-    if not commitment:
-        return '-'
-    count = commitment['count']
-    if count == 1:
-        return '-'
-
-    multiplier = commitment['multiplier']
-
-    if multiplier == 'billing_period':
-        if period == 'monthly':
-            years = count // 12
-            return '{quantity} year{plural}'.format(
-                quantity=years,
-                plural='s' if years > 1 else '',
-            )
-        else:
-            return '{years} years'.format(
-                years=count,
-            )
 
-    # One-time
-    return '-'
+def _get_icon_name(product):
+    return f'{product["id"]}.{product["icon"].split(".")[-1]}'
 
 
-def _fill_param_row(ws, row_idx, param):
-    ws.cell(row_idx, 1, value=param['id']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
+def _get_general_rows(product, icon_name):
+    return (
+        ('Account ID', product['owner']['id']),
+        ('Account Name', product['owner']['name']),
+        ('Product ID', product['id']),
+        ('Product Name', product['name']),
+        ('Export datetime', datetime.now().isoformat()),
+        ('Product Category', product['category']['name']),
+        ('Product Icon file name', icon_name),
+        ('Product Short Description', product['short_description']),
+        ('Product Detailed Description', product['detailed_description']),
+        ('Embedding description', product['customer_ui_settings']['description']),
+        ('Embedding getting started', product['customer_ui_settings']['getting_started']),
     )
-    ws.cell(row_idx, 2, value=param['name']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 3, value='-').alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 4, value=param['title']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 5, value=param['description']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 6, value=param['phase']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 7, value=param['scope']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 8, value=param['type']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 9,
-        value=param['constraints']['required'] if param['constraints']['required'] else '-',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 10,
-        value=param['constraints']['unique'] if param['constraints']['unique'] else '-',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 11,
-        value=param['constraints']['hidden'] if param['constraints']['hidden'] else '-',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 12,
-        value=get_json_object_for_param(param),
-    ).alignment = Alignment(
-        wrap_text=True,
-    )
-    events = param.get('events', {})
-    ws.cell(
-        row_idx, 13, value=events.get('created', {}).get('at', '-'),
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 14, value=events.get('updated', {}).get('at', '-'),
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-
 
-def _fill_media_row(ws, row_idx, media, location, product, media_path):
-    ws.cell(row_idx, 1, value=media['position'])
-    ws.cell(row_idx, 2, value=media['id'])
-    ws.cell(row_idx, 3, value='-')
-    ws.cell(row_idx, 4, value=media['type'])
-    ws.cell(row_idx, 5, value=f'{media["id"]}.{media["thumbnail"].split(".")[-1]}')
-    _dump_image(
-        f'{location}{media["thumbnail"]}',
-        f'{media["id"]}.{media["thumbnail"].split(".")[-1]}',
-        media_path,
-    )
-    ws.cell(row_idx, 6, value='-' if media['type'] == 'image' else media['url'])
 
+def _setup_ws_header(writer, ws_type=None):
+    if not ws_type:
+        ws_type = 'items'
 
-def _fill_template_row(ws, row_idx, template):
-    ws.cell(row_idx, 1, value=template['id']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 2, value=template['title']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 3, value='-').alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 4, value=template['scope']).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 5, value=template['type'] if 'type' in template else 'fulfillment',
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(row_idx, 6, value=template['body']).alignment = Alignment(
-        wrap_text=True,
-    )
-    events = template.get('events', {})
-    ws.cell(
-        row_idx, 7, value=events.get('created', {}).get('at', '-'),
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
-    )
-    ws.cell(
-        row_idx, 8, value=events.get('updated', {}).get('at', '-'),
-    ).alignment = Alignment(
-        horizontal='left',
-        vertical='top',
+    schema = SCHEMAS[ws_type]
+    for column_letter, column in zip(schema.headers, schema.columns):
+        writer.set_column_width(column_letter, column.width, auto_size=True)
+    writer.hide_column(schema.fingerprint_col_letter)
+    writer.append(
+        list(schema.headers.values()) + [FINGERPRINT_HEADER],
+        (HEADER_STYLE,) * len(schema.headers),
     )
 
 
-def _fill_action_row(ws, row_idx, action):
-    ws.cell(row_idx, 1, value=action['id'])
-    ws.cell(row_idx, 2, value=action['action'])
-    ws.cell(row_idx, 3, value='-')
-    ws.cell(row_idx, 4, value=action['name'])
-    ws.cell(row_idx, 5, value=action['title'])
-    ws.cell(row_idx, 6, value=action['description'])
-    ws.cell(row_idx, 7, value=action['scope'])
-    events = action.get('events', {})
-    ws.cell(row_idx, 8, value=events.get('created', {}).get('at', '-'))
-    ws.cell(row_idx, 9, value=events.get('updated', {}).get('at', '-'))
-
-
-def _fill_configuration_row(ws, row_idx, configuration, conf_id):
-    ws.cell(row_idx, 1, value=conf_id)
-    ws.cell(row_idx, 2, value=configuration['parameter']['id'])
-    ws.cell(row_idx, 3, value=configuration['parameter']['scope'])
-    ws.cell(row_idx, 4, value='-')
-    ws.cell(row_idx, 5, value=configuration['item']['id'] if 'item' in configuration else '-')
-    ws.cell(row_idx, 6, value=configuration['item']['name'] if 'item' in configuration else '-')
-    ws.cell(row_idx, 7, value=configuration['marketplace']['id'] if 'marketplace' in configuration else '-')
-    ws.cell(row_idx, 8,
-            value=configuration['marketplace']['name'] if 'marketplace' in configuration else '-')
-    if 'structured_value' in configuration:
-        value = configuration['structured_value']
-        value = json.dumps(value, indent=4, sort_keys=True)
-        ws.cell(row_idx, 9, value=value).alignment = Alignment(wrap_text=True)
-    elif 'value' in configuration:
-        ws.cell(row_idx, 9, value=configuration['value'])
-    else:
-        ws.cell(row_idx, 9, value='-')
-
-
-def _fill_item_row(ws, row_idx, item):
-    ws.cell(row_idx, 1, value=item['id'])
-    ws.cell(row_idx, 2, value=item['mpn'])
-    ws.cell(row_idx, 3, value='-')
-    ws.cell(row_idx, 4, value=item['display_name'])
-    ws.cell(row_idx, 5, value=item['description'])
-    ws.cell(row_idx, 6, value=item['type'])
-    ws.cell(row_idx, 7, value=item['precision'])
-    ws.cell(row_idx, 8, value=item['unit']['unit'])
-    period = item.get('period', 'monthly')
-    if period.startswith('years_'):
-        period = f'{period.rsplit("_")[-1]} years'
-    ws.cell(row_idx, 9, value=period)
-    ws.cell(row_idx, 10, value=_calculate_commitment(item))
-    ws.cell(row_idx, 11, value=item['status'])
-    events = item.get('events', {})
-    ws.cell(row_idx, 12, value=events.get('created', {}).get('at', '-'))
-    ws.cell(row_idx, 13, value=events.get('updated', {}).get('at', '-'))
-
-
-def _calculate_configuration_id(configuration):
-    conf_id = configuration['parameter']['id']
-    if 'item' in configuration and 'id' in configuration['item']:
-        conf_id = f'{conf_id}#{configuration["item"]["id"]}'
-    else:
-        conf_id = f'{conf_id}#'
-    if 'marketplace' in configuration and 'id' in configuration['marketplace']:
-        conf_id = f'{conf_id}#{configuration["marketplace"]["id"]}'
-    else:
-        conf_id = f'{conf_id}#'
+def _append_row(writer, schema, row, styles=()):
+    return writer.append(tuple(row) + (schema.fingerprint(row),), styles)
 
-    return conf_id
 
+def _add_validations(validations, row_idx):
+    for column_letter, validation in validations.items():
+        validation.add(f'{column_letter}{row_idx}')
 
-def _dump_actions(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'actions')
 
-    row_idx = 2
+def _get_media_projector(media_location, downloader):
+    def project(media):
+        downloader.download(
+            f'{media_location}{media["thumbnail"]}',
+            get_media_file_name(media),
+        )
+        return MEDIA_SCHEMA.project(media)
 
-    actions = client.products[product_id].actions.all()
-    count = actions.count()
+    return project
 
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,create,update,delete"',
-        allow_blank=False,
-    )
 
-    scope_validation = DataValidation(
-        type='list',
-        formula1='"asset,tier1,tier2"',
-        allow_blank=False,
-    )
+def _dump_actions(writer, actions, silent, pipeline):
+    _setup_ws_header(writer, 'actions')
 
+    count = _count(actions)
+
+    validations = ACTIONS_SCHEMA.get_validations()
     if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(scope_validation)
+        for validation in validations.values():
+            writer.add_data_validation(validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
-    for action in actions:
-        progress.set_description(f'Processing action {action["id"]}')
+    def write(row):
+        progress.set_description(f'Processing action {row[0]}')
         progress.update(1)
-        _fill_action_row(ws, row_idx, action)
-        action_validation.add(f'C{row_idx}')
-        scope_validation.add(f'G{row_idx}')
-        row_idx += 1
+        row_idx = _append_row(writer, ACTIONS_SCHEMA, row)
+        _add_validations(validations, row_idx)
+
+    pipeline.run('actions', actions, ACTIONS_SCHEMA.project, write)
 
     progress.close()
     print()
 
 
-def _dump_configuration(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'configurations')
-
-    row_idx = 2
+def _dump_configuration(writer, configurations, silent, pipeline):
+    _setup_ws_header(writer, 'configurations')
 
-    configurations = client.products[product_id].configurations.all()
-    count = configurations.count()
-
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,update,delete"',
-        allow_blank=False,
-    )
+    count = _count(configurations)
 
     if count == 0:
         return
 
-    ws.add_data_validation(action_validation)
+    validations = CONFIGURATION_SCHEMA.get_validations()
+    for validation in validations.values():
+        writer.add_data_validation(validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
+    value_styles = (None,) * (CONFIGURATION_SCHEMA.col_idx['value'] - 1) + (WRAP_STYLE,)
+
+    def project(configuration):
+        return CONFIGURATION_SCHEMA.project(configuration), 'structured_value' in configuration
 
-    for configuration in configurations:
-        conf_id = _calculate_configuration_id(configuration)
-        progress.set_description(f'Processing parameter configuration {conf_id}')
+    def write(projection):
+        row, structured = projection
+        progress.set_description(f'Processing parameter configuration {row[0]}')
         progress.update(1)
-        _fill_configuration_row(ws, row_idx, configuration, conf_id)
-        action_validation.add(f'D{row_idx}')
-        row_idx += 1
+        row_idx = _append_row(writer, CONFIGURATION_SCHEMA, row, value_styles if structured else ())
+        _add_validations(validations, row_idx)
+
+    pipeline.run('configurations', configurations, project, write)
 
     progress.close()
     print()
 
 
-def _dump_parameters(ws, client, product_id, param_type, silent):
-    _setup_ws_header(ws, 'params')
-
-    rql = R().phase.eq(param_type)
-
-    row_idx = 2
+def _dump_parameters(writer, params, param_type, silent, pipeline):
+    _setup_ws_header(writer, 'params')
 
-    params = client.products[product_id].parameters.filter(rql)
-    count = params.count()
+    count = _count(params)
 
     if count == 0:
         # Product without params is strange, but may exist
         return
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,create,update,delete"',
-        allow_blank=False,
-    )
-    type_validation = DataValidation(
-        type='list',
-        formula1='"{params}"'.format(
-            params=','.join(PARAM_TYPES),
-        ),
-        allow_blank=False,
-    )
-    ordering_fulfillment_scope_validation = DataValidation(
+    validations = PARAMS_SCHEMA.get_validations()
+    ordering_fulfillment_scope_validation = RangeDataValidation(
         type='list',
         formula1='"asset,tier1,tier2"',
         allow_blank=False,
     )
-    configuration_scope_validation = DataValidation(
+    configuration_scope_validation = RangeDataValidation(
         type='list',
         formula1='"product,marketplace,item,item_marketplace"',
         allow_blank=False,
     )
-    bool_validation = DataValidation(
-        type='list',
-        formula1='"True,-"',
-        allow_blank=False,
-    )
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(type_validation)
-    ws.add_data_validation(ordering_fulfillment_scope_validation)
-    ws.add_data_validation(configuration_scope_validation)
-    ws.add_data_validation(bool_validation)
+    for validation in validations.values():
+        writer.add_data_validation(validation)
+    writer.add_data_validation(ordering_fulfillment_scope_validation)
+    writer.add_data_validation(configuration_scope_validation)
 
+    phase_idx = PARAMS_SCHEMA.col_idx['phase'] - 1
+    scope_letter = PARAMS_SCHEMA.col_letter['scope']
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
-    for param in params:
-        progress.set_description(f'Processing {param_type} parameter {param["id"]}')
+    def write(row):
+        progress.set_description(f'Processing {param_type} parameter {row[0]}')
         progress.update(1)
-        _fill_param_row(ws, row_idx, param)
-        action_validation.add(f'C{row_idx}')
-        if param['phase'] == 'configuration':
-            configuration_scope_validation.add(f'G{row_idx}')
+        row_idx = _append_row(writer, PARAMS_SCHEMA, row, PARAMS_SCHEMA.styles)
+        _add_validations(validations, row_idx)
+        if row[phase_idx] == 'configuration':
+            configuration_scope_validation.add(f'{scope_letter}{row_idx}')
         else:
-            ordering_fulfillment_scope_validation.add(f'G{row_idx}')
-        type_validation.add(f'H{row_idx}')
-        bool_validation.add(f'I{row_idx}')
-        bool_validation.add(f'J{row_idx}')
-        bool_validation.add(f'K{row_idx}')
-        row_idx += 1
+            ordering_fulfillment_scope_validation.add(f'{scope_letter}{row_idx}')
+
+    pipeline.run(f'{param_type} parameters', params, PARAMS_SCHEMA.project, write)
 
     progress.close()
     print()
 
 
-def _dump_media(ws, client, product_id, silent, media_location, media_path):
-    _setup_ws_header(ws, 'media')
-    row_idx = 2
+def _dump_media(writer, medias, silent, media_location, downloader, pipeline):
+    _setup_ws_header(writer, 'media')
 
-    medias = client.products[product_id].media.all()
-    count = medias.count()
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,create,update,delete"',
-        allow_blank=False,
-    )
-    type_validation = DataValidation(
-        type='list',
-        formula1='"image,video"',
-        allow_blank=False,
-    )
+    count = _count(medias)
+    validations = MEDIA_SCHEMA.get_validations()
     if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(type_validation)
+        for validation in validations.values():
+            writer.add_data_validation(validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
-    for media in medias:
-        progress.set_description(f'Processing media {media["id"]}')
+
+    def write(row):
+        progress.set_description(f'Processing media {row[1]}')
         progress.update(1)
-        _fill_media_row(ws, row_idx, media, media_location, product_id, media_path)
-        action_validation.add(f'C{row_idx}')
-        type_validation.add(f'D{row_idx}')
-        row_idx += 1
+        row_idx = _append_row(writer, MEDIA_SCHEMA, row)
+        _add_validations(validations, row_idx)
+
+    pipeline.run('media', medias, _get_media_projector(media_location, downloader), write)
 
     progress.close()
     print()
 
 
-def _dump_external_static_links(ws, product, silent):
-    _setup_ws_header(ws, 'static_links')
-    row_idx = 2
+def _get_static_links(product):
+    for link in product['customer_ui_settings']['download_links']:
+        yield 'Download', link
+    for link in product['customer_ui_settings']['documents']:
+        yield 'Documentation', link
+
+
+def _dump_external_static_links(writer, product, silent):
+    _setup_ws_header(writer, 'static_links')
     count = len(product['customer_ui_settings']['download_links'])
     count = count + len(product['customer_ui_settings']['documents'])
 
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,create,delete"',
-        allow_blank=False,
-    )
-    link_type = DataValidation(
-        type='list',
-        formula1='"Download,Documentation"',
-        allow_blank=False,
-    )
+    validations = STATIC_LINKS_SCHEMA.get_validations()
     if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(link_type)
+        for validation in validations.values():
+            writer.add_data_validation(validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
     progress.set_description("Processing static links")
 
-    for link in product['customer_ui_settings']['download_links']:
-        progress.update(1)
-        ws.cell(row_idx, 1, value='Download')
-        ws.cell(row_idx, 2, value=link['title'])
-        ws.cell(row_idx, 3, value='-')
-        ws.cell(row_idx, 4, value=link['url'])
-        action_validation.add(f'C{row_idx}')
-        link_type.add(f'A{row_idx}')
-        row_idx += 1
-
-    for link in product['customer_ui_settings']['documents']:
+    for link in _get_static_links(product):
         progress.update(1)
-        ws.cell(row_idx, 1, value='Documentation')
-        ws.cell(row_idx, 2, value=link['title'])
-        ws.cell(row_idx, 3, value='-')
-        ws.cell(row_idx, 4, value=link['url'])
-        action_validation.add(f'C{row_idx}')
-        link_type.add(f'A{row_idx}')
-        row_idx += 1
+        row_idx = _append_row(writer, STATIC_LINKS_SCHEMA, STATIC_LINKS_SCHEMA.project(link))
+        _add_validations(validations, row_idx)
 
     progress.close()
     print()
 
 
-def _dump_capabilities(ws, product, silent):  # noqa: CCR001
-    _setup_ws_header(ws, 'capabilities')
+def _dump_capabilities(writer, product, silent):
+    _setup_ws_header(writer, 'capabilities')
     progress = trange(0, 1, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
     progress.set_description("Processing product capabilities")
-    ppu = product['capabilities']['ppu']
-    capabilities = product['capabilities']
-    tiers = capabilities['tiers']
-    subscription = capabilities['subscription']
-    change = subscription['change']
 
-    action_validation = DataValidation(
+    action_validation = RangeDataValidation(
         type='list',
         formula1='"-,update"',
         allow_blank=False,
     )
-    ppu_validation = DataValidation(
+    ppu_validation = RangeDataValidation(
         type='list',
         formula1='"Disabled,QT,TR,PR"',
         allow_blank=False,
     )
-    disabled_enabled = DataValidation(
+    disabled_enabled = RangeDataValidation(
         type='list',
         formula1='"Disabled,Enabled"',
         allow_blank=False,
     )
-    tier_validation = DataValidation(
+    tier_validation = RangeDataValidation(
         type='list',
         formula1='"Disabled,1,2"',
         allow_blank=False,
     )
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(ppu_validation)
-    ws.add_data_validation(disabled_enabled)
-    ws.add_data_validation(tier_validation)
-
-    ws['A2'].value = 'Pay-as-you-go support and schema'
-    ws['B2'].value = '-'
-    ws['C2'].value = (ppu['schema'] if ppu else 'Disabled')
-    ppu_validation.add(ws['C2'])
-    ws['A3'].value = 'Pay-as-you-go dynamic items support'
-    ws['B3'].value = '-'
-    ws['C3'].value = (
-        'Enabled' if ppu and 'dynamic' in ppu and ppu['dynamic'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C3'])
-    ws['A4'].value = 'Pay-as-you-go future charges support'
-    ws['B4'].value = '-'
-    ws['C4'].value = (
-        'Enabled' if ppu and 'future' in ppu and ppu['future'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C4'])
-    ws['A5'].value = 'Consumption reporting for Reservation Items'
-    ws['B5'].value = '-'
-    ws['C5'].value = (
-        'Enabled' if capabilities['reservation']['consumption'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C5'])
+    writer.add_data_validation(action_validation)
+    writer.add_data_validation(ppu_validation)
+    writer.add_data_validation(disabled_enabled)
+    writer.add_data_validation(tier_validation)
+
+    for capability, value in get_capabilities_rows(product['capabilities']):
+        row_idx = _append_row(
+            writer,
+            CAPABILITIES_SCHEMA,
+            CAPABILITIES_SCHEMA.project((capability, value)),
+        )
+        if capability == 'Pay-as-you-go support and schema':
+            ppu_validation.add(f'C{row_idx}')
+        elif capability == 'Reseller Authorization Level':
+            tier_validation.add(f'C{row_idx}')
+        else:
+            disabled_enabled.add(f'C{row_idx}')
+        if row_idx < 11:
+            action_validation.add(f'B{row_idx}')
 
     progress.update(1)
     progress.close()
     print()
 
-    def _get_reporting_consumption(reservation_cap):
-        if 'consumption' in reservation_cap and reservation_cap['consumption']:
-            return 'Enabled'
-        return 'Disabled'
-
-    ws['C5'].value = _get_reporting_consumption(capabilities['reservation'])
-    disabled_enabled.add(ws['C5'])
-    ws['A6'].value = 'Dynamic Validation of the Draft Requests'
-    ws['B6'].value = '-'
-
-    def _get_dynamic_validation_draft(capabilities_cart):
-        if 'validation' in capabilities_cart and capabilities['cart']['validation']:
-            return 'Enabled'
-        return 'Disabled'
-    ws['C6'].value = _get_dynamic_validation_draft(capabilities['cart'])
-    disabled_enabled.add(ws['C6'])
-    ws['A7'].value = 'Dynamic Validation of the Inquiring Form'
-    ws['B7'].value = '-'
-
-    def _get_validation_inquiring(capabilities_inquiring):
-        if 'validation' in capabilities_inquiring and capabilities_inquiring['validation']:
-            return 'Enabled'
-        return 'Disabled'
-
-    ws['C7'].value = _get_validation_inquiring(capabilities['inquiring'])
-    disabled_enabled.add(ws['C7'])
-    ws['A8'].value = 'Reseller Authorization Level'
-    ws['B8'].value = '-'
-
-    def _get_reseller_authorization_level(tiers):
-        if tiers and 'configs' in tiers and tiers['configs']:
-            return tiers['configs']['level']
-        return 'Disabled'
-
-    ws['C8'].value = _get_reseller_authorization_level(tiers)
-    tier_validation.add(ws['C8'])
-    ws['A9'].value = 'Tier Accounts Sync'
-    ws['B9'].value = '-'
-    ws['C9'].value = (
-        'Enabled' if tiers and 'updates' in tiers and tiers['updates'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C9'])
-    ws['A10'].value = 'Administrative Hold'
-    ws['B10'].value = '-'
-
-    ws['A11'].value = 'Dynamic Validation of Tier Requests'
-    ws['B11'].value = '-'
-    ws['C11'].value = (
-        'Enabled' if capabilities['tiers']['validation'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C11'])
-    ws['A12'].value = 'Editable Ordering Parameters in Change Request'
-    ws['B12'].value = '-'
-    ws['C12'].value = (
-        'Enabled' if subscription['change']['editable_ordering_parameters'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C12'])
-    ws['A13'].value = 'Validation of Draft Change Request'
-    ws['B13'].value = '-'
-    ws['C13'].value = (
-        'Enabled' if 'validation' in change and change['validation'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C13'])
-    ws['A14'].value = 'Validation of inquiring form for Change Requests'
-    ws['B14'].value = '-'
-    ws['C14'].value = (
-        'Enabled' if 'inquiring_validation' in change and change['inquiring_validation'] else 'Disabled'
-    )
-    disabled_enabled.add(ws['C14'])
-
-    def _get_administrative_hold(capabilities):
-        if 'hold' in capabilities['subscription'] and capabilities['subscription']['hold']:
-            return 'Enabled'
-        return 'Disabled'
-
-    ws['C10'].value = _get_administrative_hold(capabilities)
-    disabled_enabled.add(ws['C10'])
-    idx = 2
-    while idx < 11:
-        action_validation.add(f'B{idx}')
-        idx = idx + 1
-    progress.update(1)
-
-
-def _dump_templates(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'templates')
 
-    row_idx = 2
+def _dump_templates(writer, templates, silent, pipeline):
+    _setup_ws_header(writer, 'templates')
 
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,create,update,delete"',
-        allow_blank=False,
-    )
-    scope_validation = DataValidation(
-        type='list',
-        formula1='"asset,tier1,tier2"',
-        allow_blank=False,
-    )
-    type_validation = DataValidation(
-        type='list',
-        formula1='"fulfillment,inquire"',
-        allow_blank=False,
-    )
+    validations = TEMPLATES_SCHEMA.get_validations()
 
-    templates = client.products[product_id].templates.all()
-    count = templates.count()
+    count = _count(templates)
 
     if count > 0:
-        ws.add_data_validation(action_validation)
-        ws.add_data_validation(scope_validation)
-        ws.add_data_validation(type_validation)
+        for validation in validations.values():
+            writer.add_data_validation(validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
-    for template in templates:
-        progress.set_description(f'Processing template {template["id"]}')
+    def write(row):
+        progress.set_description(f'Processing template {row[0]}')
         progress.update(1)
+        row_idx = _append_row(writer, TEMPLATES_SCHEMA, row, TEMPLATES_SCHEMA.styles)
+        _add_validations(validations, row_idx)
 
-        _fill_template_row(ws, row_idx, template)
-        action_validation.add(f'C{row_idx}')
-        scope_validation.add(f'D{row_idx}')
-        type_validation.add(f'E{row_idx}')
-        row_idx += 1
+    pipeline.run('templates', templates, TEMPLATES_SCHEMA.project, write)
 
     progress.close()
     print()
 
 
-def _dump_items(ws, client, product_id, silent):
-    _setup_ws_header(ws, 'items')
-
-    row_idx = 2
+def _dump_items(writer, items, product_id, silent, pipeline):
+    _setup_ws_header(writer, 'items')
 
-    items = client.products[product_id].items.all()
-    count = items.count()
+    count = _count(items)
 
     if count == 0:
         raise ClickException(f'The product {product_id} doesn\'t have items.')
 
-    action_validation = DataValidation(
-        type='list',
-        formula1='"-,create,update,delete"',
-        allow_blank=False,
-    )
-    type_validation = DataValidation(
-        type='list',
-        formula1='"reservation,ppu"',
-        allow_blank=False,
-    )
-    period_validation = DataValidation(
-        type='list',
-        formula1='"onetime,monthly,yearly,2 years,3 years,4 years,5 years"',
-        allow_blank=False,
-    )
-
-    precision_validation = DataValidation(
-        type='list',
-        formula1='"integer,decimal(1),decimal(2),decimal(4),decimal(8)"',
-        allow_blank=False,
-    )
-
-    commitment_validation = DataValidation(
-        type='list',
-        formula1='"-,1 year,2 years,3 years,4 years,5 years"',
-        allow_blank=False,
-    )
-
-    ws.add_data_validation(action_validation)
-    ws.add_data_validation(type_validation)
-    ws.add_data_validation(period_validation)
-    ws.add_data_validation(precision_validation)
-    ws.add_data_validation(commitment_validation)
+    validations = ITEMS_SCHEMA.get_validations()
+    for validation in validations.values():
+        writer.add_data_validation(validation)
 
     progress = trange(0, count, disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
 
-    for item in items:
-        progress.set_description(f'Processing item {item["id"]}')
+    def write(row):
+        progress.set_description(f'Processing item {row[0]}')
         progress.update(1)
-        _fill_item_row(ws, row_idx, item)
-        action_validation.add(f'C{row_idx}')
-        type_validation.add(f'F{row_idx}')
-        precision_validation.add(f'G{row_idx}')
-        period_validation.add(f'I{row_idx}')
-        commitment_validation.add(f'J{row_idx}')
-        row_idx += 1
+        row_idx = _append_row(writer, ITEMS_SCHEMA, row)
+        _add_validations(validations, row_idx)
+
+    pipeline.run('items', items, ITEMS_SCHEMA.project, write)
 
     progress.close()
     print()
 
 
-def dump_product(api_url, api_key, product_id, output_file, silent, verbose=False, output_path=None):  # noqa: CCR001
+def _dump_resource_file(output_path, output_format, resource, source, projector, silent, pipeline):
+    writer = FILE_WRITERS[output_format](
+        get_resource_file(output_path, resource, output_format),
+        get_resource_headers(resource),
+    )
+    progress = tqdm(desc=f'Processing {resource.replace("_", " ")}', disable=silent, leave=True)
+
+    def write(row):
+        writer.write(row)
+        progress.update(1)
+
+    try:
+        pipeline.run(resource, source, projector, write)
+    finally:
+        writer.close()
+        progress.close()
+
+
+def _get_row(row):
+    return row
+
+
+def _dump_product_files(
+    output_path,
+    output_format,
+    client,
+    product,
+    silent,
+    jobs,
+    media_location,
+    downloader,
+    snapshot,
+    pipeline,
+):
+    collections = _load_collections(client, product['id'], jobs, snapshot)
+
+    icon_name = _get_icon_name(product)
+    downloader.download(f'{media_location}{product["icon"]}', icon_name)
+    resources = (
+        ('general', _get_general_rows(product, icon_name), _get_row),
+        ('capabilities', get_capabilities_rows(product['capabilities']), CAPABILITIES_SCHEMA.project),
+        ('static_resources', _get_static_links(product), STATIC_LINKS_SCHEMA.project),
+        ('media', collections['media'], _get_media_projector(media_location, downloader)),
+        ('templates', collections['templates'], TEMPLATES_SCHEMA.project),
+        ('items', collections['items'], ITEMS_SCHEMA.project),
+        (
+            'parameters',
+            chain(collections['ordering'], collections['fulfillment'], collections['configuration']),
+            PARAMS_SCHEMA.project,
+        ),
+        ('actions', collections['actions'], ACTIONS_SCHEMA.project),
+        ('configurations', collections['configurations'], CONFIGURATION_SCHEMA.project),
+    )
+    for resource, source, projector in resources:
+        _dump_resource_file(output_path, output_format, resource, source, projector, silent, pipeline)
+
+    return downloader.wait()
+
+
+def _get_collections(client, product_id):
+    product = client.products[product_id]
+    return {
+        'media': product.media.all(),
+        'templates': product.templates.all(),
+        'items': product.items.all(),
+        'ordering': product.parameters.filter(R().phase.eq('ordering')),
+        'fulfillment': product.parameters.filter(R().phase.eq('fulfillment')),
+        'configuration': product.parameters.filter(R().phase.eq('configuration')),
+        'actions': product.actions.all(),
+        'configurations': product.configurations.all(),
+    }
+
+
+def _fetch_collections(collections, jobs, snapshot=None):
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            name: executor.submit(_fetch_collection, name, resources, snapshot)
+            for name, resources in collections.items()
+        }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def _fetch_collection(name, resources, snapshot):
+    if not snapshot:
+        return list(resources)
+    if name == 'configurations':
+        return snapshot.fetch(
+            name,
+            resources,
+            key=calculate_configuration_id,
+            key_fields=('parameter.id', 'item.id', 'marketplace.id'),
+        )
+    return snapshot.fetch(name, resources)
+
+
+def _load_collections(client, product_id, jobs, snapshot):
+    collections = _get_collections(client, product_id)
+    if jobs > 1 or snapshot:
+        collections = _fetch_collections(collections, jobs, snapshot)
+    return collections
+
+
+def _count(resources):
+    if isinstance(resources, list):
+        return len(resources)
+    return resources.count()
+
+
+def _dump_product_workbook(
+    output_file,
+    client,
+    product,
+    silent,
+    jobs,
+    media_location,
+    downloader,
+    snapshot,
+    pipeline,
+):
+    product_id = product['id']
+    wb = create_workbook()
+    _setup_cover_sheet(
+        SheetWriter(wb, 'General Information'),
+        product,
+        media_location,
+        client,
+        downloader,
+    )
+
+    _dump_capabilities(SheetWriter(wb, 'Capabilities'), product, silent)
+    _dump_external_static_links(SheetWriter(wb, 'Embedding Static Resources'), product, silent)
+
+    collections = _load_collections(client, product_id, jobs, snapshot)
+
+    _dump_media(
+        SheetWriter(wb, 'Media'),
+        collections['media'],
+        silent,
+        media_location,
+        downloader,
+        pipeline,
+    )
+    _dump_templates(SheetWriter(wb, 'Templates'), collections['templates'], silent, pipeline)
+    _dump_items(SheetWriter(wb, 'Items'), collections['items'], product_id, silent, pipeline)
+    _dump_parameters(
+        SheetWriter(wb, 'Ordering Parameters'),
+        collections['ordering'],
+        'ordering',
+        silent,
+        pipeline,
+    )
+    _dump_parameters(
+        SheetWriter(wb, 'Fulfillment Parameters'),
+        collections['fulfillment'],
+        'fulfillment',
+        silent,
+        pipeline,
+    )
+    _dump_parameters(
+        SheetWriter(wb, 'Configuration Parameters'),
+        collections['configuration'],
+        'configuration',
+        silent,
+        pipeline,
+    )
+    _dump_actions(SheetWriter(wb, 'Actions'), collections['actions'], silent, pipeline)
+    _dump_configuration(
+        SheetWriter(wb, 'Configuration'),
+        collections['configurations'],
+        silent,
+        pipeline,
+    )
+
+    count, total_bytes, elapsed = downloader.wait()
+    wb.save(output_file)
+    return count, total_bytes, elapsed
+
+
+def dump_product(  # noqa: CCR001
+    api_url,
+    api_key,
+    product_id,
+    output_file,
+    silent,
+    verbose=False,
+    output_path=None,
+    jobs=1,
+    media_cache=None,
+    output_format='xlsx',
+    incremental=False,
+):
     if not output_path:
         output_path = os.path.join(os.getcwd(), product_id)
     else:
@@ -859,7 +622,9 @@ def dump_product(api_url, api_key, product_id, output_file, silent, verbose=Fals
 
     media_path = os.path.join(output_path, 'media')
 
-    if not output_file:
+    if output_format != 'xlsx':
+        output_file = output_path
+    elif not output_file:
         output_file = os.path.join(output_path, f'{product_id}.xlsx')
     else:
         output_file = os.path.join(output_path, output_file)
@@ -873,6 +638,15 @@ def dump_product(api_url, api_key, product_id, output_file, silent, verbose=Fals
 
     if not os.path.exists(media_path):
         os.mkdir(media_path)
+
+    downloader = MediaDownloader(
+        media_path,
+        cache=MediaCache(media_cache) if media_cache else None,
+    )
+    pipeline = ExportPipeline()
+    snapshot = None
+    if incremental:
+        snapshot = ExportSnapshot(os.path.join(output_path, '.export_snapshot.json'), product_id)
     try:
         client = ConnectClient(
             api_key=api_key,
@@ -882,54 +656,35 @@ def dump_product(api_url, api_key, product_id, output_file, silent, verbose=Fals
             logger=RequestLogger() if verbose else None,
         )
         product = client.products[product_id].get()
-        wb = Workbook()
         connect_api_location = parse.urlparse(api_url)
         media_location = f'{connect_api_location.scheme}://{connect_api_location.netloc}'
-        _setup_cover_sheet(
-            wb.active,
-            product,
-            media_location,
-            client,
-            media_path,
-        )
-
-        _dump_capabilities(wb.create_sheet('Capabilities'), product, silent)
-        _dump_external_static_links(wb.create_sheet('Embedding Static Resources'), product, silent)
-        _dump_media(
-            wb.create_sheet('Media'),
-            client,
-            product_id,
-            silent,
-            media_location,
-            media_path,
-        )
-        _dump_templates(wb.create_sheet('Templates'), client, product_id, silent)
-        _dump_items(wb.create_sheet('Items'), client, product_id, silent)
-        _dump_parameters(
-            wb.create_sheet('Ordering Parameters'),
-            client,
-            product_id,
-            'ordering',
-            silent,
-        )
-        _dump_parameters(
-            wb.create_sheet('Fulfillment Parameters'),
-            client,
-            product_id,
-            'fulfillment',
-            silent,
-        )
-        _dump_parameters(
-            wb.create_sheet('Configuration Parameters'),
-            client,
-            product_id,
-            'configuration',
-            silent,
-        )
-        _dump_actions(wb.create_sheet('Actions'), client, product_id, silent)
-        _dump_configuration(wb.create_sheet('Configuration'), client, product_id, silent)
-
-        wb.save(output_file)
+        if output_format != 'xlsx':
+            count, total_bytes, elapsed = _dump_product_files(
+                output_path,
+                output_format,
+                client,
+                product,
+                silent,
+                jobs,
+                media_location,
+                downloader,
+                snapshot,
+                pipeline,
+            )
+        else:
+            count, total_bytes, elapsed = _dump_product_workbook(
+                output_file,
+                client,
+                product,
+                silent,
+                jobs,
+                media_location,
+                downloader,
+                snapshot,
+                pipeline,
+            )
+        if snapshot:
+            snapshot.save()
 
     except ClientError as error:
         status = format_http_status(error.status_code)
@@ -937,5 +692,83 @@ def dump_product(api_url, api_key, product_id, output_file, silent, verbose=Fals
             raise ClickException(f'{status}: Product {product_id} not found.')
 
         handle_http_error(error)
+    finally:
+        downloader.close()
+
+    if not silent:
+        click.echo(
+            f'Downloaded {count} media files ({total_bytes} bytes, {downloader.cached} '
+            f'from cache) in {elapsed:.2f} seconds.',
+        )
+        if snapshot:
+            click.echo(
+                f'Fetched {snapshot.fetched} new or updated objects and detected '
+                f'{snapshot.deleted} deleted since the previous export.',
+            )
+        if verbose:
+            for name, timings in pipeline.timings.items():
+                click.echo(
+                    f'{name}: ' + ', '.join(
+                        f'{stage} {timings[stage]:.2f}s' for stage in ExportPipeline.STAGES
+                    ),
+                )
 
     return output_file
+
+
+def _dump_product_task(kwargs):
+    started_at = time.monotonic()
+    try:
+        output_file = dump_product(silent=True, **kwargs)
+        error = None
+    except Exception as e:
+        output_file = None
+        error = str(e)
+    return {
+        'product_id': kwargs['product_id'],
+        'output_file': output_file,
+        'elapsed': time.monotonic() - started_at,
+        'error': error,
+    }
+
+
+def dump_products(
+    api_url,
+    api_key,
+    product_ids,
+    silent,
+    verbose=False,
+    output_path=None,
+    jobs=1,
+    media_cache=None,
+    output_format='xlsx',
+    incremental=False,
+    workers=BATCH_EXPORT_WORKERS,
+):
+    tasks = [
+        {
+            'api_url': api_url,
+            'api_key': api_key,
+            'product_id': product_id,
+            'output_file': None,
+            'verbose': verbose,
+            'output_path': output_path,
+            'jobs': jobs,
+            'media_cache': media_cache,
+            'output_format': output_format,
+            'incremental': incremental,
+        }
+        for product_id in product_ids
+    ]
+    results = {}
+    progress = trange(0, len(tasks), disable=silent, leave=True, bar_format=DEFAULT_BAR_FORMAT)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_dump_product_task, task) for task in tasks]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result['product_id']] = result
+            progress.set_description(f'Exported product {result["product_id"]}')
+            progress.update(1)
+    progress.close()
+
+    return [results[product_id] for product_id in product_ids]
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+import os
+
+from click import ClickException
+from openpyxl import Workbook
+
+from connect.cli.plugins.product.constants import (
+    GENERAL_INFORMATION_HEADERS,
+    PARAMS_SHEETS,
+    PARQUET_BATCH_SIZE,
+    PARQUET_JSON_METADATA,
+    RESOURCE_FILES,
+)
+from connect.cli.plugins.product.utils import (
+    get_col_headers_by_ws_type,
+    get_ws_type_by_worksheet_name,
+)
+
+
+def get_resource_headers(resource):
+    if resource == 'general':
+        return list(GENERAL_INFORMATION_HEADERS.values())
+    if resource == 'parameters':
+        return list(get_col_headers_by_ws_type('params').values())
+    sheet = dict(RESOURCE_FILES)[resource]
+    return list(get_col_headers_by_ws_type(get_ws_type_by_worksheet_name(sheet)).values())
+
+
+def get_resource_file(path, resource, output_format):
+    return os.path.join(path, f'{resource}.{output_format}')
+
+
+def get_files_format(path):
+    if not os.path.isdir(path):
+        return None
+    for output_format in FILE_READERS:
+        if os.path.isfile(get_resource_file(path, 'general', output_format)):
+            return output_format
+
+
+class NDJSONWriter:
+    def __init__(self, path, headers):
+        self._headers = headers
+        self._file = open(path, 'w')
+        self.count = 0
+
+    def write(self, row):
+        self._file.write(json.dumps(dict(zip(self._headers, row)), default=str))
+        self._file.write('\n')
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+
+class JSONWriter(NDJSONWriter):
+    def __init__(self, path, headers):
+        super().__init__(path, headers)
+        self._file.write('[')
+
+    def write(self, row):
+        self._file.write(',\n' if self.count else '\n')
+        self._file.write(json.dumps(dict(zip(self._headers, row)), default=str))
+        self.count += 1
+
+    def close(self):
+        self._file.write('\n]\n')
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Keep the native type of every column. Values are converted to arrow
+    arrays batch by batch and the column types are settled on close: a column
+    whose batches disagree (e.g. 'Disabled' and 1) is stored as json text and
+    flagged in the field metadata so the reader can restore the values.
+    """
+    def __init__(self, path, headers):
+        self._pa, self._pq = _import_pyarrow()
+        self._path = path
+        self._headers = headers
+        self._chunks = [[] for _ in headers]
+        self._batch = []
+        self.count = 0
+
+    def write(self, row):
+        self._batch.append(row)
+        self.count += 1
+        if len(self._batch) == PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        pa = self._pa
+        fields = []
+        columns = []
+        for header, chunks in zip(self._headers, self._chunks):
+            types = {chunk.type for chunk, _ in chunks if chunk.type != pa.null()}
+            if len(types) > 1 or any(encoded for _, encoded in chunks):
+                field = pa.field(header, pa.string(), metadata=PARQUET_JSON_METADATA)
+                chunks = [chunk if encoded else _to_json_array(pa, chunk.to_pylist()) for chunk, encoded in chunks]
+            else:
+                field = pa.field(header, types.pop() if types else pa.string())
+                chunks = [chunk.cast(field.type) for chunk, _ in chunks]
+            fields.append(field)
+            columns.append(pa.chunked_array(chunks, type=field.type))
+        self._pq.write_table(
+            pa.Table.from_arrays(columns, schema=pa.schema(fields)),
+            self._path,
+            row_group_size=PARQUET_BATCH_SIZE,
+        )
+
+    def _flush(self):
+        if not self._batch:
+            return
+        for idx in range(len(self._headers)):
+            values = [row[idx] for row in self._batch]
+            try:
+                self._chunks[idx].append((self._pa.array(values), False))
+            except (self._pa.ArrowInvalid, self._pa.ArrowTypeError):
+                self._chunks[idx].append((_to_json_array(self._pa, values), True))
+        self._batch = []
+
+
+def _to_json_array(pa, values):
+    return pa.array(
+        [None if value is None else json.dumps(value, default=str) for value in values],
+        pa.string(),
+    )
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ClickException('The parquet format requires the pyarrow package to be installed.')
+    return pyarrow, pyarrow.parquet
+
+
+def _read_ndjson(path):
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_json(path):
+    with open(path, 'r') as f:
+        yield from json.load(f)
+
+
+def _read_parquet(path):
+    _, pq = _import_pyarrow()
+    parquet_file = pq.ParquetFile(path)
+    encoded = [
+        field.name for field in parquet_file.schema_arrow
+        if field.metadata == PARQUET_JSON_METADATA
+    ]
+    for batch in parquet_file.iter_batches(batch_size=PARQUET_BATCH_SIZE):
+        for record in batch.to_pylist():
+            for name in encoded:
+                if record[name] is not None:
+                    record[name] = json.loads(record[name])
+            yield record
+
+
+FILE_WRITERS = {
+    'ndjson': NDJSONWriter,
+    'json': JSONWriter,
+    'parquet': ParquetWriter,
+}
+
+FILE_READERS = {
+    'ndjson': _read_ndjson,
+    'json': _read_json,
+    'parquet': _read_parquet,
+}
+
+
+def _append_records(ws, headers, records):
+    for record in records:
+        ws.append([record.get(header) for header in headers])
+
+
+def _load_parameters(wb, headers, resource_file, records):
+    sheets = {phase: wb.create_sheet(name) for phase, name in PARAMS_SHEETS.items()}
+    for ws in sheets.values():
+        ws.append(headers)
+    for record_idx, record in enumerate(records, start=1):
+        phase = record.get('Phase')
+        if phase not in sheets:
+            raise ClickException(
+                f'Invalid file {resource_file}: record {record_idx} has phase `{phase}`, '
+                f'valid phases are {", ".join(sheets)}.',
+            )
+        _append_records(sheets[phase], headers, [record])
+
+
+def load_product_files(path):
+    """
+    Build in memory the workbook product sync expects from a directory
+    exported with the ndjson, json or parquet format.
+    """
+    files_format = get_files_format(path)
+    read = FILE_READERS[files_format]
+    wb = Workbook()
+    general = wb.active
+    general.title = 'General Information'
+    general.append(['Product information'])
+    general.append([])
+    for record in read(get_resource_file(path, 'general', files_format)):
+        general.append([record['Field'], record['Value']])
+
+    for resource, sheet in RESOURCE_FILES[1:]:
+        resource_file = get_resource_file(path, resource, files_format)
+        if not os.path.isfile(resource_file):
+            continue
+        headers = get_resource_headers(resource)
+        if resource == 'parameters':
+            _load_parameters(wb, headers, resource_file, read(resource_file))
+            continue
+        ws = wb.create_sheet(sheet)
+        ws.append(headers)
+        _append_records(ws, headers, read(resource_file))
+
+    return wb
+
+
+def save_product_files(wb, path, worksheets):
+    """
+    Write the given worksheets of a workbook built by load_product_files
+    back to the resource files they were read from.
+    """
+    files_format = get_files_format(path)
+    for resource, sheet in RESOURCE_FILES[1:]:
+        sheets = list(PARAMS_SHEETS.values()) if resource == 'parameters' else [sheet]
+        if not any(name in worksheets for name in sheets):
+            continue
+        headers = get_resource_headers(resource)
+        resource_file = get_resource_file(path, resource, files_format)
+        writer = FILE_WRITERS[files_format](f'{resource_file}.tmp', headers)
+        for name in sheets:
+            for row in wb[name].iter_rows(min_row=2, max_col=len(headers), values_only=True):
+                writer.write(row)
+        writer.close()
+        os.replace(f'{resource_file}.tmp', resource_file)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import time
+from collections import defaultdict
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+
+from connect.cli.plugins.product.constants import PIPELINE_BUFFER_SIZE
+
+
+_DONE = object()
+
+
+class _SourceError:
+    def __init__(self, error):
+        self.error = error
+
+
+class ExportPipeline:
+    """
+    Moves the objects of a collection through three stages: the source
+    (the paginated API collection), the projector (object to row) and the
+    sink (row to sheet or file). The source is consumed by a producer thread
+    through a bounded queue so memory does not grow with the collection size.
+    """
+    STAGES = ('source', 'projector', 'sink')
+
+    def __init__(self, buffer_size=PIPELINE_BUFFER_SIZE):
+        self._buffer_size = buffer_size
+        self.timings = defaultdict(lambda: dict.fromkeys(self.STAGES, 0.0))
+
+    def run(self, name, source, projector, sink):
+        timings = self.timings[name]
+        queue = Queue(maxsize=self._buffer_size)
+        stop = Event()
+        producer = Thread(target=self._produce, args=(source, queue, stop, timings), daemon=True)
+        producer.start()
+        try:
+            while True:
+                obj = queue.get()
+                if obj is _DONE:
+                    break
+                if isinstance(obj, _SourceError):
+                    raise obj.error
+                started_at = time.perf_counter()
+                row = projector(obj)
+                projected_at = time.perf_counter()
+                sink(row)
+                timings['projector'] += projected_at - started_at
+                timings['sink'] += time.perf_counter() - projected_at
+        finally:
+            stop.set()
+            self._drain(queue)
+            producer.join()
+
+    def _produce(self, source, queue, stop, timings):
+        iterator = iter(source)
+        while not stop.is_set():
+            started_at = time.perf_counter()
+            try:
+                obj = next(iterator)
+            except StopIteration:
+                obj = _DONE
+            except Exception as e:
+                obj = _SourceError(e)
+            timings['source'] += time.perf_counter() - started_at
+            if not self._put(queue, obj, stop) or obj is _DONE or isinstance(obj, _SourceError):
+                return
+
+    @staticmethod
+    def _put(queue, obj, stop):
+        while not stop.is_set():
+            try:
+                queue.put(obj, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    @staticmethod
+    def _drain(queue):
+        while True:
+            try:
+                queue.get_nowait()
+            except Empty:
+                return
@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+from collections import namedtuple
+from copy import deepcopy
+from hashlib import sha1
+from operator import itemgetter
+
+from openpyxl.utils import get_column_letter
+
+from connect.cli.core.datavalidation import RangeDataValidation
+from connect.cli.plugins.product.constants import (
+    BILLING_PERIOD,
+    COMMITMENT,
+    PARAM_TYPES,
+    PRECISIONS,
+)
+from connect.cli.plugins.product.writer import TOP_LEFT_STYLE, WRAP_STYLE
+
+
+FINGERPRINT_HEADER = 'Fingerprint'
+
+Column = namedtuple(
+    'Column',
+    ('header', 'project', 'width', 'style', 'choices'),
+    defaults=(None, 25, None, None),
+)
+
+
+class SheetSchema:
+    def __init__(self, ws_type, columns):
+        self.ws_type = ws_type
+        self.columns = columns
+        self.headers = {
+            get_column_letter(col_idx): column.header
+            for col_idx, column in enumerate(columns, start=1)
+        }
+        self.col_limit = get_column_letter(len(columns))
+        self.fields = tuple(column.header.replace(' ', '_').lower() for column in columns)
+        self.col_idx = {field: col_idx for col_idx, field in enumerate(self.fields, start=1)}
+        self.col_letter = {field: get_column_letter(col_idx) for field, col_idx in self.col_idx.items()}
+        self.row_type = namedtuple('RowData', self.fields)
+        self.fingerprint_col_idx = len(columns) + 1
+        self.fingerprint_col_letter = get_column_letter(self.fingerprint_col_idx)
+        self.styles = tuple(column.style for column in columns)
+        self._projections = tuple(column.project for column in columns)
+        self._choices = tuple(
+            (get_column_letter(col_idx), column.choices)
+            for col_idx, column in enumerate(columns, start=1)
+            if column.choices
+        )
+
+    def project(self, obj):
+        return tuple(project(obj) for project in self._projections)
+
+    def fingerprint(self, row):
+        values = [
+            None if value == '' else value
+            for field, value in zip(self.fields, row)
+            if field != 'action'
+        ]
+        return sha1(json.dumps(values, default=str).encode('utf-8')).hexdigest()
+
+    def get_validations(self):
+        return {
+            column_letter: RangeDataValidation(
+                type='list',
+                formula1='"{choices}"'.format(choices=','.join(choices)),
+                allow_blank=False,
+            )
+            for column_letter, choices in self._choices
+        }
+
+
+def _value(value):
+    return lambda obj: value
+
+
+def _created(obj):
+    return obj.get('events', {}).get('created', {}).get('at', '-')
+
+
+def _updated(obj):
+    return obj.get('events', {}).get('updated', {}).get('at', '-')
+
+
+def _constraint(name):
+    return lambda param: param['constraints'][name] if param['constraints'][name] else '-'
+
+
+def _get_period(item):
+    period = item.get('period', 'monthly')
+    if period.startswith('years_'):
+        period = f'{period.rsplit("_")[-1]} years'
+    return period
+
+
+def calculate_commitment(item):
+    period = item.get('period')
+    if not period:
+        return '-'
+    commitment = item.get('commitment')
+    if not commitment:
+        return '-'
+    count = commitment['count']
+    if count == 1:
+        return '-'
+
+    multiplier = commitment['multiplier']
+
+    if multiplier == 'billing_period':
+        if period == 'monthly':
+            years = count // 12
+            return '{quantity} year{plural}'.format(
+                quantity=years,
+                plural='s' if years > 1 else '',
+            )
+        else:
+            return '{years} years'.format(
+                years=count,
+            )
+
+    # One-time
+    return '-'
+
+
+def calculate_configuration_id(configuration):
+    conf_id = configuration['parameter']['id']
+    if 'item' in configuration and 'id' in configuration['item']:
+        conf_id = f'{conf_id}#{configuration["item"]["id"]}'
+    else:
+        conf_id = f'{conf_id}#'
+    if 'marketplace' in configuration and 'id' in configuration['marketplace']:
+        conf_id = f'{conf_id}#{configuration["marketplace"]["id"]}'
+    else:
+        conf_id = f'{conf_id}#'
+
+    return conf_id
+
+
+def _get_configuration_value(configuration):
+    if 'structured_value' in configuration:
+        return json.dumps(configuration['structured_value'], indent=4, sort_keys=True)
+    elif 'value' in configuration:
+        return configuration['value']
+    return '-'
+
+
+def _get_related(name, field):
+    return lambda configuration: configuration[name][field] if name in configuration else '-'
+
+
+def get_json_object_for_param(original_param):
+    param = deepcopy(original_param)
+    del param['id']
+    del param['name']
+    del param['title']
+    del param['description']
+    del param['phase']
+    del param['scope']
+    del param['type']
+    del param['constraints']['required']
+    del param['constraints']['unique']
+    del param['constraints']['hidden']
+    del param['position']
+    del param['events']
+
+    return json.dumps(param, indent=4, sort_keys=True)
+
+
+def get_media_file_name(media):
+    return f'{media["id"]}.{media["thumbnail"].split(".")[-1]}'
+
+
+def _enabled(value):
+    return 'Enabled' if value else 'Disabled'
+
+
+def get_capabilities_rows(capabilities):
+    ppu = capabilities['ppu']
+    tiers = capabilities['tiers']
+    subscription = capabilities['subscription']
+    change = subscription['change']
+    return (
+        (
+            'Pay-as-you-go support and schema',
+            ppu['schema'] if ppu else 'Disabled',
+        ),
+        (
+            'Pay-as-you-go dynamic items support',
+            _enabled(ppu and 'dynamic' in ppu and ppu['dynamic']),
+        ),
+        (
+            'Pay-as-you-go future charges support',
+            _enabled(ppu and 'future' in ppu and ppu['future']),
+        ),
+        (
+            'Consumption reporting for Reservation Items',
+            _enabled(capabilities['reservation'].get('consumption')),
+        ),
+        (
+            'Dynamic Validation of the Draft Requests',
+            _enabled(capabilities['cart'].get('validation')),
+        ),
+        (
+            'Dynamic Validation of the Inquiring Form',
+            _enabled(capabilities['inquiring'].get('validation')),
+        ),
+        (
+            'Reseller Authorization Level',
+            tiers['configs']['level'] if tiers and tiers.get('configs') else 'Disabled',
+        ),
+        (
+            'Tier Accounts Sync',
+            _enabled(tiers and 'updates' in tiers and tiers['updates']),
+        ),
+        (
+            'Administrative Hold',
+            _enabled(subscription.get('hold')),
+        ),
+        (
+            'Dynamic Validation of Tier Requests',
+            _enabled(tiers['validation']),
+        ),
+        (
+            'Editable Ordering Parameters in Change Request',
+            _enabled(change['editable_ordering_parameters']),
+        ),
+        (
+            'Validation of Draft Change Request',
+            _enabled(change.get('validation')),
+        ),
+        (
+            'Validation of inquiring form for Change Requests',
+            _enabled(change.get('inquiring_validation')),
+        ),
+    )
+
+
+ITEMS_SCHEMA = SheetSchema(
+    'items',
+    (
+        Column('ID', itemgetter('id')),
+        Column('MPN', itemgetter('mpn')),
+        Column('Action', _value('-'), choices=('-', 'create', 'update', 'delete')),
+        Column('Name', itemgetter('display_name')),
+        Column('Description', itemgetter('description')),
+        Column('Type', itemgetter('type'), choices=('reservation', 'ppu')),
+        Column('Precision', itemgetter('precision'), choices=PRECISIONS),
+        Column('Unit', lambda item: item['unit']['unit']),
+        Column('Billing Period', _get_period, choices=BILLING_PERIOD),
+        Column('Commitment', calculate_commitment, choices=COMMITMENT),
+        Column('Status', itemgetter('status')),
+        Column('Created', _created),
+        Column('Modified', _updated),
+    ),
+)
+
+PARAMS_SCHEMA = SheetSchema(
+    'params',
+    (
+        Column('Verbose ID', itemgetter('id'), style=TOP_LEFT_STYLE),
+        Column('ID', itemgetter('name'), style=TOP_LEFT_STYLE),
+        Column(
+            'Action',
+            _value('-'),
+            style=TOP_LEFT_STYLE,
+            choices=('-', 'create', 'update', 'delete'),
+        ),
+        Column('Title', itemgetter('title'), style=TOP_LEFT_STYLE),
+        Column('Description', itemgetter('description'), style=TOP_LEFT_STYLE),
+        Column('Phase', itemgetter('phase'), style=TOP_LEFT_STYLE),
+        Column('Scope', itemgetter('scope'), style=TOP_LEFT_STYLE),
+        Column('Type', itemgetter('type'), style=TOP_LEFT_STYLE, choices=PARAM_TYPES),
+        Column('Required', _constraint('required'), style=TOP_LEFT_STYLE, choices=('True', '-')),
+        Column('Unique', _constraint('unique'), style=TOP_LEFT_STYLE, choices=('True', '-')),
+        Column('Hidden', _constraint('hidden'), style=TOP_LEFT_STYLE, choices=('True', '-')),
+        Column('JSON Properties', get_json_object_for_param, width=100, style=WRAP_STYLE),
+        Column('Created', _created, style=TOP_LEFT_STYLE),
+        Column('Modified', _updated, style=TOP_LEFT_STYLE),
+    ),
+)
+
+MEDIA_SCHEMA = SheetSchema(
+    'media',
+    (
+        Column('Position', itemgetter('position')),
+        Column('ID', itemgetter('id')),
+        Column('Action', _value('-'), choices=('-', 'create', 'update', 'delete')),
+        Column('Type', itemgetter('type'), choices=('image', 'video')),
+        Column('Image File', get_media_file_name),
+        Column('Video URL Location', lambda media: '-' if media['type'] == 'image' else media['url']),
+    ),
+)
+
+CAPABILITIES_SCHEMA = SheetSchema(
+    'capabilities',
+    (
+        Column('Capability', itemgetter(0), width=50),
+        Column('Action', _value('-')),
+        Column('Value', itemgetter(1)),
+    ),
+)
+
+STATIC_LINKS_SCHEMA = SheetSchema(
+    'static_links',
+    (
+        Column('Type', itemgetter(0), choices=('Download', 'Documentation')),
+        Column('Title', lambda link: link[1]['title']),
+        Column('Action', _value('-'), choices=('-', 'create', 'delete')),
+        Column('Url', lambda link: link[1]['url'], width=100),
+    ),
+)
+
+TEMPLATES_SCHEMA = SheetSchema(
+    'templates',
+    (
+        Column('ID', itemgetter('id'), style=TOP_LEFT_STYLE),
+        Column('Title', itemgetter('title'), width=50, style=TOP_LEFT_STYLE),
+        Column(
+            'Action',
+            _value('-'),
+            style=TOP_LEFT_STYLE,
+            choices=('-', 'create', 'update', 'delete'),
+        ),
+        Column('Scope', itemgetter('scope'), style=TOP_LEFT_STYLE, choices=('asset', 'tier1', 'tier2')),
+        Column(
+            'Type',
+            lambda template: template.get('type', 'fulfillment'),
+            style=TOP_LEFT_STYLE,
+            choices=('fulfillment', 'inquire'),
+        ),
+        Column('Content', itemgetter('body'), width=100, style=WRAP_STYLE),
+        Column('Created', _created, style=TOP_LEFT_STYLE),
+        Column('Modified', _updated, style=TOP_LEFT_STYLE),
+    ),
+)
+
+CONFIGURATION_SCHEMA = SheetSchema(
+    'configurations',
+    (
+        Column('ID', calculate_configuration_id),
+        Column('Parameter', lambda configuration: configuration['parameter']['id']),
+        Column('Scope', lambda configuration: configuration['parameter']['scope']),
+        Column('Action', _value('-'), choices=('-', 'update', 'delete')),
+        Column('Item ID', _get_related('item', 'id')),
+        Column('Item Name', _get_related('item', 'name')),
+        Column('Marketplace ID', _get_related('marketplace', 'id')),
+        Column('Marketplace Name', _get_related('marketplace', 'name')),
+        Column('Value', _get_configuration_value),
+    ),
+)
+
+ACTIONS_SCHEMA = SheetSchema(
+    'actions',
+    (
+        Column('Verbose ID', itemgetter('id')),
+        Column('ID', itemgetter('action')),
+        Column('Action', _value('-'), choices=('-', 'create', 'update', 'delete')),
+        Column('Name', itemgetter('name')),
+        Column('Title', itemgetter('title')),
+        Column('Description', itemgetter('description')),
+        Column('Scope', itemgetter('scope'), choices=('asset', 'tier1', 'tier2')),
+        Column('Created', _created),
+        Column('Modified', _updated),
+    ),
+)
+
+SCHEMAS = {
+    schema.ws_type: schema
+    for schema in (
+        ITEMS_SCHEMA,
+        PARAMS_SCHEMA,
+        MEDIA_SCHEMA,
+        CAPABILITIES_SCHEMA,
+        STATIC_LINKS_SCHEMA,
+        TEMPLATES_SCHEMA,
+        CONFIGURATION_SCHEMA,
+        ACTIONS_SCHEMA,
+    )
+}
+
+SHEET_TYPES = {
+    'Items': 'items',
+    'Ordering Parameters': 'params',
+    'Fulfillment Parameters': 'params',
+    'Configuration Parameters': 'params',
+    'Media': 'media',
+    'Capabilities': 'capabilities',
+    'Embedding Static Resources': 'static_links',
+    'Templates': 'templates',
+    'Configuration': 'configurations',
+    'Actions': 'actions',
+}
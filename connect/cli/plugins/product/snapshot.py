@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+import json
+import os
+from threading import Lock
+
+from connect.client import R
+
+
+def _get_id(resource):
+    return resource['id']
+
+
+def _get_updated_at(resource):
+    events = resource.get('events', {})
+    return events.get('updated', {}).get('at') or events.get('created', {}).get('at')
+
+
+class ExportSnapshot:
+    """
+    Keep the objects of the previous export of a product so the next one only
+    fetches what has been created or updated since then. The keys of the
+    current objects are always listed to drop the deleted ones.
+    """
+    def __init__(self, path, product_id):
+        self._path = path
+        self._product_id = product_id
+        self._lock = Lock()
+        self._collections = self._load()
+        self.fetched = 0
+        self.deleted = 0
+
+    def fetch(self, name, resources, key=_get_id, key_fields=('id',)):
+        state = self._collections.get(name)
+        if not state or not state['updated_at']:
+            objects = list(resources)
+            self._update(name, objects, len(objects), 0)
+            return objects
+
+        updated_at = state['updated_at']
+        objects = {key(obj): obj for obj in state['objects']}
+        changed = list(
+            resources.filter(
+                R().events.updated.at.ge(updated_at) | R().events.created.at.ge(updated_at),
+            ),
+        )
+        for obj in changed:
+            objects[key(obj)] = obj
+        current = [key(obj) for obj in resources.select(*key_fields)]
+        deleted = len(set(objects) - set(current))
+        if set(current) - set(objects):
+            objects = {key(obj): obj for obj in resources}
+            changed = list(objects.values())
+        objects = [objects[obj_key] for obj_key in current]
+        self._update(name, objects, len(changed), deleted)
+        return objects
+
+    def save(self):
+        partial_file = f'{self._path}.part'
+        with open(partial_file, 'w') as f:
+            json.dump({'product_id': self._product_id, 'collections': self._collections}, f)
+        os.replace(partial_file, self._path)
+
+    def _update(self, name, objects, fetched, deleted):
+        updated_at = [_get_updated_at(obj) for obj in objects]
+        with self._lock:
+            self._collections[name] = {
+                'updated_at': max(filter(None, updated_at), default=None),
+                'objects': objects,
+            }
+            self.fetched += fetched
+            self.deleted += deleted
+
+    def _load(self):
+        if not os.path.isfile(self._path):
+            return {}
+        try:
+            with open(self._path, 'r') as f:
+                data = json.load(f)
+            if data['product_id'] != self._product_id:
+                return {}
+            return data['collections']
+        except (ValueError, KeyError):
+            return {}
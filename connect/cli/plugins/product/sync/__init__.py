@@ -1,9 +1,11 @@
 from connect.cli.plugins.product.sync.actions import ActionsSynchronizer  # noqa: F401
+from connect.cli.plugins.product.sync.base import SyncSession  # noqa: F401
 from connect.cli.plugins.product.sync.capabilities import CapabilitiesSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.configuration_values import ConfigurationValuesSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.general import GeneralSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.items import ItemSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.media import MediaSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.params import ParamsSynchronizer  # noqa: F401
+from connect.cli.plugins.product.sync.scheduler import SyncScheduler  # noqa: F401
 from connect.cli.plugins.product.sync.static_resources import StaticResourcesSynchronizer  # noqa: F401
 from connect.cli.plugins.product.sync.templates import TemplatesSynchronizer  # noqa: F401
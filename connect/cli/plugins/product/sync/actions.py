@@ -4,96 +4,107 @@
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
 import re
-from collections import namedtuple
 
-from tqdm import trange
-
-from connect.cli.plugins.product.sync.base import ProductSynchronizer
-from connect.cli.plugins.product.constants import (
-    ACTIONS_HEADERS,
-)
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
+from connect.cli.plugins.product.schema import ACTIONS_SCHEMA
+from connect.cli.plugins.product.sync.base import Change, is_unchanged, ProductSynchronizer
 from connect.client import ClientError
 
-fields = (v.replace(' ', '_').lower() for v in ACTIONS_HEADERS.values())
-
-_RowData = namedtuple('RowData', fields)
-
 
 class ActionsSynchronizer(ProductSynchronizer):
+    _row_key_fields = ('verbose_id', 'id')
 
-    def sync(self):  # noqa: CCR001
-        ws = self._wb["Actions"]
-        errors = {}
-        skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 10)])
-            row_indexes.set_description(f'Processing action {data.verbose_id or data.id}')
-            if data.action == '-':
-                skipped_count += 1
-                continue
-            row_errors = self._validate_row(data)
-
-            if row_errors:
-                errors[row_idx] = row_errors
-                continue
-
-            if data.action == 'delete':
-                try:
-                    self._client.products[self._product_id].actions[data.verbose_id].delete()
-                    deleted_items.append(data)
-                except ClientError as e:
-                    if e.status_code == 404:
-                        deleted_items.append(data)
-                        continue
-                    errors[row_idx] = [str(e)]
-                    continue
-
-            payload = {
-                "action": data.id,
-                "name": data.name,
-                "type": "button",
-                "scope": data.scope,
-                "description": data.description,
-                "title": data.title,
-            }
-
-            if data.action == 'update':
-                try:
-                    action = self._client.products[self._product_id].actions[
-                        data.verbose_id
-                    ].update(payload)
-                    updated_items.append(action)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-
-            if data.action == 'create':
-                try:
-                    action = self._client.products[self._product_id].actions.create(payload)
-                    self._update_sheet_row(ws, row_idx, action)
-                    created_items.append(action)
-                except ClientError as e:
-                    errors[row_idx] = [str(e)]
-
+    def sync(self):
+        outcomes, errors = self._sync_rows(self._sync_row)
         return (
-            skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            outcomes['skipped'],
+            outcomes['created'],
+            outcomes['updated'],
+            outcomes['deleted'],
             errors,
         )
 
+    def _sync_row(self, row_idx, data):  # noqa: CCR001
+        self._progress.set_description(f'Processing action {data.verbose_id or data.id}')
+        if data.action == '-':
+            return 'skipped'
+        change = self._plan_row(data)
+
+        if isinstance(change, list):
+            return change
+
+        if change.operation == 'no-op':
+            return 'skipped'
+
+        if change.operation == 'delete':
+            try:
+                self._client.products[self._product_id].actions[data.verbose_id].delete()
+                self._drop_current('actions', data.verbose_id)
+            except ClientError as e:
+                if e.status_code != 404:
+                    return [str(e)]
+            return 'deleted'
+
+        payload = self._get_action_payload(data)
+
+        if change.operation == 'update':
+            try:
+                action = self._client.products[self._product_id].actions[
+                    data.verbose_id
+                ].update(payload)
+                self._set_current('actions', action)
+            except Exception as e:
+                return [str(e)]
+            return 'updated'
+
+        try:
+            action = self._client.products[self._product_id].actions.create(payload)
+            self._update_sheet_row(row_idx, action)
+        except ClientError as e:
+            return [str(e)]
+        return 'created'
+
+    def _plan_row(self, data):
+        row_errors = self._validate_row(data)
+
+        if row_errors:
+            return row_errors
+
+        if data.action != 'update':
+            return Change(data.action, None)
+
+        try:
+            current = self._get_current('actions', data.verbose_id)
+        except ClientError as e:
+            return [str(e)]
+        if not current:
+            return [
+                f'Cannot update action {data.verbose_id} since does not exist in the product.',
+            ]
+        if is_unchanged(current, self._get_action_payload(data)):
+            return Change('no-op', current)
+        return Change('update', current)
+
     @staticmethod
-    def _update_sheet_row(ws, row_idx, action):
-        ws.cell(row_idx, 1, value=action['id'])
-        ws.cell(row_idx, 8, value=action['events']['created']['at'])
-        ws.cell(row_idx, 9, value=action['events'].get('updated', {}).get('at'))
+    def _get_action_payload(data):
+        return {
+            "action": data.id,
+            "name": data.name,
+            "type": "button",
+            "scope": data.scope,
+            "description": data.description,
+            "title": data.title,
+        }
+
+    def _update_sheet_row(self, row_idx, action):
+        cols = ACTIONS_SCHEMA.col_idx
+        self._update_row(
+            row_idx,
+            {
+                cols['verbose_id']: action['id'],
+                cols['created']: action['events']['created']['at'],
+                cols['modified']: action['events'].get('updated', {}).get('at'),
+            },
+        )
 
     @staticmethod
     def _validate_row(data):
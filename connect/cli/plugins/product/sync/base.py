@@ -3,13 +3,23 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
+import json
+import os
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import as_completed, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from threading import Lock
 from zipfile import BadZipFile
 
 from click import ClickException
 from openpyxl import load_workbook
+from openpyxl.styles import Alignment
+from tqdm import tqdm
 from openpyxl.utils.exceptions import InvalidFileException
 
+from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.exceptions import SheetNotFoundError
+from connect.cli.plugins.product.formats import get_files_format, load_product_files, save_product_files
+from connect.cli.plugins.product.schema import FINGERPRINT_HEADER, SCHEMAS, SHEET_TYPES
 from connect.cli.plugins.product.utils import (
     get_col_headers_by_ws_type,
     get_col_limit_by_ws_type,
@@ -17,12 +27,268 @@ from connect.cli.plugins.product.utils import (
 )
 
 
+Change = namedtuple('Change', ('operation', 'current'))
+
+
+def is_unchanged(current, payload):
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            if not isinstance(current.get(key), dict) or not is_unchanged(current[key], value):
+                return False
+        elif current.get(key) != value:
+            return False
+    return True
+
+
+class SyncSession:
+    def __init__(self, client, input_file, jobs=1, resume=False):
+        self._client = client
+        self._input_file = input_file
+        self._jobs = jobs
+        self._files_format = get_files_format(input_file)
+        self._wb = None
+        self._products = set()
+        self._actions = {}
+        self._updates = defaultdict(lambda: defaultdict(dict))
+        self._checksums = defaultdict(dict)
+        self._fingerprints = {}
+        self._indexes = {}
+        self._lock = Lock()
+        self._index_lock = Lock()
+        self._journal_lock = Lock()
+        self._journal_file = f'{os.path.splitext(input_file)[0]}.journal'
+        # validation sessions have no client and never write the journal
+        if client is not None and not resume and os.path.isfile(self._journal_file):
+            raise ClickException(
+                f'{self._journal_file} records an interrupted synchronization of {input_file}: '
+                'run the synchronization again with --resume to continue it or remove the journal '
+                'to start over.',
+            )
+        self._journal = self._load_journal() if resume else {}
+        self._journal_fp = None
+
+    @property
+    def input_file(self):
+        return self._input_file
+
+    @property
+    def jobs(self):
+        return self._jobs
+
+    @property
+    def workbook(self):
+        with self._lock:
+            if self._wb is None:
+                self._wb = self._load_workbook(read_only=True)
+            return self._wb
+
+    def check_product(self, product_id):
+        if self._client is None or product_id in self._products:
+            return
+        if not self._client.products[product_id].exists():
+            raise ClickException(f'Product {product_id} not found, create it first.')
+        self._products.add(product_id)
+
+    def get_object(self, product_id, collection, obj_id):
+        with self._index_lock:
+            key = product_id, collection
+            if key not in self._indexes:
+                resources = self._client.products[product_id].collection(collection).all()
+                self._indexes[key] = {obj['id']: obj for obj in resources}
+            return self._indexes[key].get(obj_id)
+
+    def set_object(self, product_id, collection, obj):
+        with self._index_lock:
+            if (product_id, collection) in self._indexes:
+                self._indexes[(product_id, collection)][obj['id']] = obj
+
+    def drop_object(self, product_id, collection, obj_id):
+        with self._index_lock:
+            if (product_id, collection) in self._indexes:
+                self._indexes[(product_id, collection)].pop(obj_id, None)
+
+    def count_rows(self, worksheet):
+        return max((self.workbook[worksheet].max_row or 1) - 1, 0)
+
+    def get_actions(self, worksheet):
+        if worksheet not in self._actions:
+            schema = _get_schema(worksheet)
+            col_idx = schema.col_idx['action']
+            rows = self.workbook[worksheet].iter_rows(
+                min_row=2, min_col=col_idx, max_col=col_idx, values_only=True,
+            )
+            self._actions[worksheet] = Counter(action for action, in rows)
+        return self._actions[worksheet]
+
+    def has_changes(self, worksheet):
+        return any(action != '-' for action in self.get_actions(worksheet))
+
+    def iter_rows(self, worksheet):
+        schema = _get_schema(worksheet)
+        rows = self.workbook[worksheet].iter_rows(
+            max_col=schema.fingerprint_col_idx, values_only=True,
+        )
+        headers = next(rows, ())
+        fingerprints = None
+        if len(headers) == schema.fingerprint_col_idx and headers[-1] == FINGERPRINT_HEADER:
+            fingerprints = self._fingerprints.setdefault(worksheet, {})
+        for row_idx, values in enumerate(rows, start=2):
+            values = tuple(values) + (None,) * (schema.fingerprint_col_idx - len(values))
+            if fingerprints is not None:
+                fingerprints[row_idx] = values[-1]
+            yield row_idx, schema.row_type(*values[:-1])
+
+    def is_row_unchanged(self, worksheet, row_idx, data):
+        fingerprint = self._fingerprints.get(worksheet, {}).get(row_idx)
+        return fingerprint is not None and fingerprint == _get_schema(worksheet).fingerprint(data)
+
+    def update_fingerprint(self, worksheet, row_idx, data):
+        if worksheet not in self._fingerprints:
+            return
+        schema = _get_schema(worksheet)
+        with self._lock:
+            cells = self._updates[worksheet][row_idx]
+            values = [
+                cells[col_idx][0] if col_idx in cells else value
+                for col_idx, value in enumerate(data, start=1)
+            ]
+            cells[schema.fingerprint_col_idx] = schema.fingerprint(values), None
+
+    def update_row(self, worksheet, row_idx, values, alignment=None):
+        with self._lock:
+            cells = self._updates[worksheet][row_idx]
+            for col_idx, value in values.items():
+                cells[col_idx] = value, alignment
+
+    def update_checksums(self, checksums_file, checksums):
+        with self._lock:
+            self._checksums[checksums_file].update(checksums)
+
+    def journal_row(self, worksheet, row_idx, outcome):
+        with self._lock:
+            cells = [
+                [col_idx, value, dict(alignment) if alignment else None]
+                for col_idx, (value, alignment) in self._updates.get(worksheet, {}).get(row_idx, {}).items()
+            ]
+        # the disk flush must not hold the lock the workers need to record their updates
+        with self._journal_lock:
+            if self._journal_fp is None:
+                self._journal_fp = open(self._journal_file, 'a')
+            record = {'worksheet': worksheet, 'row': row_idx, 'outcome': outcome, 'cells': cells}
+            self._journal_fp.write(f'{json.dumps(record)}\n')
+            self._journal_fp.flush()
+            os.fsync(self._journal_fp.fileno())
+
+    def replay_row(self, worksheet, row_idx):
+        record = self._journal.get((worksheet, row_idx))
+        if not record:
+            return
+        with self._lock:
+            cells = self._updates[worksheet][row_idx]
+            for col_idx, value, alignment in record['cells']:
+                cells[col_idx] = value, Alignment(**alignment) if alignment else None
+        return record['outcome']
+
+    def save(self, output_file=None):
+        if self._updates or output_file not in (None, self._input_file):
+            self._write_workbook(output_file)
+        self._write_checksums()
+        self._discard_journal()
+
+    def close(self):
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+
+    def _write_workbook(self, output_file):
+        if self._files_format and self._wb is not None:
+            wb = self._wb
+        else:
+            self.close()
+            wb = self._load_workbook()
+        self._apply_updates(wb)
+        if self._files_format and output_file in (None, self._input_file):
+            save_product_files(wb, self._input_file, self._updates)
+        else:
+            wb.save(output_file or self._input_file)
+        self._updates.clear()
+
+    def _apply_updates(self, wb):
+        for worksheet, rows in self._updates.items():
+            ws = wb[worksheet]
+            for row_idx, cells in rows.items():
+                for col_idx, (value, alignment) in cells.items():
+                    cell = ws.cell(row_idx, col_idx, value=value)
+                    if alignment:
+                        cell.alignment = alignment
+
+    def _write_checksums(self):
+        for checksums_file, checksums in self._checksums.items():
+            current = {}
+            if os.path.isfile(checksums_file):
+                try:
+                    with open(checksums_file, 'r') as f:
+                        current = json.load(f)
+                except ValueError:
+                    pass
+            current.update(checksums)
+            with open(f'{checksums_file}.tmp', 'w') as f:
+                json.dump(current, f, indent=4, sort_keys=True)
+            os.replace(f'{checksums_file}.tmp', checksums_file)
+        self._checksums.clear()
+
+    def _load_journal(self):
+        journal = {}
+        if not os.path.isfile(self._journal_file):
+            return journal
+        with open(self._journal_file) as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                journal[(record['worksheet'], record['row'])] = record
+        return journal
+
+    def _discard_journal(self):
+        with self._journal_lock:
+            if self._journal_fp is not None:
+                self._journal_fp.close()
+                self._journal_fp = None
+        if os.path.isfile(self._journal_file):
+            os.remove(self._journal_file)
+        self._journal = {}
+
+    def _load_workbook(self, read_only=False):
+        if self._files_format:
+            return load_product_files(self._input_file)
+        try:
+            return load_workbook(
+                self._input_file,
+                read_only=read_only,
+                data_only=True,
+            )
+        except InvalidFileException as ife:
+            raise ClickException(str(ife))
+        except BadZipFile:
+            raise ClickException(f'{self._input_file} is not a valid xlsx file.')
+
+
+def _get_schema(worksheet):
+    return SCHEMAS[SHEET_TYPES[worksheet]]
+
+
 class ProductSynchronizer:
-    def __init__(self, client, silent):
+    _row_key_fields = ('id',)
+
+    def __init__(self, client, silent, session=None):
         self._client = client
         self._silent = silent
+        self._session = session
         self._product_id = None
+        self._worksheet = None
         self._wb = None
+        self._progress = None
 
     def open(self, input_file, worksheet):
         self._open_workbook(input_file)
@@ -30,30 +296,155 @@ class ProductSynchronizer:
             raise SheetNotFoundError(f'File does not contain {worksheet} to synchronize, skipping')
         ws = self._wb['General Information']
         product_id = ws['B5'].value
-        if not self._client.products[product_id].exists():
-            raise ClickException(f'Product {product_id} not found, create it first.')
+        if self._client is not None:
+            self._session.check_product(product_id)
         ws = self._wb[worksheet]
         self._validate_worksheet_sheet(ws, worksheet)
 
         self._product_id = product_id
+        self._worksheet = worksheet
         return self._product_id
 
+    def has_changes(self):
+        return self._session.has_changes(self._worksheet)
+
+    def get_skipped_count(self):
+        return self._session.get_actions(self._worksheet)['-']
+
+    def plan(self):
+        changes = {}
+        for row_idx, data in self._session.iter_rows(self._worksheet):
+            if data.action == '-':
+                continue
+            if self._is_row_unchanged(row_idx, data):
+                changes[row_idx] = Change('no-op', None)
+            else:
+                changes[row_idx] = self._plan_row(data)
+        return changes
+
+    def validate(self):
+        errors = {}
+        for row_idx, data in self._session.iter_rows(self._worksheet):
+            if data.action == '-':
+                continue
+            row_errors = self._validate_row(data)
+            if row_errors:
+                errors[row_idx] = row_errors
+        return errors
+
     def sync(self):
         raise NotImplementedError("Not implemented")
 
     def save(self, output_file):
-        self._wb.save(output_file)
+        self._session.save(output_file)
 
     def _open_workbook(self, input_file):
-        try:
-            self._wb = load_workbook(
-                input_file,
-                data_only=True,
-            )
-        except InvalidFileException as ife:
-            raise ClickException(str(ife))
-        except BadZipFile:
-            raise ClickException(f'{input_file} is not a valid xlsx file.')
+        if not self._session or self._session.input_file != input_file:
+            self._session = SyncSession(self._client, input_file)
+        self._wb = self._session.workbook
+
+    def _iter_rows(self):
+        return tqdm(
+            self._session.iter_rows(self._worksheet),
+            total=self._session.count_rows(self._worksheet),
+            disable=self._silent,
+            leave=True,
+            bar_format=DEFAULT_BAR_FORMAT,
+        )
+
+    def _sync_rows(self, sync_row, jobs=None):
+        outcomes = Counter()
+        errors = {}
+        self._progress = tqdm(
+            total=self._session.count_rows(self._worksheet),
+            disable=self._silent,
+            leave=True,
+            bar_format=DEFAULT_BAR_FORMAT,
+        )
+        for row_idx, result in self._execute_rows(sync_row, jobs or self._session.jobs):
+            if isinstance(result, list):
+                errors[row_idx] = result
+            elif result:
+                outcomes[result] += 1
+            self._progress.update(1)
+        self._progress.close()
+        return outcomes, errors
+
+    def _execute_rows(self, sync_row, jobs):
+        rows = self._session.iter_rows(self._worksheet)
+        if jobs == 1:
+            for row_idx, data in rows:
+                yield row_idx, self._process_row(sync_row, row_idx, data)
+            return
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            pending = {}
+            last_by_key = {}
+            for row_idx, data in rows:
+                keys = self._get_row_keys(data)
+                previous = {last_by_key[key] for key in keys if key in last_by_key}
+                future = executor.submit(self._process_row_after, previous, sync_row, row_idx, data)
+                last_by_key.update(dict.fromkeys(keys, future))
+                pending[future] = row_idx
+                if len(pending) < jobs * 2:
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+            for future in as_completed(pending):
+                yield pending[future], future.result()
+
+    def _process_row_after(self, previous, sync_row, row_idx, data):
+        # rows sharing a key run in sheet order; the previous rows were submitted
+        # earlier, so they are already running on another worker or done
+        wait(previous)
+        return self._process_row(sync_row, row_idx, data)
+
+    def _get_row_keys(self, data):
+        return [
+            (field, getattr(data, field))
+            for field in self._row_key_fields
+            if getattr(data, field) not in (None, '', '-')
+        ]
+
+    def _process_row(self, sync_row, row_idx, data):
+        outcome = self._replay_row(row_idx)
+        if outcome:
+            return outcome
+        if self._is_row_unchanged(row_idx, data):
+            return 'skipped'
+        result = sync_row(row_idx, data)
+        if isinstance(result, str) and data.action != '-':
+            self._session.update_fingerprint(self._worksheet, row_idx, data)
+            self._journal_row(row_idx, result)
+        return result
+
+    def _is_row_unchanged(self, row_idx, data):
+        return data.action == 'update' and self._session.is_row_unchanged(self._worksheet, row_idx, data)
+
+    def _replay_row(self, row_idx):
+        return self._session.replay_row(self._worksheet, row_idx)
+
+    def _journal_row(self, row_idx, outcome):
+        self._session.journal_row(self._worksheet, row_idx, outcome)
+
+    def _plan_row(self, data):
+        return Change(data.action, None)
+
+    def _validate_row(self, data):
+        return []
+
+    def _get_current(self, collection, obj_id):
+        return self._session.get_object(self._product_id, collection, obj_id)
+
+    def _set_current(self, collection, obj):
+        self._session.set_object(self._product_id, collection, obj)
+
+    def _drop_current(self, collection, obj_id):
+        self._session.drop_object(self._product_id, collection, obj_id)
+
+    def _update_row(self, row_idx, values, alignment=None):
+        self._session.update_row(self._worksheet, row_idx, values, alignment)
 
     @staticmethod
     def _validate_worksheet_sheet(ws, worksheet):
@@ -1,35 +1,24 @@
-from collections import namedtuple
-
-from tqdm import trange
-
 from connect.cli.plugins.product.constants import (
     CAPABILITIES,
-    CAPABILITIES_COLS_HEADERS,
 )
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
-from connect.cli.plugins.product.utils import cleanup_product_for_update
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
-
+from connect.cli.plugins.product.utils import apply_capability, cleanup_product_for_update
 
-fields = (v.replace(' ', '_').lower() for v in CAPABILITIES_COLS_HEADERS.values())
 
-_RowData = namedtuple('RowData', fields)
+_CAPABILITIES = frozenset(CAPABILITIES)
 
 
 class CapabilitiesSynchronizer(ProductSynchronizer):
     def sync(self):  # noqa: CCR001
-        ws = self._wb['Capabilities']
         errors = {}
         skipped_count = 0
-        updated_items = []
+        changes = {}
+        product = None
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 4)])
-            row_indexes.set_description(f'Processing Product capabilities {data.capability}')
-            if data.action == '-':
+        rows = self._iter_rows()
+        for row_idx, data in rows:
+            rows.set_description(f'Processing Product capabilities {data.capability}')
+            if data.action == '-' or self._is_row_unchanged(row_idx, data):
                 skipped_count += 1
                 continue
             row_errors = self._validate_row(data)
@@ -38,170 +27,55 @@ class CapabilitiesSynchronizer(ProductSynchronizer):
                 errors[row_idx] = row_errors
                 continue
 
-            product = cleanup_product_for_update(self._client.products[self._product_id].get())
-
-            if data.action == 'update':
-                update = True
-                try:
-                    if data.capability == 'Pay-as-you-go support and schema':
-                        if data.value != 'Disabled':
-                            if not product['capabilities']['ppu']:
-                                product['capabilities']['ppu'] = {
-                                    'schema': data.value,
-                                    'dynamic': False,
-                                    'future': False,
-                                }
-                            else:
-                                product['capabilities']['ppu']['schema'] = data.value
-                        else:
-                            product['capabilities']['ppu'] = None
-                    if data.capability == 'Pay-as-you-go dynamic items support':
-                        if not product['capabilities']['ppu']:
-                            if data.value == 'Enabled':
-                                raise Exception(
-                                    "Dynamic items support can't be enabled without Pay-as-you-go "
-                                    "support",
-                                )
-                            update = False
-                        else:
-                            if data.value == 'Enabled':
-                                product['capabilities']['ppu']['dynamic'] = True
-                            else:
-                                product['capabilities']['ppu']['dynamic'] = False
-                    if data.capability == "Pay-as-you-go future charges support":
-                        if not product['capabilities']['ppu']:
-                            if data.value == 'Enabled':
-                                raise Exception(
-                                    "Report of future charges can't be enabled without Pay-as-you-go "
-                                    "support",
-                                )
-                            update = False
-
-                        else:
-                            if data.value == 'Enabled':
-                                product['capabilities']['ppu']['future'] = True
-                            else:
-                                product['capabilities']['ppu']['future'] = False
-                    if data.capability == 'Consumption reporting for Reservation Items':
-                        if data.value == 'Enabled':
-                            product['capabilities']['reservation']['consumption'] = True
-                        else:
-                            product['capabilities']['reservation']['consumption'] = False
-
-                    if data.capability == 'Dynamic Validation of the Draft Requests':
-                        if data.value == 'Enabled':
-                            product['capabilities']['cart']['validation'] = True
-                        else:
-                            product['capabilities']['cart']['validation'] = False
-
-                    if data.capability == 'Dynamic Validation of the Inquiring Form':
-                        if data.value == 'Enabled':
-                            product['capabilities']['inquiring']['validation'] = True
-                        else:
-                            product['capabilities']['inquiring']['validation'] = False
+            if data.action != 'update':
+                continue
 
-                    if data.capability == 'Reseller Authorization Level':
-                        if data.value == 'Disabled':
-                            product['capabilities']['tiers']['configs'] = None
-                        else:
-                            product['capabilities']['tiers']['configs'] = {
-                                'level': data.value,
-                            }
-                    if data.capability == 'Tier Accounts Sync':
-                        if data.value == 'Enabled':
-                            product['capabilities']['tiers']['updates'] = True
-                        else:
-                            product['capabilities']['tiers']['updates'] = False
-                    if data.capability == 'Administrative Hold':
-                        if data.value == 'Enabled':
-                            product['capabilities']['subscription']['hold'] = True
-                        else:
-                            product['capabilities']['subscription']['hold'] = False
-                    if data.capability == 'Dynamic Validation of Tier Requests':
-                        if data.value == 'Enabled':
-                            product['capabilities']['tiers']['validation'] = True
-                        else:
-                            product['capabilities']['tiers']['validation'] = False
-                    if data.capability == 'Editable Ordering Parameters in Change Request':
-                        if data.value == 'Enabled':
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'editable_ordering_parameters'
-                            ] = True
-                        else:
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'editable_ordering_parameters'
-                            ] = False
-                    if data.capability == 'Validation of Draft Change Request':
-                        if data.value == 'Enabled':
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'validation'
-                            ] = True
-                        else:
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'validation'
-                            ] = False
-                    if data.capability == 'Validation of inquiring form for Change Requests':
-                        if data.value == 'Enabled':
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'inquiring_validation'
-                            ] = True
-                        else:
-                            product[
-                                'capabilities'
-                            ][
-                                'subscription'
-                            ][
-                                'change'
-                            ][
-                                'inquiring_validation'
-                            ] = False
-                    if update:
-                        self._client.products[self._product_id].update(product)
-                    updated_items.append(data.capability)
+            if product is None:
+                product = self._get_product()
+            try:
+                changed = apply_capability(product, data)
+            except Exception as e:
+                errors[row_idx] = [str(e)]
+                continue
+            if not changed:
+                skipped_count += 1
+                continue
+            changes[row_idx] = data
 
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+        if changes:
+            errors.update(self._update_product(product, changes))
 
         return (
             skipped_count,
-            len(updated_items),
+            len([row_idx for row_idx in changes if row_idx not in errors]),
             errors,
         )
 
+    def _get_product(self):
+        return cleanup_product_for_update(self._client.products[self._product_id].get())
+
+    def _update_product(self, product, changes):
+        try:
+            self._client.products[self._product_id].update(product)
+            return {}
+        except Exception as e:
+            if len(changes) == 1:
+                return {row_idx: [str(e)] for row_idx in changes}
+
+        errors = {}
+        for row_idx, data in changes.items():
+            try:
+                product = self._get_product()
+                apply_capability(product, data)
+                self._client.products[self._product_id].update(product)
+            except Exception as e:
+                errors[row_idx] = [str(e)]
+        return errors
+
     @staticmethod
     def _validate_row(data):
         errors = []
-        if data.capability not in CAPABILITIES:
+        if data.capability not in _CAPABILITIES:
             errors.append(
                 f'Capability {data.capability} is not valid capability',
             )
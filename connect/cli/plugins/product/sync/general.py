@@ -9,10 +9,10 @@ from connect.client import ClientError
 
 
 class GeneralSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
+    def __init__(self, client, silent, session=None):
         self._category = None
         self._media_path = None
-        super(GeneralSynchronizer, self).__init__(client, silent)
+        super(GeneralSynchronizer, self).__init__(client, silent, session)
 
     def open(self, input_file, worksheet):
         self._open_workbook(input_file)
@@ -25,8 +25,7 @@ class GeneralSynchronizer(ProductSynchronizer):
                 'Input file has invalid format and could not read product id from it',
             )
         product_id = ws['B5'].value
-        if not self._client.products[product_id].exists():
-            raise ClickException(f'Product {product_id} not found, create it first.')
+        self._session.check_product(product_id)
         errors = self._validate_general(ws)
         if errors:
             raise ClickException(
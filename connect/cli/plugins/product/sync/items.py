@@ -3,153 +3,141 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
-from collections import namedtuple
+from threading import Lock
 
-from tqdm import trange
-
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import (
     BILLING_PERIOD,
     COMMITMENT,
-    ITEMS_COLS_HEADERS,
     PRECISIONS,
 )
-from connect.cli.plugins.product.sync.base import ProductSynchronizer
+from connect.cli.plugins.product.schema import ITEMS_SCHEMA
+from connect.cli.plugins.product.sync.base import Change, is_unchanged, ProductSynchronizer
+from connect.cli.plugins.product.sync.units import get_unit_resolver
 from connect.cli.plugins.product.api import (
     create_item,
-    create_unit,
     delete_item,
-    get_item,
-    get_item_by_mpn,
     update_item,
 )
-from connect.client.rql import R
 
-fields = (v.replace(' ', '_').lower() for v in ITEMS_COLS_HEADERS.values())
 
-_RowData = namedtuple('RowData', fields)
+_BILLING_PERIODS = frozenset(BILLING_PERIOD)
+_COMMITMENTS = frozenset(COMMITMENT)
+_PRECISIONS = frozenset(PRECISIONS)
 
 
 class ItemSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
-        self._units = list(client.ns('settings').units.all())
-        super().__init__(client, silent)
-
-    def sync(self):  # noqa: CCR001
-        ws = self._wb["Items"]
-        errors = {}
-        skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
-
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 14)])
-            row_indexes.set_description(f'Processing item {data.id or data.mpn}')
-            if data.action == '-':
-                skipped_count += 1
-                continue
-            row_errors = self._validate_row(data)
-            if row_errors:
-                errors[row_idx] = row_errors
-                continue
-
-            if data.action == 'create':
-                rql = R().mpn.eq(data.mpn)
-                item = (
-                    self._client.products[self._product_id]
-                    .items
-                    .filter(rql)
-                    .first()
-                )
-                if item:
-                    errors[row_idx] = [
-                        f'Cannot create item: item with MPN `{data.mpn}`'
-                        f' already exists with ID `{item["id"]}`.',
-                    ]
-                    continue
-                row_indexes.set_description(f"Creating item {data[1]}")
-                try:
-                    item = create_item(
-                        self._client,
-                        self._product_id,
-                        self._get_item_payload(data),
-                    )
-                    created_items.append(item)
-                    self._update_sheet_row(ws, row_idx, item)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-
-            if data.action == 'update':
-                item = self._get_item(data)
-
-                if not item:
-                    field = 'ID' if data.id else 'MPN'
-                    value = data.id if data.id else data.mpn
-                    errors[row_idx] = [
-                        f'Cannot update item: item with {field} `{value}` '
-                        f'the item does not exist.',
-                    ]
-                    continue
-
-                row_indexes.set_description(f"Updating item {item['id']}")
-                if item['status'] == 'published':
-                    payload = {
-                        'name': data.name,
-                        'mpn': data.mpn,
-                        'description': data.description,
-                        'ui': {'visibility': True},
-                    }
-                else:
-                    payload = self._get_item_payload(data)
-                    if item['type'] == 'ppu':
-                        del payload['period']
-                try:
-                    item = update_item(
-                        self._client,
-                        self._product_id,
-                        item['id'],
-                        payload,
-                    )
-                    updated_items.append(item)
-                    self._update_sheet_row(ws, row_idx, item)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-
-            if data.action == 'delete':
-                item = self._get_item(data)
-
-                if not item:
-                    field = 'ID' if data.id else 'MPN'
-                    value = data.id if data.id else data.mpn
-                    errors[row_idx] = [
-                        f'Cannot update item: item with {field} `{value}` '
-                        f'the item does not exist.',
-                    ]
-                    continue
-                try:
-                    delete_item(
-                        self._client,
-                        self._product_id,
-                        item['id'],
-                    )
-                    deleted_items.append(item)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
+    _row_key_fields = ('id', 'mpn')
+
+    def __init__(self, client, silent, session=None):
+        self._units = get_unit_resolver(client) if client else None
+        if self._units:
+            self._units.load()
+        self._items_by_id = None
+        self._items_by_mpn = None
+        self._index_lock = Lock()
+        super().__init__(client, silent, session)
+
+    def sync(self):
+        outcomes, errors = self._sync_rows(self._sync_row)
         return (
-            skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            outcomes['skipped'],
+            outcomes['created'],
+            outcomes['updated'],
+            outcomes['deleted'],
             errors,
         )
 
+    def _sync_row(self, row_idx, data):  # noqa: CCR001
+        self._progress.set_description(f'Processing item {data.id or data.mpn}')
+        if data.action == '-':
+            return 'skipped'
+        change = self._plan_row(data)
+        if isinstance(change, list):
+            return change
+
+        item = change.current
+        if change.operation == 'no-op':
+            self._update_sheet_row(row_idx, item)
+            return 'skipped'
+
+        if change.operation == 'create':
+            self._progress.set_description(f"Creating item {data[1]}")
+            try:
+                item = create_item(
+                    self._client,
+                    self._product_id,
+                    self._get_item_payload(data),
+                )
+                self._index_item(item)
+                self._update_sheet_row(row_idx, item)
+            except Exception as e:
+                return [str(e)]
+            return 'created'
+
+        if change.operation == 'update':
+            self._progress.set_description(f"Updating item {item['id']}")
+            try:
+                updated_item = update_item(
+                    self._client,
+                    self._product_id,
+                    item['id'],
+                    self._get_update_payload(item, data),
+                )
+                self._unindex_item(item)
+                self._index_item(updated_item)
+                self._update_sheet_row(row_idx, updated_item)
+            except Exception as e:
+                return [str(e)]
+            return 'updated'
+
+        if change.operation != 'delete':
+            return
+
+        try:
+            delete_item(
+                self._client,
+                self._product_id,
+                item['id'],
+            )
+            self._unindex_item(item)
+        except Exception as e:
+            return [str(e)]
+        return 'deleted'
+
+    def _plan_row(self, data):
+        row_errors = self._validate_row(data)
+        if row_errors:
+            return row_errors
+
+        if data.action == 'create':
+            item = self._get_item_by_mpn(data.mpn)
+            if item:
+                return [
+                    f'Cannot create item: item with MPN `{data.mpn}`'
+                    f' already exists with ID `{item["id"]}`.',
+                ]
+            return Change('create', None)
+
+        if data.action not in ('update', 'delete'):
+            return Change(data.action, None)
+
+        item = self._get_item(data)
+
+        if not item:
+            field = 'ID' if data.id else 'MPN'
+            value = data.id if data.id else data.mpn
+            return [
+                f'Cannot update item: item with {field} `{value}` '
+                f'the item does not exist.',
+            ]
+
+        if data.action == 'update' and self._is_unchanged(item, data):
+            return Change('no-op', item)
+        return Change(data.action, item)
+
     @staticmethod
     def _validate_commitment(row):
-        if row.commitment not in COMMITMENT:
+        if row.commitment not in _COMMITMENTS:
             valid_commitment = ', '.join([f'`{name}`' for name in COMMITMENT])
             return [
                 f'the item `Commitment` must be one between '
@@ -236,7 +224,7 @@ class ItemSynchronizer(ProductSynchronizer):
                     f'must be `integer`, not `{row.precision}`.',
                 )
         else:
-            if row.precision not in PRECISIONS:
+            if row.precision not in _PRECISIONS:
                 valid_precision = ', '.join([f'`{name}`' for name in PRECISIONS])
                 errors.append(
                     f'the item `Precision` must be one between '
@@ -250,7 +238,7 @@ class ItemSynchronizer(ProductSynchronizer):
                     f'must be `monthly`, not `{row.billing_period}`.',
                 )
         else:
-            if row.billing_period not in BILLING_PERIOD:
+            if row.billing_period not in _BILLING_PERIODS:
                 valid_period = ', '.join([f'`{name}`' for name in BILLING_PERIOD])
                 errors.append(
                     f'the item `Billing period` must be one between'
@@ -282,28 +270,58 @@ class ItemSynchronizer(ProductSynchronizer):
         count, _ = data.billing_period.split()
         return f'years_{count}'
 
+    def _find_unit(self, data):
+        return self._units.resolve(data.unit, data.type)
+
     def _get_or_create_unit(self, data):
-        for unit in self._units:
-            if unit['id'] == data.unit:
-                return unit['id']
-            if unit['type'] == data.type and unit['description'] == data.unit:
-                return unit['id']
-
-        created = create_unit(
-            self._client,
-            {
-                'description': data.unit,
-                'type': data.type,
-                'unit': 'unit' if data.type == 'reservation' else 'unit-h',
-            },
-        )
-        return created['id']
+        return self._units.get_or_create(data.unit, data.type)
+
+    def _load_items_index(self):
+        with self._index_lock:
+            if self._items_by_id is None:
+                items = list(self._client.products[self._product_id].items.all())
+                self._items_by_mpn = {item['mpn']: item for item in items}
+                self._items_by_id = {item['id']: item for item in items}
+
+    def _index_item(self, item):
+        with self._index_lock:
+            self._items_by_id[item['id']] = item
+            self._items_by_mpn[item['mpn']] = item
+
+    def _unindex_item(self, item):
+        with self._index_lock:
+            self._items_by_id.pop(item['id'], None)
+            if self._items_by_mpn.get(item['mpn'], {}).get('id') == item['id']:
+                del self._items_by_mpn[item['mpn']]
+
+    def _get_item_by_mpn(self, mpn):
+        self._load_items_index()
+        return self._items_by_mpn.get(mpn)
 
     def _get_item(self, data):
+        self._load_items_index()
         if data.id:
-            return get_item(self._client, self._product_id, data.id)
+            return self._items_by_id.get(data.id)
         elif data.mpn:
-            return get_item_by_mpn(self._client, self._product_id, data.mpn)
+            return self._items_by_mpn.get(data.mpn)
+
+    def _is_unchanged(self, item, data):
+        if item['status'] != 'published' and not self._find_unit(data):
+            return False
+        return is_unchanged(item, self._get_update_payload(item, data))
+
+    def _get_update_payload(self, item, data):
+        if item['status'] == 'published':
+            return {
+                'name': data.name,
+                'mpn': data.mpn,
+                'description': data.description,
+                'ui': {'visibility': True},
+            }
+        payload = self._get_item_payload(data)
+        if item['type'] == 'ppu':
+            del payload['period']
+        return payload
 
     def _get_item_payload(self, data):
         commitment = {
@@ -326,10 +344,15 @@ class ItemSynchronizer(ProductSynchronizer):
 
         return payload
 
-    @staticmethod
-    def _update_sheet_row(ws, row_idx, item):
-        ws.cell(row_idx, 1, value=item['id'])
-        ws.cell(row_idx, 3, value='-')
-        ws.cell(row_idx, 11, value=item['status'])
-        ws.cell(row_idx, 12, value=item['events']['created']['at'])
-        ws.cell(row_idx, 13, value=item['events'].get('updated', {}).get('at'))
+    def _update_sheet_row(self, row_idx, item):
+        cols = ITEMS_SCHEMA.col_idx
+        self._update_row(
+            row_idx,
+            {
+                cols['id']: item['id'],
+                cols['action']: '-',
+                cols['status']: item['status'],
+                cols['created']: item['events']['created']['at'],
+                cols['modified']: item['events'].get('updated', {}).get('at'),
+            },
+        )
@@ -2,134 +2,149 @@
 
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+import hashlib
+import json
 import os
-from collections import namedtuple
+import time
+from threading import Lock
 from urllib.parse import urlparse
 
-from tqdm import trange
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
-from connect.cli.plugins.product.constants import MEDIA_COLS_HEADERS
+from connect.cli.plugins.product.constants import (
+    MEDIA_CHECKSUMS_FILE,
+    MEDIA_DOWNLOAD_CHUNK_SIZE,
+)
+from connect.cli.plugins.product.schema import MEDIA_SCHEMA
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.client import ClientError
 
 
-fields = (v.replace(' ', '_').lower() for v in MEDIA_COLS_HEADERS.values())
-
-_RowData = namedtuple('RowData', fields)
-
-
 class MediaSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
+    def __init__(self, client, silent, session=None):
         self._media_path = None
-        super(MediaSynchronizer, self).__init__(client, silent)
+        self._checksums = {}
+        self._lock = Lock()
+        self.uploaded_bytes = 0
+        self.elapsed = 0
+        super(MediaSynchronizer, self).__init__(client, silent, session)
 
     def open(self, input_file, worksheet):
-        self._media_path = input_file.rsplit('/', 1)[0]
+        self._media_path = input_file if os.path.isdir(input_file) else input_file.rsplit('/', 1)[0]
+        self._checksums = self._load_checksums()
         return super(MediaSynchronizer, self).open(input_file, worksheet)
 
-    def sync(self):  # noqa: CCR001
-        ws = self._wb['Media']
-        errors = {}
-        skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
-
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
+    def sync(self):
+        started_at = time.monotonic()
+        outcomes, errors = self._sync_rows(self._sync_row)
+        self.elapsed = time.monotonic() - started_at
+        return (
+            outcomes['skipped'],
+            outcomes['created'],
+            outcomes['updated'],
+            outcomes['deleted'],
+            errors,
         )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 7)])
-            row_indexes.set_description(f'Processing Media {data.id or data.position or "New"}')
-
-            if data.action == '-':
-                skipped_count += 1
-                continue
-            row_errors = self._validate_row(data)
-
-            if row_errors:
-                errors[row_idx] = row_errors
-                continue
-            if data.action == 'delete':
-                try:
-                    self._client.products[self._product_id].media[data.id].delete()
-                    deleted_items.append(data)
-                    continue
-                except ClientError as e:
-                    if e.status_code == 404:
-                        deleted_items.append(data)
-                    else:
-                        errors[row_idx] = [str(e)]
-                    continue
-            if data.type == 'image':
-                payload = MultipartEncoder(
-                    fields={
-                        'type': (data.type, data.type),
-                        'position': (str(data.position), str(data.position)),
-                        'thumbnail': (
-                            data.image_file,
-                            open(
-                                os.path.join(
-                                    self._media_path,
-                                    'media',
-                                    data.image_file,
-                                ),
-                                "rb",
-                            ),
-                        ),
-                    },
-                )
-            else:
-                payload = MultipartEncoder(
-                    fields={
-                        'type': (data.type, data.type),
-                        'position': (str(data.position), str(data.position)),
-                        'thumbnail': (
-                            data.image_file,
-                            open(
-                                os.path.join(
-                                    self._media_path,
-                                    'media',
-                                    data.image_file,
-                                ),
-                                "rb",
-                            ),
-                        ),
-                        'url': data.video_url_location,
-                    },
-                )
+
+    def _sync_row(self, row_idx, data):
+        self._progress.set_description(f'Processing Media {data.id or data.position or "New"}')
+        if data.action == '-':
+            return 'skipped'
+        row_errors = self._validate_row(data)
+        if row_errors:
+            return row_errors
+
+        media = self._client.products[self._product_id].media
+        if data.action == 'delete':
             try:
-                if data.action == 'update':
-                    media = self._client.products[self._product_id].media[data.id].update(
-                        data=payload,
-                        headers={'Content-Type': payload.content_type},
-                    )
-                    self._update_sheet_row(ws, row_idx, media)
-                    updated_items.append(media)
-                else:
-                    media = self._client.products[self._product_id].media.create(
-                        data=payload,
-                        headers={'Content-Type': payload.content_type},
-                    )
-                    self._update_sheet_row(ws, row_idx, media)
-                    created_items.append(media)
-            except Exception as e:
-                errors[row_idx] = [str(e)]
+                media[data.id].delete()
+            except ClientError as e:
+                if e.status_code != 404:
+                    return [str(e)]
+            return 'deleted'
+
+        try:
+            if data.action == 'update':
+                result = self._upload(media[data.id].update, data, self._is_file_unchanged(data))
+            else:
+                result = self._upload(media.create, data)
+        except Exception as e:
+            return [str(e)]
+        self._update_sheet_row(row_idx, result)
+        return 'updated' if data.action == 'update' else 'created'
+
+    def _upload(self, send, data, file_unchanged=False):
+        fields = {
+            'type': (data.type, data.type),
+            'position': (str(data.position), str(data.position)),
+        }
+        if data.type == 'video':
+            fields['url'] = data.video_url_location
+        if file_unchanged:
+            return self._send(send, fields)
+        with open(self._get_file_path(data), 'rb') as f:
+            fields['thumbnail'] = (data.image_file, f)
+            result = self._send(send, fields)
+        self._session.update_checksums(
+            self._get_checksums_file(),
+            {data.image_file: self._get_checksum(data)},
+        )
+        return result
+
+    def _send(self, send, fields):
+        payload = MultipartEncoder(fields=fields)
+        result = send(
+            data=payload,
+            headers={'Content-Type': payload.content_type},
+        )
+        with self._lock:
+            self.uploaded_bytes += payload.len
+        return result
 
+    def _is_row_unchanged(self, row_idx, data):
         return (
-            skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
-            errors,
+            super(MediaSynchronizer, self)._is_row_unchanged(row_idx, data)
+            and self._is_file_unchanged(data)
         )
 
-    @staticmethod
-    def _update_sheet_row(ws, row_idx, media):
-        ws.cell(row_idx, 1, value=media['position'])
-        ws.cell(row_idx, 2, value=media['id'])
+    def _is_file_unchanged(self, data):
+        checksum = self._checksums.get(data.image_file)
+        if not checksum or not os.path.isfile(self._get_file_path(data)):
+            return False
+        return self._get_checksum(data) == checksum
+
+    def _get_checksum(self, data):
+        digest = hashlib.sha256()
+        with open(self._get_file_path(data), 'rb') as f:
+            for chunk in iter(lambda: f.read(MEDIA_DOWNLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _get_checksums_file(self):
+        return os.path.join(self._media_path, 'media', MEDIA_CHECKSUMS_FILE)
+
+    def _load_checksums(self):
+        checksums_file = self._get_checksums_file()
+        if not os.path.isfile(checksums_file):
+            return {}
+        try:
+            with open(checksums_file, 'r') as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+
+    def _get_file_path(self, data):
+        return os.path.join(self._media_path, 'media', data.image_file)
+
+    def _update_sheet_row(self, row_idx, media):
+        cols = MEDIA_SCHEMA.col_idx
+        self._update_row(
+            row_idx,
+            {
+                cols['position']: media['position'],
+                cols['id']: media['id'],
+            },
+        )
 
     def _validate_row(self, data):
         errors = []
@@ -147,7 +162,7 @@ class MediaSynchronizer(ProductSynchronizer):
             errors.append(
                 f'Media can be either image or video type, provided {data.type}',
             )
-        elif not os.path.isfile(os.path.join(self._media_path, 'media', data.image_file)):
+        elif not os.path.isfile(self._get_file_path(data)):
             errors.append(
                 f'Image file is not found, please check that file {data.image_file} exists '
                 'in media folder',
@@ -4,32 +4,29 @@
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 import json
 import re
-from collections import namedtuple
 from json.decoder import JSONDecodeError
 
-from tqdm import trange
 from openpyxl.styles import Alignment
 
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
 from connect.cli.plugins.product.constants import (
     PARAM_TYPES,
-    PARAMS_COLS_HEADERS,
 )
-from connect.cli.plugins.product.sync.base import ProductSynchronizer
-from connect.cli.plugins.product.utils import get_json_object_for_param, ParamSwitchNotSupported
+from connect.cli.plugins.product.schema import get_json_object_for_param, PARAMS_SCHEMA
+from connect.cli.plugins.product.sync.base import Change, is_unchanged, ProductSynchronizer
+from connect.cli.plugins.product.utils import ParamSwitchNotSupported
 from connect.client import ClientError
 
 
-fields = (v.replace(' ', '_').lower() for v in PARAMS_COLS_HEADERS.values())
-
-_RowData = namedtuple('RowData', fields)
+_PARAM_TYPES = frozenset(PARAM_TYPES)
 
 
 class ParamsSynchronizer(ProductSynchronizer):
-    def __init__(self, client, silent):
+    _row_key_fields = ('verbose_id', 'id')
+
+    def __init__(self, client, silent, session=None):
         self._param_type = None
         self._worksheet_name = None
-        super(ParamsSynchronizer, self).__init__(client, silent)
+        super(ParamsSynchronizer, self).__init__(client, silent, session)
 
     def open(self, input_file, worksheet):
         if worksheet == "Ordering Parameters":
@@ -41,107 +38,124 @@ class ParamsSynchronizer(ProductSynchronizer):
         self._worksheet_name = worksheet
         return super(ParamsSynchronizer, self).open(input_file, worksheet)
 
-    def sync(self):  # noqa: CCR001
-        ws = self._wb[self._worksheet_name]
-        errors = {}
-        skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
-
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 15)])
-            row_indexes.set_description(f'Processing param {data.id}')
-            if data.action == '-':
-                skipped_count += 1
-                continue
-            row_errors = self._validate_row(data)
-
-            if row_errors:
-                errors[row_idx] = row_errors
-                continue
-
-            if data.action == 'delete':
-                try:
-                    self._client.products[self._product_id].parameters[data.verbose_id].delete()
-                except ClientError:
-                    pass
-                deleted_items.append(data)
-                continue
-
-            param_payload = {}
-            if data.json_properties:
-                param_payload = json.loads(data.json_properties)
-            param_payload['name'] = data.id
-            param_payload['title'] = data.title
-            param_payload['description'] = data.description
-            param_payload['phase'] = data.phase
-            param_payload['scope'] = data.scope
-            param_payload['type'] = data.type
-            if 'constraints' not in param_payload:
-                param_payload['constraints'] = {}
-            param_payload['constraints']['required'] = False if data.required == '-' else True
-            param_payload['constraints']['unique'] = False if data.unique == '-' else True
-            param_payload['constraints']['hidden'] = False if data.hidden == '-' else True
-
-            if data.action == 'update':
-                try:
-                    original_param = self._client.products[self._product_id].parameters[
-                        data.verbose_id
-                    ].get()
-
-                    self._compare_param(original_param, data)
-
-                    param = self._client.products[self._product_id].parameters[
-                        data.verbose_id
-                    ].update(
-                        param_payload,
-                    )
-                    self._update_sheet_row(ws, row_idx, param)
-                    updated_items.append(param)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-
-            if data.action == 'create':
-                try:
-                    param = self._client.products[self._product_id].parameters.create(
-                        param_payload,
-                    )
-                    self._update_sheet_row(ws, row_idx, param)
-                    created_items.append(param)
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-
+    def sync(self):
+        outcomes, errors = self._sync_rows(self._sync_row)
         return (
-            skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            outcomes['skipped'],
+            outcomes['created'],
+            outcomes['updated'],
+            outcomes['deleted'],
             errors,
         )
 
+    def _sync_row(self, row_idx, data):  # noqa: CCR001
+        self._progress.set_description(f'Processing param {data.id}')
+        if data.action == '-':
+            return 'skipped'
+        change = self._plan_row(data)
+
+        if isinstance(change, list):
+            return change
+
+        if change.operation == 'no-op':
+            self._update_sheet_row(row_idx, change.current)
+            return 'skipped'
+
+        if change.operation == 'delete':
+            try:
+                self._client.products[self._product_id].parameters[data.verbose_id].delete()
+                self._drop_current('parameters', data.verbose_id)
+            except ClientError:
+                pass
+            return 'deleted'
+
+        param_payload = self._get_param_payload(data)
+
+        if change.operation == 'update':
+            try:
+                param = self._client.products[self._product_id].parameters[
+                    data.verbose_id
+                ].update(
+                    param_payload,
+                )
+                self._set_current('parameters', param)
+                self._update_sheet_row(row_idx, param)
+            except Exception as e:
+                return [str(e)]
+            return 'updated'
+
+        if change.operation == 'create':
+            try:
+                param = self._client.products[self._product_id].parameters.create(
+                    param_payload,
+                )
+                self._set_current('parameters', param)
+                self._update_sheet_row(row_idx, param)
+            except Exception as e:
+                return [str(e)]
+            return 'created'
+
+    def _plan_row(self, data):
+        row_errors = self._validate_row(data)
+
+        if row_errors:
+            return row_errors
+
+        if data.action != 'update':
+            return Change(data.action, None)
+
+        try:
+            original_param = self._get_current('parameters', data.verbose_id)
+        except ClientError as e:
+            return [str(e)]
+        if not original_param:
+            return [
+                f'Cannot update parameter {data.verbose_id} since does not exist in the product.',
+            ]
+        try:
+            self._compare_param(original_param, data)
+        except ParamSwitchNotSupported as e:
+            return [str(e)]
+
+        if is_unchanged(original_param, self._get_param_payload(data)):
+            return Change('no-op', original_param)
+        return Change('update', original_param)
+
     @staticmethod
-    def _update_sheet_row(ws, row_idx, param):
-        ws.cell(row_idx, 1, value=param['id']).alignment = Alignment(
-            horizontal='left',
-            vertical='top',
-        )
-        ws.cell(row_idx, 3, value='-')
-        ws.cell(row_idx, 12, value=get_json_object_for_param(param))
-        ws.cell(row_idx, 13, value=param['events']['created']['at']).alignment = Alignment(
-            horizontal='left',
-            vertical='top',
+    def _get_param_payload(data):
+        param_payload = {}
+        if data.json_properties:
+            param_payload = json.loads(data.json_properties)
+        param_payload['name'] = data.id
+        param_payload['title'] = data.title
+        param_payload['description'] = data.description
+        param_payload['phase'] = data.phase
+        param_payload['scope'] = data.scope
+        param_payload['type'] = data.type
+        if 'constraints' not in param_payload:
+            param_payload['constraints'] = {}
+        param_payload['constraints']['required'] = False if data.required == '-' else True
+        param_payload['constraints']['unique'] = False if data.unique == '-' else True
+        param_payload['constraints']['hidden'] = False if data.hidden == '-' else True
+        return param_payload
+
+    def _update_sheet_row(self, row_idx, param):
+        cols = PARAMS_SCHEMA.col_idx
+        self._update_row(
+            row_idx,
+            {
+                cols['verbose_id']: param['id'],
+                cols['created']: param['events']['created']['at'],
+                cols['modified']: param['events'].get('updated', {}).get('at'),
+            },
+            alignment=Alignment(horizontal='left', vertical='top'),
         )
-        ws.cell(
+        self._update_row(
             row_idx,
-            14,
-            value=param['events'].get('updated', {}).get('at'),
-        ).alignment = Alignment(
-            horizontal='left',
-            vertical='top',
+            {
+                cols['action']: '-',
+                cols['json_properties']: get_json_object_for_param(param),
+            },
         )
 
     @staticmethod
@@ -179,7 +193,7 @@ class ParamsSynchronizer(ProductSynchronizer):
             errors.append(
                 'Verbose ID is required on update and delete actions.',
             )
-        elif data.type not in PARAM_TYPES:
+        elif data.type not in _PARAM_TYPES:
             errors.append(
                 f'Parameter type {data.type} is not one of the supported ones:'
                 f'{",".join(PARAM_TYPES)}',
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class SyncScheduler:
+    def __init__(self, workers):
+        self._workers = workers
+        self._tasks = {}
+
+    def add(self, name, task, depends_on=()):
+        for dependency in depends_on:
+            if dependency not in self._tasks:
+                raise ValueError(f'Task {name} depends on unknown task {dependency}.')
+        self._tasks[name] = task, tuple(depends_on)
+
+    def run(self):
+        results = {}
+        pending = dict(self._tasks)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            while pending or running:
+                for name, (task, depends_on) in list(pending.items()):
+                    if all(dependency in results for dependency in depends_on):
+                        running[executor.submit(task)] = name
+                        del pending[name]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+        return [results[name] for name in self._tasks]
@@ -1,35 +1,21 @@
-from collections import namedtuple
 from urllib.parse import urlparse
 
-from tqdm import trange
-
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
-from connect.cli.plugins.product.constants import STATIC_LINK_HEADERS
 from connect.cli.plugins.product.sync.base import ProductSynchronizer
 from connect.cli.plugins.product.utils import cleanup_product_for_update
 
 
-fields = (v.replace(' ', '_').lower() for v in STATIC_LINK_HEADERS.values())
-
-_RowData = namedtuple('RowData', fields)
-
-
 class StaticResourcesSynchronizer(ProductSynchronizer):
     def sync(self):  # noqa: CCR001
-        ws = self._wb['Embedding Static Resources']
         errors = {}
         skipped_count = 0
         created_items = []
         deleted_items = []
 
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
+        rows = self._iter_rows()
         download = []
         documentation = []
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 5)])
-            row_indexes.set_description(f'Processing item {data.title or data.type}')
+        for row_idx, data in rows:
+            rows.set_description(f'Processing item {data.title or data.type}')
             if data.action not in ('-', 'create', 'delete'):
                 skipped_count += 1
                 continue
@@ -3,111 +3,110 @@
 # This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
 # Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
 
-from collections import namedtuple
-
-from tqdm import trange
-
-from connect.cli.core.constants import DEFAULT_BAR_FORMAT
-from connect.cli.plugins.product.constants import TEMPLATES_HEADERS
-from connect.cli.plugins.product.sync.base import ProductSynchronizer
+from connect.cli.plugins.product.schema import TEMPLATES_SCHEMA
+from connect.cli.plugins.product.sync.base import Change, is_unchanged, ProductSynchronizer
 from connect.client import ClientError
 
-fields = (v.replace(' ', '_').lower() for v in TEMPLATES_HEADERS.values())
-
-_RowData = namedtuple('RowData', fields)
-
 
 class TemplatesSynchronizer(ProductSynchronizer):
-    def sync(self):  # noqa: CCR001
-        ws = self._wb["Templates"]
-        errors = {}
-        skipped_count = 0
-        created_items = []
-        updated_items = []
-        deleted_items = []
-
-        row_indexes = trange(
-            2, ws.max_row + 1, disable=self._silent, leave=True, bar_format=DEFAULT_BAR_FORMAT,
-        )
-        for row_idx in row_indexes:
-            data = _RowData(*[ws.cell(row_idx, col_idx).value for col_idx in range(1, 9)])
-            row_indexes.set_description(f'Processing Template {data.id or data.title}')
-            if data.action == '-':
-                skipped_count += 1
-                continue
-            row_errors = self._validate_row(data)
-            if row_errors:
-                errors[row_idx] = row_errors
-                continue
-            template_data = {
-                'name': data.title,
-                'scope': data.scope,
-                'body': data.content,
-                'type': data.type,
-            }
-            if data.scope == 'asset':
-                template_data['title'] = data.title
-            if data.action == 'create':
-                row_indexes.set_description(f"Creating template {data[1]}")
-                try:
-                    template = self._create_template(template_data)
-                    created_items.append(template)
-                    self._update_sheet_row(ws, row_idx, template)
-                    continue
-                except Exception as e:
-                    errors[row_idx] = [str(e)]
-                    continue
-            try:
-                current = self._client.products[self._product_id].templates[data.id].get()
-            except ClientError as e:
-                if data.action == 'delete':
-                    if e.status_code == 404:
-                        deleted_items.append(data)
-                        continue
-                    errors[row_idx] = [str(e)]
-                    continue
-                errors[row_idx] = [
-                    f'Cannot {data.action} template {data.id} since does not exist in the product.'
-                    'Create it instead',
-                ]
-                continue
-            if current['type'] != data.type or current['scope'] != data.scope:
-                errors[row_idx] = [
-                    f'Switching scope or type is not supported. '
-                    f'Original scope {current["scope"]}, requested scope {data.scope}. '
-                    f'Original type {current["type"]}, requested type {data.type}',
-                ]
-                continue
-            try:
-                if data.action == 'update':
-                    template = self._update_template(data.id, template_data)
-                    updated_items.append(template)
-                    self._update_sheet_row(ws, row_idx, template)
-                if data.action == 'delete':
-                    self._client.products[self._product_id].templates[data.id].delete()
-                    deleted_items.append(data)
-
-            except Exception as e:
-                errors[row_idx] = [str(e)]
+    def sync(self):
+        outcomes, errors = self._sync_rows(self._sync_row)
         return (
-            skipped_count,
-            len(created_items),
-            len(updated_items),
-            len(deleted_items),
+            outcomes['skipped'],
+            outcomes['created'],
+            outcomes['updated'],
+            outcomes['deleted'],
             errors,
         )
 
+    def _sync_row(self, row_idx, data):  # noqa: CCR001
+        self._progress.set_description(f'Processing Template {data.id or data.title}')
+        if data.action == '-':
+            return 'skipped'
+        change = self._plan_row(data)
+        if isinstance(change, list):
+            return change
+        if change.operation == 'create':
+            self._progress.set_description(f"Creating template {data[1]}")
+            try:
+                template = self._create_template(self._get_template_payload(data))
+                self._update_sheet_row(row_idx, template)
+            except Exception as e:
+                return [str(e)]
+            return 'created'
+        if change.operation == 'no-op':
+            if data.action == 'delete':
+                return 'deleted'
+            self._update_sheet_row(row_idx, change.current)
+            return 'skipped'
+        try:
+            if change.operation == 'update':
+                template = self._update_template(data.id, self._get_template_payload(data))
+                self._set_current('templates', template)
+                self._update_sheet_row(row_idx, template)
+                return 'updated'
+            if change.operation == 'delete':
+                self._client.products[self._product_id].templates[data.id].delete()
+                self._drop_current('templates', data.id)
+                return 'deleted'
+        except Exception as e:
+            return [str(e)]
+
+    def _plan_row(self, data):  # noqa: CCR001
+        row_errors = self._validate_row(data)
+        if row_errors:
+            return row_errors
+        if data.action == 'create':
+            return Change('create', None)
+        try:
+            current = self._get_current('templates', data.id)
+        except ClientError as e:
+            return [str(e)]
+        if not current:
+            if data.action == 'delete':
+                return Change('no-op', None)
+            return [
+                f'Cannot {data.action} template {data.id} since does not exist in the product.'
+                'Create it instead',
+            ]
+        if current['type'] != data.type or current['scope'] != data.scope:
+            return [
+                f'Switching scope or type is not supported. '
+                f'Original scope {current["scope"]}, requested scope {data.scope}. '
+                f'Original type {current["type"]}, requested type {data.type}',
+            ]
+        if data.action == 'update' and is_unchanged(current, self._get_template_payload(data)):
+            return Change('no-op', current)
+        return Change(data.action, current)
+
+    @staticmethod
+    def _get_template_payload(data):
+        template_data = {
+            'name': data.title,
+            'scope': data.scope,
+            'body': data.content,
+            'type': data.type,
+        }
+        if data.scope == 'asset':
+            template_data['title'] = data.title
+        return template_data
+
     def _create_template(self, template_data):
         return self._client.products[self._product_id].templates.create(template_data)
 
     def _update_template(self, tl_id, template_data):
         return self._client.products[self._product_id].templates[tl_id].update(template_data)
 
-    @staticmethod
-    def _update_sheet_row(ws, row_idx, template):
-        ws.cell(row_idx, 1, value=template['id'])
-        ws.cell(row_idx, 7, value=template['events']['created']['at'])
-        ws.cell(row_idx, 8, value=template['events'].get('updated', {}).get('at'))
+    def _update_sheet_row(self, row_idx, template):
+        cols = TEMPLATES_SCHEMA.col_idx
+        self._update_row(
+            row_idx,
+            {
+                cols['id']: template['id'],
+                cols['created']: template['events']['created']['at'],
+                cols['modified']: template['events'].get('updated', {}).get('at'),
+            },
+        )
 
     @staticmethod
     def _validate_row(data):
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+from threading import Lock
+
+from connect.cli.plugins.product.api import create_unit
+
+
+_RESOLVERS = {}
+_RESOLVERS_LOCK = Lock()
+
+
+class UnitResolver:
+    def __init__(self, client):
+        self._client = client
+        self._by_id = None
+        self._by_description = None
+        self._lock = Lock()
+
+    def load(self):
+        with self._lock:
+            if self._by_id is None:
+                self._by_id = {}
+                self._by_description = {}
+                for unit in self._client.ns('settings').units.all():
+                    self._add(unit)
+
+    def resolve(self, unit, item_type):
+        self.load()
+        if unit in self._by_id:
+            return unit
+        found = self._by_description.get((item_type, unit))
+        if found:
+            return found['id']
+
+    def get_or_create(self, unit, item_type):
+        unit_id = self.resolve(unit, item_type)
+        if unit_id:
+            return unit_id
+        with self._lock:
+            found = self._by_description.get((item_type, unit))
+            if found:
+                return found['id']
+            created = create_unit(
+                self._client,
+                {
+                    'description': unit,
+                    'type': item_type,
+                    'unit': 'unit' if item_type == 'reservation' else 'unit-h',
+                },
+            )
+            self._add(created, (item_type, unit))
+        return created['id']
+
+    def _add(self, unit, key=None):
+        self._by_id[unit['id']] = unit
+        self._by_description.setdefault(key or (unit['type'], unit['description']), unit)
+
+
+def get_unit_resolver(client):
+    with _RESOLVERS_LOCK:
+        key = client.endpoint, client.api_key
+        if key not in _RESOLVERS:
+            _RESOLVERS[key] = UnitResolver(client)
+        return _RESOLVERS[key]
+
+
+def clear_unit_resolvers():
+    with _RESOLVERS_LOCK:
+        _RESOLVERS.clear()
@@ -1,79 +1,21 @@
-import json
 from copy import deepcopy
 
-from connect.cli.plugins.product.constants import (
-    ACTIONS_HEADERS,
-    CAPABILITIES_COLS_HEADERS,
-    CONFIGURATION_HEADERS,
-    ITEMS_COLS_HEADERS,
-    MEDIA_COLS_HEADERS,
-    PARAMS_COLS_HEADERS,
-    STATIC_LINK_HEADERS,
-    TEMPLATES_HEADERS,
-)
+from connect.cli.plugins.product.schema import SCHEMAS, SHEET_TYPES
 
 
 def get_col_limit_by_ws_type(ws_type):
-    if ws_type == 'items':
-        return 'M'
-    elif ws_type == 'params':
-        return 'N'
-    elif ws_type == 'media':
-        return 'F'
-    elif ws_type == 'capabilities':
-        return 'C'
-    elif ws_type == 'static_links':
-        return 'D'
-    elif ws_type == 'templates':
-        return 'H'
-    elif ws_type == 'configurations':
-        return 'I'
-    elif ws_type == 'actions':
-        return 'I'
+    if ws_type in SCHEMAS:
+        return SCHEMAS[ws_type].col_limit
     return 'Z'
 
 
 def get_ws_type_by_worksheet_name(ws_name):
-    if ws_name == 'Items':
-        return 'items'
-    elif ws_name == "Ordering Parameters":
-        return 'params'
-    elif ws_name == 'Fulfillment Parameters':
-        return 'params'
-    elif ws_name == 'Configuration Parameters':
-        return 'params'
-    elif ws_name == 'Media':
-        return 'media'
-    elif ws_name == 'Capabilities':
-        return 'capabilities'
-    elif ws_name == 'Embedding Static Resources':
-        return 'static_links'
-    elif ws_name == 'Templates':
-        return 'templates'
-    elif ws_name == 'Configuration':
-        return 'configurations'
-    elif ws_name == 'Actions':
-        return 'actions'
-    return None
+    return SHEET_TYPES.get(ws_name)
 
 
 def get_col_headers_by_ws_type(ws_type):
-    if ws_type == 'items':
-        return ITEMS_COLS_HEADERS
-    elif ws_type == 'params':
-        return PARAMS_COLS_HEADERS
-    elif ws_type == 'media':
-        return MEDIA_COLS_HEADERS
-    elif ws_type == 'capabilities':
-        return CAPABILITIES_COLS_HEADERS
-    elif ws_type == 'static_links':
-        return STATIC_LINK_HEADERS
-    elif ws_type == 'templates':
-        return TEMPLATES_HEADERS
-    elif ws_type == 'configurations':
-        return CONFIGURATION_HEADERS
-    elif ws_type == 'actions':
-        return ACTIONS_HEADERS
+    if ws_type in SCHEMAS:
+        return SCHEMAS[ws_type].headers
 
 
 def cleanup_product_for_update(product):
@@ -85,22 +27,156 @@ def cleanup_product_for_update(product):
     return product
 
 
-def get_json_object_for_param(original_param):
-    param = deepcopy(original_param)
-    del param['id']
-    del param['name']
-    del param['title']
-    del param['description']
-    del param['phase']
-    del param['scope']
-    del param['type']
-    del param['constraints']['required']
-    del param['constraints']['unique']
-    del param['constraints']['hidden']
-    del param['position']
-    del param['events']
-
-    return json.dumps(param, indent=4, sort_keys=True)
+def apply_capability(product, data):
+    capabilities = deepcopy(product['capabilities'])
+    _set_capability(product, data)
+    return product['capabilities'] != capabilities
+
+
+def _set_capability(product, data):  # noqa: CCR001
+    if data.capability == 'Pay-as-you-go support and schema':
+        if data.value != 'Disabled':
+            if not product['capabilities']['ppu']:
+                product['capabilities']['ppu'] = {
+                    'schema': data.value,
+                    'dynamic': False,
+                    'future': False,
+                }
+            else:
+                product['capabilities']['ppu']['schema'] = data.value
+        else:
+            product['capabilities']['ppu'] = None
+    if data.capability == 'Pay-as-you-go dynamic items support':
+        if not product['capabilities']['ppu']:
+            if data.value == 'Enabled':
+                raise Exception(
+                    "Dynamic items support can't be enabled without Pay-as-you-go "
+                    "support",
+                )
+            return False
+        else:
+            if data.value == 'Enabled':
+                product['capabilities']['ppu']['dynamic'] = True
+            else:
+                product['capabilities']['ppu']['dynamic'] = False
+    if data.capability == "Pay-as-you-go future charges support":
+        if not product['capabilities']['ppu']:
+            if data.value == 'Enabled':
+                raise Exception(
+                    "Report of future charges can't be enabled without Pay-as-you-go "
+                    "support",
+                )
+            return False
+
+        else:
+            if data.value == 'Enabled':
+                product['capabilities']['ppu']['future'] = True
+            else:
+                product['capabilities']['ppu']['future'] = False
+    if data.capability == 'Consumption reporting for Reservation Items':
+        if data.value == 'Enabled':
+            product['capabilities']['reservation']['consumption'] = True
+        else:
+            product['capabilities']['reservation']['consumption'] = False
+
+    if data.capability == 'Dynamic Validation of the Draft Requests':
+        if data.value == 'Enabled':
+            product['capabilities']['cart']['validation'] = True
+        else:
+            product['capabilities']['cart']['validation'] = False
+
+    if data.capability == 'Dynamic Validation of the Inquiring Form':
+        if data.value == 'Enabled':
+            product['capabilities']['inquiring']['validation'] = True
+        else:
+            product['capabilities']['inquiring']['validation'] = False
+
+    if data.capability == 'Reseller Authorization Level':
+        if data.value == 'Disabled':
+            product['capabilities']['tiers']['configs'] = None
+        else:
+            product['capabilities']['tiers']['configs'] = {
+                'level': data.value,
+            }
+    if data.capability == 'Tier Accounts Sync':
+        if data.value == 'Enabled':
+            product['capabilities']['tiers']['updates'] = True
+        else:
+            product['capabilities']['tiers']['updates'] = False
+    if data.capability == 'Administrative Hold':
+        if data.value == 'Enabled':
+            product['capabilities']['subscription']['hold'] = True
+        else:
+            product['capabilities']['subscription']['hold'] = False
+    if data.capability == 'Dynamic Validation of Tier Requests':
+        if data.value == 'Enabled':
+            product['capabilities']['tiers']['validation'] = True
+        else:
+            product['capabilities']['tiers']['validation'] = False
+    if data.capability == 'Editable Ordering Parameters in Change Request':
+        if data.value == 'Enabled':
+            product[
+                'capabilities'
+            ][
+                'subscription'
+            ][
+                'change'
+            ][
+                'editable_ordering_parameters'
+            ] = True
+        else:
+            product[
+                'capabilities'
+            ][
+                'subscription'
+            ][
+                'change'
+            ][
+                'editable_ordering_parameters'
+            ] = False
+    if data.capability == 'Validation of Draft Change Request':
+        if data.value == 'Enabled':
+            product[
+                'capabilities'
+            ][
+                'subscription'
+            ][
+                'change'
+            ][
+                'validation'
+            ] = True
+        else:
+            product[
+                'capabilities'
+            ][
+                'subscription'
+            ][
+                'change'
+            ][
+                'validation'
+            ] = False
+    if data.capability == 'Validation of inquiring form for Change Requests':
+        if data.value == 'Enabled':
+            product[
+                'capabilities'
+            ][
+                'subscription'
+            ][
+                'change'
+            ][
+                'inquiring_validation'
+            ] = True
+        else:
+            product[
+                'capabilities'
+            ][
+                'subscription'
+            ][
+                'change'
+            ][
+                'inquiring_validation'
+            ] = False
+    return True
 
 
 class ParamSwitchNotSupported(Exception):
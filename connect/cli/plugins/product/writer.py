@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of the Ingram Micro Cloud Blue Connect connect-cli.
+# Copyright (c) 2019-2021 Ingram Micro. All Rights Reserved.
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.styles.colors import Color, WHITE
+
+
+TITLE_STYLE = 'ccli_title'
+HEADER_STYLE = 'ccli_header'
+LABEL_STYLE = 'ccli_label'
+LABEL_TOP_STYLE = 'ccli_label_top'
+ICON_LABEL_STYLE = 'ccli_icon_label'
+LABEL_WRAP_STYLE = 'ccli_label_wrap'
+TOP_LEFT_STYLE = 'ccli_top_left'
+WRAP_STYLE = 'ccli_wrap'
+
+
+def _get_named_styles():
+    top_left = Alignment(horizontal='left', vertical='top')
+    wrap = Alignment(wrap_text=True)
+    return (
+        NamedStyle(
+            name=TITLE_STYLE,
+            fill=PatternFill('solid', start_color=Color('1565C0')),
+            font=Font(sz=24, color=WHITE),
+            alignment=Alignment(horizontal='center', vertical='center'),
+        ),
+        NamedStyle(name=HEADER_STYLE, fill=PatternFill('solid', Color('d3d3d3'))),
+        NamedStyle(name=LABEL_STYLE, font=Font(sz=12)),
+        NamedStyle(name=LABEL_TOP_STYLE, font=Font(sz=12), alignment=top_left),
+        NamedStyle(name=ICON_LABEL_STYLE, font=Font(sz=14)),
+        NamedStyle(name=LABEL_WRAP_STYLE, font=Font(sz=12), alignment=wrap),
+        NamedStyle(name=TOP_LEFT_STYLE, alignment=top_left),
+        NamedStyle(name=WRAP_STYLE, alignment=wrap),
+    )
+
+
+def create_workbook():
+    wb = Workbook(write_only=True)
+    for style in _get_named_styles():
+        wb.add_named_style(style)
+    return wb
+
+
+class SheetWriter:
+    def __init__(self, wb, title):
+        self._ws = wb.create_sheet(title)
+        self.row_idx = 1
+
+    @property
+    def worksheet(self):
+        return self._ws
+
+    def set_column_width(self, column_letter, width, auto_size=False):
+        self._ws.column_dimensions[column_letter].width = width
+        if auto_size:
+            self._ws.column_dimensions[column_letter].auto_size = True
+
+    def hide_column(self, column_letter):
+        self._ws.column_dimensions[column_letter].hidden = True
+
+    def merge_cells(self, range_string):
+        self._ws.merged_cells.add(range_string)
+
+    def add_data_validation(self, data_validation):
+        self._ws.data_validations.append(data_validation)
+
+    def append(self, values, styles=()):
+        row = []
+        for col_idx, value in enumerate(values):
+            style = styles[col_idx] if col_idx < len(styles) else None
+            if style is None:
+                row.append(value)
+                continue
+            cell = WriteOnlyCell(self._ws, value=value)
+            cell.style = style
+            row.append(cell)
+        self._ws.append(row)
+        self.row_idx += 1
+        return self.row_idx - 1
@@ -11,6 +11,7 @@ from openpyxl import load_workbook
 from connect.cli.core.config import Config
 from connect.cli.core.base import cli
 from connect.cli.core.plugins import load_plugins
+from connect.cli.plugins.product.sync.units import clear_unit_resolvers
 
 from tests.data import CONFIG_DATA
 
@@ -20,6 +21,12 @@ def fs():
     return TempFS()
 
 
+@pytest.fixture(autouse=True)
+def unit_resolvers():
+    yield
+    clear_unit_resolvers()
+
+
 @pytest.fixture(scope='session')
 def ccli():
     load_plugins(cli)
@@ -0,0 +1,19 @@
+from connect.cli.core.datavalidation import RangeDataValidation
+
+
+def test_add_contiguous_cells():
+    validation = RangeDataValidation(type='list', formula1='"-,create"', allow_blank=False)
+    for row_idx in range(2, 5001):
+        validation.add(f'C{row_idx}')
+        validation.add(f'I{row_idx}')
+
+    assert str(validation.sqref) == 'C2:C5000 I2:I5000'
+
+
+def test_add_gaps_and_duplicates():
+    validation = RangeDataValidation(type='list', formula1='"-,create"', allow_blank=False)
+    for coordinate in ('G2', 'G3', 'G5', 'G3', 'G6', 'G2', 'B8'):
+        validation.add(coordinate)
+
+    assert str(validation.sqref) == 'B8 G2:G3 G5:G6'
+    assert 'G6' in validation
@@ -1,4 +1,9 @@
+import os
+
+from openpyxl import load_workbook
+
 from connect.cli.plugins.product.sync.actions import ActionsSynchronizer
+from connect.cli.plugins.product.sync.base import SyncSession
 from connect.client import ConnectClient
 
 
@@ -221,6 +226,7 @@ def test_delete_500(fs, get_sync_actions_env, mocked_responses):
 
 def test_update(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
     get_sync_actions_env['Actions']['C2'] = 'update'
+    get_sync_actions_env['Actions']['E2'] = 'Updated title'
 
     response = mocked_actions_response[0]
 
@@ -235,6 +241,12 @@ def test_update(fs, get_sync_actions_env, mocked_responses, mocked_actions_respo
         silent=True,
     )
 
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions?limit=100&offset=0',
+        json=[mocked_actions_response[0]],
+    )
+
     mocked_responses.add(
         method='PUT',
         url='https://localhost/public/v1/products/PRD-276-377-545/actions/ACT-276-377-545-001',
@@ -252,8 +264,40 @@ def test_update(fs, get_sync_actions_env, mocked_responses, mocked_actions_respo
     assert errors == {}
 
 
+def test_update_unchanged(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    get_sync_actions_env['Actions']['C2'] = 'update'
+
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = ActionsSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions?limit=100&offset=0',
+        json=[mocked_actions_response[0]],
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert created == 0
+    assert updated == 0
+    assert deleted == 0
+    assert errors == {}
+
+
 def test_update_500(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
     get_sync_actions_env['Actions']['C2'] = 'update'
+    get_sync_actions_env['Actions']['E2'] = 'Updated title'
 
     get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
 
@@ -266,6 +310,12 @@ def test_update_500(fs, get_sync_actions_env, mocked_responses, mocked_actions_r
         silent=True,
     )
 
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions?limit=100&offset=0',
+        json=[mocked_actions_response[0]],
+    )
+
     mocked_responses.add(
         method='PUT',
         url='https://localhost/public/v1/products/PRD-276-377-545/actions/ACT-276-377-545-001',
@@ -347,3 +397,108 @@ def test_create_500(fs, get_sync_actions_env, mocked_responses, mocked_actions_r
     assert updated == 0
     assert deleted == 0
     assert errors == {2: ['500 Internal Server Error']}
+
+
+def test_sync_concurrent(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    ws = get_sync_actions_env['Actions']
+    template = [cell.value for cell in ws[2]]
+    for row_idx in range(2, 12):
+        row = list(template)
+        if row_idx % 2:
+            row[0] = f'ACT-276-377-545-{row_idx:03d}'
+            row[2] = 'delete'
+        else:
+            row[0] = None
+            row[1] = f'action_{row_idx}'
+            row[2] = 'create'
+        for col_idx, value in enumerate(row, start=1):
+            ws.cell(row_idx, col_idx, value=value)
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+        json=mocked_actions_response[0],
+    )
+    for row_idx in range(3, 12, 2):
+        mocked_responses.add(
+            method='DELETE',
+            url=f'https://localhost/public/v1/products/PRD-276-377-545/actions/ACT-276-377-545-{row_idx:03d}',
+            status=500,
+        )
+
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx', jobs=4)
+    synchronizer = ActionsSynchronizer(client, True, session)
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+    session.save()
+
+    assert skipped == 0
+    assert created == 5
+    assert updated == 0
+    assert deleted == 0
+    assert errors == {row_idx: ['500 Internal Server Error'] for row_idx in range(3, 12, 2)}
+    ws = load_workbook(f'{fs.root_path}/test.xlsx')['Actions']
+    for row_idx in range(2, 12, 2):
+        assert ws.cell(row_idx, 1).value == mocked_actions_response[0]['id']
+    for row_idx in range(3, 12, 2):
+        assert ws.cell(row_idx, 1).value == f'ACT-276-377-545-{row_idx:03d}'
+
+
+def test_sync_resume(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    ws = get_sync_actions_env['Actions']
+    template = [cell.value for cell in ws[2]]
+    for row_idx in (2, 3):
+        for col_idx, value in enumerate(template, start=1):
+            ws.cell(row_idx, col_idx, value=value)
+        ws.cell(row_idx, 1, value=None)
+        ws.cell(row_idx, 2, value=f'action_{row_idx}')
+        ws.cell(row_idx, 3, value='create')
+    get_sync_actions_env.save(f'{fs.root_path}/test.xlsx')
+
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    for response in mocked_actions_response[:2]:
+        mocked_responses.add(
+            method='POST',
+            url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+            json=response,
+            status=500 if response is mocked_actions_response[1] else 200,
+        )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+        json=mocked_actions_response[1],
+    )
+
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx')
+    synchronizer = ActionsSynchronizer(client, True, session)
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+    _, created, _, _, errors = synchronizer.sync()
+    session.close()
+
+    assert created == 1
+    assert errors == {3: ['500 Internal Server Error']}
+
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx', resume=True)
+    synchronizer = ActionsSynchronizer(client, True, session)
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Actions')
+    _, created, _, _, errors = synchronizer.sync()
+    session.save()
+
+    assert created == 2
+    assert errors == {}
+    assert len([call for call in mocked_responses.calls if call.request.method == 'POST']) == 3
+    ws = load_workbook(f'{fs.root_path}/test.xlsx')['Actions']
+    assert ws['A2'].value == mocked_actions_response[0]['id']
+    assert ws['A3'].value == mocked_actions_response[1]['id']
+    assert not os.path.isfile(f'{fs.root_path}/test.journal')
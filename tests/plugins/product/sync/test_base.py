@@ -1,14 +1,16 @@
 import os
 from shutil import copy2
+from threading import Event, Thread
 
 import pytest
 
 from click import ClickException
 
 from openpyxl import load_workbook
+from openpyxl.styles import Alignment
 
 from connect.cli.plugins.exceptions import SheetNotFoundError
-from connect.cli.plugins.product.sync.base import ProductSynchronizer
+from connect.cli.plugins.product.sync.base import ProductSynchronizer, SyncSession
 from connect.client import ConnectClient
 
 
@@ -180,3 +182,139 @@ def test_save(fs, mocked_responses, mocked_product_response):
     synchronizer.save(f'{fs.root_path}//test.xlsx')
 
     assert os.path.isfile(f'{fs.root_path}/test.xlsx')
+
+
+def test_open_shared_session(fs, mocked_responses, mocked_product_response):
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    session = SyncSession(client, './tests/fixtures/comparation_product.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545',
+        json=mocked_product_response,
+    )
+
+    items = ProductSynchronizer(client, silent=True, session=session)
+    actions = ProductSynchronizer(client, silent=True, session=session)
+    items.open('./tests/fixtures/comparation_product.xlsx', 'Items')
+    actions.open('./tests/fixtures/comparation_product.xlsx', 'Actions')
+
+    assert items._wb is actions._wb is session.workbook
+    assert len(mocked_responses.calls) == 1
+
+    session.save(f'{fs.root_path}/test.xlsx')
+
+    assert os.path.isfile(f'{fs.root_path}/test.xlsx')
+
+
+def test_session_iter_rows():
+    session = SyncSession(None, './tests/fixtures/comparation_product.xlsx')
+
+    rows = list(session.iter_rows('Items'))
+
+    assert session.count_rows('Items') == 18
+    assert len(rows) == 18
+    row_idx, data = rows[0]
+    assert row_idx == 2
+    assert data.id == 'PRD-276-377-545-0001'
+    assert data.action == '-'
+    assert not session.has_changes('Items')
+    session.close()
+
+
+def test_session_deferred_update(fs):
+    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
+    wb['Actions']['C2'] = 'create'
+    wb.save(f'{fs.root_path}/test.xlsx')
+    session = SyncSession(None, f'{fs.root_path}/test.xlsx')
+
+    assert session.has_changes('Actions')
+
+    session.update_row('Actions', 2, {1: 'ACT-001', 3: '-'})
+    session.save()
+
+    ws = load_workbook(f'{fs.root_path}/test.xlsx')['Actions']
+    assert ws['A2'].value == 'ACT-001'
+    assert ws['C2'].value == '-'
+
+
+def test_session_journal_resume(fs):
+    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
+    wb['Actions']['C2'] = 'create'
+    wb.save(f'{fs.root_path}/test.xlsx')
+    session = SyncSession(None, f'{fs.root_path}/test.xlsx')
+    session.update_row('Actions', 2, {1: 'ACT-001', 3: '-'})
+    session.update_row('Actions', 2, {8: '2021-01-01'}, alignment=Alignment(horizontal='left'))
+    session.journal_row('Actions', 2, 'created')
+    session.close()
+
+    assert os.path.isfile(f'{fs.root_path}/test.journal')
+
+    session = SyncSession(None, f'{fs.root_path}/test.xlsx', resume=True)
+
+    assert session.replay_row('Actions', 3) is None
+    assert session.replay_row('Actions', 2) == 'created'
+
+    session.save()
+
+    ws = load_workbook(f'{fs.root_path}/test.xlsx')['Actions']
+    assert ws['A2'].value == 'ACT-001'
+    assert ws['C2'].value == '-'
+    assert ws['H2'].alignment.horizontal == 'left'
+    assert not os.path.isfile(f'{fs.root_path}/test.journal')
+
+
+def test_session_journal_flush_does_not_block_updates(fs, mocker):
+    fsync_started = Event()
+    release_fsync = Event()
+
+    def fsync(fileno):
+        fsync_started.set()
+        release_fsync.wait(5)
+
+    mocker.patch('connect.cli.plugins.product.sync.base.os.fsync', side_effect=fsync)
+    session = SyncSession(None, f'{fs.root_path}/test.xlsx')
+    journal = Thread(target=session.journal_row, args=('Actions', 2, 'created'))
+    journal.start()
+    fsync_started.wait(5)
+
+    update = Thread(target=session.update_row, args=('Actions', 3, {1: 'ACT-002'}))
+    update.start()
+    update.join(1)
+    updated = not update.is_alive()
+    release_fsync.set()
+    journal.join()
+
+    assert updated
+    session.close()
+
+
+def test_session_journal_without_resume(fs):
+    with open(f'{fs.root_path}/test.journal', 'w') as fp:
+        fp.write('{"worksheet": "Actions", "row": 2, "outcome": "created", "cells": []}\n')
+
+    session = SyncSession(None, f'{fs.root_path}/test.xlsx')
+
+    assert session.replay_row('Actions', 2) is None
+
+
+def test_session_journal_without_resume_refused(fs):
+    with open(f'{fs.root_path}/test.journal', 'w') as fp:
+        fp.write('{"worksheet": "Actions", "row": 2, "outcome": "created", "cells": []}\n')
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+
+    with pytest.raises(ClickException) as e:
+        SyncSession(client, f'{fs.root_path}/test.xlsx')
+
+    assert 'run the synchronization again with --resume' in str(e.value)
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx', resume=True)
+    assert session.replay_row('Actions', 2) == 'created'
+    with open(f'{fs.root_path}/test.journal') as fp:
+        assert len(fp.readlines()) == 1
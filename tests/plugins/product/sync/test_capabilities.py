@@ -1,3 +1,4 @@
+import json
 from copy import deepcopy
 
 import pytest
@@ -282,8 +283,8 @@ def test_ppu_dynamic_items_no_ppu_no_enabled(
 
     skipped, updated, errors = synchronizer.sync()
 
-    assert skipped == 8
-    assert updated == 1
+    assert skipped == 9
+    assert updated == 0
     assert errors == {}
 
 
@@ -356,6 +357,15 @@ def test_ppu_disable_dynamic(
         json=response,
     )
 
+    with open('./tests/fixtures/product_response_modifications.json') as prod_response:
+        product = json.load(prod_response)
+    product['capabilities']['ppu'] = {'schema': 'QT', 'dynamic': True}
+    mocked_responses.replace(
+        'GET',
+        'https://localhost/public/v1/products/PRD-276-377-545',
+        json=product,
+    )
+
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
     skipped, updated, errors = synchronizer.sync()
@@ -416,8 +426,8 @@ def test_ppu_future_no_ppu_no_enabled(
 
     skipped, updated, errors = synchronizer.sync()
 
-    assert skipped == 8
-    assert updated == 1
+    assert skipped == 9
+    assert updated == 0
     assert errors == {}
 
 
@@ -490,6 +500,15 @@ def test_ppu_disable_future(
         json=response,
     )
 
+    with open('./tests/fixtures/product_response_modifications.json') as prod_response:
+        product = json.load(prod_response)
+    product['capabilities']['ppu'] = {'schema': 'QT', 'future': True}
+    mocked_responses.replace(
+        'GET',
+        'https://localhost/public/v1/products/PRD-276-377-545',
+        json=product,
+    )
+
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
     skipped, updated, errors = synchronizer.sync()
@@ -500,14 +519,14 @@ def test_ppu_disable_future(
 
 
 @pytest.mark.parametrize(
-    ('row_action',),
+    ('row_action', 'updated'),
     (
-        (5,),
-        (6,),
-        (7,),
-        (8,),
-        (9,),
-        (10,),
+        (5, 0),
+        (6, 1),
+        (7, 1),
+        (8, 1),
+        (9, 0),
+        (10, 0),
     ),
 )
 def test_ppu_disable_feature(
@@ -516,6 +535,7 @@ def test_ppu_disable_feature(
     mocked_responses,
     mocked_product_response,
     row_action,
+    updated,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'B{row_action}'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'C{row_action}'].value = 'Disabled'
@@ -530,29 +550,30 @@ def test_ppu_disable_feature(
         silent=True,
     )
 
-    mocked_responses.add(
-        method='PUT',
-        url='https://localhost/public/v1/products/PRD-276-377-545',
-        json=mocked_product_response,
-    )
+    if updated:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+        )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
-    skipped, updated, errors = synchronizer.sync()
+    skipped, synced, errors = synchronizer.sync()
 
-    assert skipped == 8
-    assert updated == 1
+    assert skipped == 9 - updated
+    assert synced == updated
     assert errors == {}
 
 
 @pytest.mark.parametrize(
-    ('row_action',),
+    ('row_action', 'updated'),
     (
-        (5,),
-        (6,),
-        (7,),
-        (9,),
-        (10,),
+        (5, 1),
+        (6, 0),
+        (7, 0),
+        (9, 1),
+        (10, 1),
     ),
 )
 def test_features_enable_future(
@@ -561,6 +582,7 @@ def test_features_enable_future(
     mocked_responses,
     mocked_product_response,
     row_action,
+    updated,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'B{row_action}'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities'][f'C{row_action}'].value = 'Enabled'
@@ -575,26 +597,27 @@ def test_features_enable_future(
         silent=True,
     )
 
-    mocked_responses.add(
-        method='PUT',
-        url='https://localhost/public/v1/products/PRD-276-377-545',
-        json=mocked_product_response,
-    )
+    if updated:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+        )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
 
-    skipped, updated, errors = synchronizer.sync()
+    skipped, synced, errors = synchronizer.sync()
 
-    assert skipped == 8
-    assert updated == 1
+    assert skipped == 9 - updated
+    assert synced == updated
     assert errors == {}
 
 
 @pytest.mark.parametrize(
-    ('tier_level',),
+    ('tier_level', 'updated'),
     (
-        (1,),
-        (2,),
+        (1, 1),
+        (2, 0),
     ),
 )
 def test_tier_level_feature(
@@ -603,6 +626,7 @@ def test_tier_level_feature(
     mocked_responses,
     mocked_product_response,
     tier_level,
+    updated,
 ):
     get_sync_capabilities_env_ppu_enabled['Capabilities']['B8'].value = 'update'
     get_sync_capabilities_env_ppu_enabled['Capabilities']['C8'].value = tier_level
@@ -617,6 +641,45 @@ def test_tier_level_feature(
         silent=True,
     )
 
+    if updated:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+        )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
+
+    skipped, synced, errors = synchronizer.sync()
+
+    assert skipped == 9 - updated
+    assert synced == updated
+    assert errors == {}
+
+
+def test_update_many_single_request(
+    fs,
+    get_sync_capabilities_env,
+    mocked_responses,
+    mocked_product_response,
+):
+    get_sync_capabilities_env['Capabilities']['B2'].value = 'update'
+    get_sync_capabilities_env['Capabilities']['C2'].value = 'QT'
+    get_sync_capabilities_env['Capabilities']['B3'].value = 'update'
+    get_sync_capabilities_env['Capabilities']['C3'].value = 'Enabled'
+    get_sync_capabilities_env['Capabilities']['B9'].value = 'update'
+    get_sync_capabilities_env['Capabilities']['C9'].value = 'Enabled'
+    get_sync_capabilities_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = CapabilitiesSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
     mocked_responses.add(
         method='PUT',
         url='https://localhost/public/v1/products/PRD-276-377-545',
@@ -627,6 +690,50 @@ def test_tier_level_feature(
 
     skipped, updated, errors = synchronizer.sync()
 
-    assert skipped == 8
-    assert updated == 1
+    assert skipped == 6
+    assert updated == 3
     assert errors == {}
+    put_calls = [call for call in mocked_responses.calls if call.request.method == 'PUT']
+    assert len(put_calls) == 1
+    capabilities = json.loads(put_calls[0].request.body)['capabilities']
+    assert capabilities['ppu']['schema'] == 'QT'
+    assert capabilities['ppu']['dynamic'] is True
+    assert capabilities['tiers']['updates'] is True
+
+
+def test_update_many_error(
+    fs,
+    get_sync_capabilities_env,
+    mocked_responses,
+    mocked_product_response,
+):
+    get_sync_capabilities_env['Capabilities']['B2'].value = 'update'
+    get_sync_capabilities_env['Capabilities']['C2'].value = 'QT'
+    get_sync_capabilities_env['Capabilities']['B9'].value = 'update'
+    get_sync_capabilities_env['Capabilities']['C9'].value = 'Enabled'
+    get_sync_capabilities_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = CapabilitiesSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    for status in (500, 200, 500):
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=mocked_product_response,
+            status=status,
+        )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Capabilities')
+
+    skipped, updated, errors = synchronizer.sync()
+
+    assert skipped == 7
+    assert updated == 1
+    assert errors == {9: ['500 Internal Server Error']}
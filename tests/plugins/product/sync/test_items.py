@@ -1,5 +1,11 @@
+import time
+
 import pytest
 
+from openpyxl import load_workbook
+
+from connect.cli.plugins.product.schema import ITEMS_SCHEMA
+from connect.cli.plugins.product.sync.base import SyncSession
 from connect.cli.plugins.product.sync.items import ItemSynchronizer
 from connect.client import ConnectClient
 
@@ -346,8 +352,7 @@ def test_create_item_exists_in_connect(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
     synchronizer = ItemSynchronizer(
@@ -384,8 +389,7 @@ def test_create_item_connect_exception(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -428,8 +432,7 @@ def test_create_item(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -471,8 +474,7 @@ def test_create_item_one_time(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -514,8 +516,7 @@ def test_create_item_yearly(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -558,8 +559,7 @@ def test_create_item_1_to_1_yearly(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -764,6 +764,56 @@ def test_create_item_validate_commitment_wrong_multiyear_vs_commitment(
     }
 
 
+def test_create_item_duplicated_in_sheet(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    ws = get_sync_items_env['Items']
+    ws['A2'].value = None
+    ws['C2'].value = 'create'
+    for col in range(1, ws.max_column + 1):
+        ws.cell(3, col, value=ws.cell(2, col).value)
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[],
+    )
+
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items',
+        json=mocked_items_response[0],
+    )
+
+    synchronizer = ItemSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert created == 1
+    assert errors == {
+        3: ['Cannot create item: item with MPN `MPN-R-001` already exists with ID '
+            '`PRD-276-377-545-0001`.'],
+    }
+    list_calls = [
+        call for call in mocked_responses.calls
+        if call.request.method == 'GET' and '/items?' in call.request.url
+    ]
+    assert len(list_calls) == 1
+
+
 def test_update_item(
     fs,
     get_sync_items_env,
@@ -772,12 +822,12 @@ def test_update_item(
 ):
     get_sync_items_env['Items']['A2'].value = None
     get_sync_items_env['Items']['C2'].value = 'update'
+    get_sync_items_env['Items']['E2'].value = 'Updated description'
 
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
 
@@ -806,6 +856,119 @@ def test_update_item(
     assert errors == {}
 
 
+def test_update_item_unchanged(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    get_sync_items_env['Items']['A2'].value = None
+    get_sync_items_env['Items']['C2'].value = 'update'
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[mocked_items_response[0]],
+    )
+
+    synchronizer = ItemSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    assert synchronizer.plan()[2].operation == 'no-op'
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert updated == 0
+    assert errors == {}
+
+
+def test_update_item_fingerprint_unchanged(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+):
+    ws = get_sync_items_env['Items']
+    ws['C2'].value = 'update'
+    ws['N1'].value = 'Fingerprint'
+    ws['N2'].value = ITEMS_SCHEMA.fingerprint([cell.value for cell in ws[2][:13]])
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = ItemSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    assert synchronizer.plan()[2].operation == 'no-op'
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert updated == 0
+    assert errors == {}
+
+
+def test_update_item_fingerprint_changed(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    ws = get_sync_items_env['Items']
+    ws['C2'].value = 'update'
+    ws['N1'].value = 'Fingerprint'
+    ws['N2'].value = ITEMS_SCHEMA.fingerprint([cell.value for cell in ws[2][:13]])
+    ws['E2'].value = 'Updated description'
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[mocked_items_response[0]],
+    )
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items/PRD-276-377-545-0001',
+        json=mocked_items_response[0],
+    )
+
+    synchronizer = ItemSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+    synchronizer.save(f'{fs.root_path}/test.xlsx')
+
+    assert updated == 1
+    assert errors == {}
+
+    ws = load_workbook(f'{fs.root_path}/test.xlsx')['Items']
+    assert ws['N2'].value == ITEMS_SCHEMA.fingerprint([cell.value for cell in ws[2][:13]])
+
+
 def test_delete_item(
     fs,
     get_sync_items_env,
@@ -819,8 +982,7 @@ def test_delete_item(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
 
@@ -850,6 +1012,62 @@ def test_delete_item(
     assert errors == {}
 
 
+def test_delete_and_create_item_concurrent(
+    fs,
+    get_sync_items_env,
+    mocked_responses,
+    mocked_items_response,
+):
+    ws = get_sync_items_env['Items']
+    ws['A2'].value = None
+    ws['C2'].value = 'delete'
+    ws['K2'].value = 'draft'
+    for col in range(1, ws.max_column + 1):
+        ws.cell(3, col, value=ws.cell(2, col).value)
+    ws['C3'].value = 'create'
+
+    get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[mocked_items_response[0]],
+    )
+
+    def delete_item(request):
+        time.sleep(0.2)
+        return 204, {}, ''
+
+    mocked_responses.add_callback(
+        method='DELETE',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items/PRD-276-377-545-0001',
+        callback=delete_item,
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items',
+        json=mocked_items_response[0],
+    )
+
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx', jobs=4)
+    synchronizer = ItemSynchronizer(client, True, session)
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert errors == {}
+    assert deleted == 1
+    assert created == 1
+    assert [
+        call.request.method for call in mocked_responses.calls
+        if call.request.method != 'GET'
+    ] == ['DELETE', 'POST']
+
+
 def test_update_item_no_connect_item(
     fs,
     get_sync_items_env,
@@ -862,8 +1080,7 @@ def test_update_item_no_connect_item(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -901,8 +1118,7 @@ def test_update_item_no_item_connect(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -933,6 +1149,7 @@ def test_update_item_draft(
 ):
     get_sync_items_env['Items']['A2'].value = None
     get_sync_items_env['Items']['C2'].value = 'update'
+    get_sync_items_env['Items']['E2'].value = 'Updated description'
 
     item = mocked_items_response[0]
     item['status'] = 'draft'
@@ -940,8 +1157,7 @@ def test_update_item_draft(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[item],
     )
 
@@ -978,6 +1194,7 @@ def test_update_item_draft_ppu(
 ):
     get_sync_items_env['Items']['A2'].value = None
     get_sync_items_env['Items']['C2'].value = 'update'
+    get_sync_items_env['Items']['E2'].value = 'Updated description'
     get_sync_items_env['Items']['F2'].value = 'ppu'
 
     item = mocked_items_response[0]
@@ -987,8 +1204,7 @@ def test_update_item_draft_ppu(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[item],
     )
 
@@ -1025,6 +1241,7 @@ def test_update_item_draft_connect_exception(
 ):
     get_sync_items_env['Items']['A2'].value = None
     get_sync_items_env['Items']['C2'].value = 'update'
+    get_sync_items_env['Items']['E2'].value = 'Updated description'
 
     item = mocked_items_response[0]
     item['status'] = 'draft'
@@ -1032,8 +1249,7 @@ def test_update_item_draft_connect_exception(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[item],
     )
 
@@ -1075,8 +1291,7 @@ def test_delete_item_not_exists(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -1115,8 +1330,7 @@ def test_delete_item_connect_error(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[mocked_items_response[0]],
     )
 
@@ -1159,8 +1373,7 @@ def test_create_item_custom_uom(
     get_sync_items_env.save(f'{fs.root_path}/test.xlsx')
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items?eq(mpn,'
-            'MPN-R-001)&limit=100&offset=0',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
         json=[],
     )
 
@@ -1195,3 +1408,20 @@ def test_create_item_custom_uom(
     assert created == 1
     assert updated == 0
     assert errors == {}
+
+
+def test_validate_offline(fs):
+    wb = load_workbook('./tests/fixtures/items_sync.xlsx')
+    wb['Items']['C2'].value = 'create'
+    wb.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = ItemSynchronizer(
+        client=None,
+        silent=True,
+        session=SyncSession(None, f'{fs.root_path}/test.xlsx'),
+    )
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Items')
+
+    assert synchronizer.validate() == {
+        2: ['the `ID` must not be specified for the `create` action.'],
+    }
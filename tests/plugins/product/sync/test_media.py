@@ -1,5 +1,10 @@
+import hashlib
+import json
+
 import pytest
 
+from connect.cli.plugins.product.schema import MEDIA_SCHEMA
+from connect.cli.plugins.product.sync.base import SyncSession
 from connect.cli.plugins.product.sync.media import MediaSynchronizer
 from connect.client import ConnectClient
 
@@ -359,6 +364,72 @@ def test_update_image(fs, get_sync_media_env, mocked_responses, mocked_media_res
     assert errors == {}
 
 
+def test_update_image_unchanged_file(fs, get_sync_media_env, mocked_responses, mocked_media_response):
+    get_sync_media_env['Media']['A2'] = 2
+    get_sync_media_env['Media']['C2'] = 'update'
+    get_sync_media_env.save(f'{fs.root_path}/test.xlsx')
+    with open(f'{fs.root_path}/media/image.png', 'rb') as f:
+        checksum = hashlib.sha256(f.read()).hexdigest()
+    with open(f'{fs.root_path}/media/checksums.json', 'w') as f:
+        json.dump({'image.png': checksum}, f)
+
+    synchronizer = MediaSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Media')
+
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545/media/PRDM-276-377-545-67072',
+        json=mocked_media_response[0],
+    )
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert updated == 1
+    assert errors == {}
+    payload = mocked_responses.calls[-1].request.body
+    assert payload.fields['position'] == ('2', '2')
+    assert 'thumbnail' not in payload.fields
+    assert synchronizer.uploaded_bytes == payload.len
+
+
+def test_update_image_unchanged_row_and_file(fs, get_sync_media_env):
+    ws = get_sync_media_env['Media']
+    ws['C2'] = 'update'
+    ws['G1'] = 'Fingerprint'
+    ws['G2'] = MEDIA_SCHEMA.fingerprint([cell.value for cell in ws[2][:6]])
+    get_sync_media_env.save(f'{fs.root_path}/test.xlsx')
+    with open(f'{fs.root_path}/media/image.png', 'rb') as f:
+        checksum = hashlib.sha256(f.read()).hexdigest()
+    with open(f'{fs.root_path}/media/checksums.json', 'w') as f:
+        json.dump({'image.png': checksum}, f)
+
+    synchronizer = MediaSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Media')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert updated == 0
+    assert errors == {}
+    assert synchronizer.uploaded_bytes == 0
+
+
 def test_update_image_404(fs, get_sync_media_env, mocked_responses, mocked_media_response):
     get_sync_media_env['Media']['C2'] = 'update'
     get_sync_media_env.save(f'{fs.root_path}/test.xlsx')
@@ -422,3 +493,35 @@ def test_create_video(fs, get_sync_media_env, mocked_responses, mocked_media_res
     assert updated == 0
     assert deleted == 0
     assert errors == {}
+
+
+def test_update_image_saves_checksum(fs, get_sync_media_env, mocked_responses, mocked_media_response):
+    get_sync_media_env['Media']['C2'] = 'update'
+    get_sync_media_env.save(f'{fs.root_path}/test.xlsx')
+    with open(f'{fs.root_path}/media/checksums.json', 'w') as f:
+        json.dump({'image.png': 'stale', 'other.png': 'kept'}, f)
+    with open(f'{fs.root_path}/media/image.png', 'rb') as f:
+        checksum = hashlib.sha256(f.read()).hexdigest()
+
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx', jobs=2)
+    synchronizer = MediaSynchronizer(client, True, session)
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Media')
+
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545/media/PRDM-276-377-545-67072',
+        json=mocked_media_response[0],
+    )
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+    session.save()
+
+    assert updated == 1
+    assert errors == {}
+    with open(f'{fs.root_path}/media/checksums.json') as f:
+        assert json.load(f) == {'image.png': checksum, 'other.png': 'kept'}
@@ -1,4 +1,5 @@
 from connect.cli.plugins.product.sync.params import ParamsSynchronizer
+from connect.cli.plugins.product.sync.base import SyncSession
 from connect.client import ConnectClient
 
 
@@ -415,8 +416,8 @@ def test_validate_update_invalid_switch(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/parameters/PRM-276-377-545-0008',
-        json=mocked_ordering_params_response[0],
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters?limit=100&offset=0',
+        json=[mocked_ordering_params_response[0]],
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Ordering Parameters')
@@ -454,8 +455,8 @@ def test_validate_update_invalid_switch_phase(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/parameters/PRM-276-377-545-0008',
-        json=mocked_ordering_params_response[0],
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters?limit=100&offset=0',
+        json=[mocked_ordering_params_response[0]],
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Ordering Parameters')
@@ -493,8 +494,8 @@ def test_validate_update_invalid_switch_scope(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/parameters/PRM-276-377-545-0008',
-        json=mocked_ordering_params_response[0],
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters?limit=100&offset=0',
+        json=[mocked_ordering_params_response[0]],
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Ordering Parameters')
@@ -515,6 +516,7 @@ def test_validate_update(
     mocked_ordering_params_response,
 ):
     get_sync_params_env['Ordering Parameters']['C2'] = 'update'
+    get_sync_params_env['Ordering Parameters']['D2'] = 'Updated title'
 
     response = mocked_ordering_params_response[0]
 
@@ -531,8 +533,8 @@ def test_validate_update(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/parameters/PRM-276-377-545-0008',
-        json=response,
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters?limit=100&offset=0',
+        json=[response],
     )
 
     mocked_responses.add(
@@ -552,6 +554,44 @@ def test_validate_update(
     assert errors == {}
 
 
+def test_validate_update_unchanged(
+    fs,
+    get_sync_params_env,
+    mocked_responses,
+    mocked_ordering_params_response,
+):
+    get_sync_params_env['Ordering Parameters']['C2'] = 'update'
+
+    response = mocked_ordering_params_response[0]
+
+    get_sync_params_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = ParamsSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters?limit=100&offset=0',
+        json=[response],
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Ordering Parameters')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert created == 0
+    assert updated == 0
+    assert deleted == 0
+    assert errors == {}
+
+
 def test_validate_create(
     fs,
     get_sync_params_env,
@@ -663,3 +703,57 @@ def test_validate_create_no_constrains(
     assert updated == 0
     assert deleted == 0
     assert errors == {}
+
+
+def test_parameters_fetched_once_per_session(
+    fs,
+    get_sync_params_env,
+    mocked_responses,
+    mocked_ordering_params_response,
+):
+    get_sync_params_env['Ordering Parameters']['C2'] = 'update'
+    get_sync_params_env['Ordering Parameters']['D2'] = 'Updated title'
+    get_sync_params_env['Fulfillment Parameters']['C2'] = 'update'
+    get_sync_params_env['Fulfillment Parameters']['D2'] = 'Updated title'
+    get_sync_params_env.save(f'{fs.root_path}/test.xlsx')
+
+    ordering_param = mocked_ordering_params_response[0]
+    fulfillment_param = dict(
+        ordering_param,
+        id='PRM-276-377-545-0016',
+        name='t0_f_text',
+        phase='fulfillment',
+        type='text',
+    )
+
+    client = ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+    session = SyncSession(client, f'{fs.root_path}/test.xlsx')
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters?limit=100&offset=0',
+        json=[ordering_param, fulfillment_param],
+    )
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters/PRM-276-377-545-0008',
+        json=ordering_param,
+    )
+    mocked_responses.add(
+        method='PUT',
+        url='https://localhost/public/v1/products/PRD-276-377-545/parameters/PRM-276-377-545-0016',
+        json=fulfillment_param,
+    )
+
+    results = []
+    for worksheet in ('Ordering Parameters', 'Fulfillment Parameters'):
+        synchronizer = ParamsSynchronizer(client, True, session)
+        synchronizer.open(f'{fs.root_path}/test.xlsx', worksheet)
+        results.append(synchronizer.sync())
+
+    assert results == [(0, 0, 1, 0, {}), (0, 0, 1, 0, {})]
+    assert len([call for call in mocked_responses.calls if '/parameters?' in call.request.url]) == 1
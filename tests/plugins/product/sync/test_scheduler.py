@@ -0,0 +1,51 @@
+from threading import Event
+
+import pytest
+
+from connect.cli.plugins.product.sync import SyncScheduler
+
+
+def test_run_respects_dependencies():
+    items_done = Event()
+    params_done = Event()
+
+    def items():
+        params_done.wait(5)
+        items_done.set()
+        return 'items'
+
+    def params():
+        params_done.set()
+        return 'params'
+
+    def configuration():
+        assert items_done.is_set() and params_done.is_set()
+        return 'configuration'
+
+    scheduler = SyncScheduler(4)
+    scheduler.add('items', items)
+    scheduler.add('params', params)
+    scheduler.add('configuration', configuration, depends_on=('items', 'params'))
+
+    assert scheduler.run() == ['items', 'params', 'configuration']
+
+
+def test_run_propagates_errors():
+    def failing():
+        raise RuntimeError('boom')
+
+    scheduler = SyncScheduler(2)
+    scheduler.add('ok', lambda: None)
+    scheduler.add('failing', failing)
+
+    with pytest.raises(RuntimeError):
+        scheduler.run()
+
+
+def test_add_unknown_dependency():
+    scheduler = SyncScheduler(2)
+
+    with pytest.raises(ValueError) as e:
+        scheduler.add('configuration', lambda: None, depends_on=('items',))
+
+    assert str(e.value) == 'Task configuration depends on unknown task items.'
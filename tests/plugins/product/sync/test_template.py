@@ -234,8 +234,8 @@ def test_update_template_not_exists(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
-        status=404,
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[],
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Templates')
@@ -273,8 +273,8 @@ def test_delete_template_not_exists(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
-        status=404,
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[],
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Templates')
@@ -309,7 +309,7 @@ def test_delete_template_500(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
         status=500,
     )
 
@@ -340,8 +340,8 @@ def test_delete_template(fs, get_sync_templates_env, mocked_templates_response,
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
-        json=mocked_templates_response[0],
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[mocked_templates_response[0]],
     )
 
     mocked_responses.add(
@@ -383,8 +383,8 @@ def test_update_template_switch_type(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
-        json=response,
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[response],
     )
 
     synchronizer.open(f'{fs.root_path}/test.xlsx', 'Templates')
@@ -408,6 +408,7 @@ def test_update_template(
     mocked_responses,
 ):
     get_sync_templates_env['Templates']['C2'] = 'update'
+    get_sync_templates_env['Templates']['F2'] = 'Updated content'
     get_sync_templates_env.save(f'{fs.root_path}/test.xlsx')
 
     synchronizer = TemplatesSynchronizer(
@@ -421,8 +422,8 @@ def test_update_template(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
-        json=mocked_templates_response[0],
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[mocked_templates_response[0]],
     )
 
     mocked_responses.add(
@@ -442,6 +443,41 @@ def test_update_template(
     assert errors == {}
 
 
+def test_update_template_unchanged(
+    fs,
+    get_sync_templates_env,
+    mocked_templates_response,
+    mocked_responses,
+):
+    get_sync_templates_env['Templates']['C2'] = 'update'
+    get_sync_templates_env.save(f'{fs.root_path}/test.xlsx')
+
+    synchronizer = TemplatesSynchronizer(
+        client=ConnectClient(
+            use_specs=False,
+            api_key='ApiKey SU:123',
+            endpoint='https://localhost/public/v1',
+        ),
+        silent=True,
+    )
+
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[mocked_templates_response[0]],
+    )
+
+    synchronizer.open(f'{fs.root_path}/test.xlsx', 'Templates')
+
+    skipped, created, updated, deleted, errors = synchronizer.sync()
+
+    assert skipped == 1
+    assert created == 0
+    assert updated == 0
+    assert deleted == 0
+    assert errors == {}
+
+
 def test_update_template_exception(
     fs,
     get_sync_templates_env,
@@ -449,6 +485,7 @@ def test_update_template_exception(
     mocked_responses,
 ):
     get_sync_templates_env['Templates']['C2'] = 'update'
+    get_sync_templates_env['Templates']['F2'] = 'Updated content'
     get_sync_templates_env.save(f'{fs.root_path}/test.xlsx')
 
     synchronizer = TemplatesSynchronizer(
@@ -462,8 +499,8 @@ def test_update_template_exception(
 
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates/TL-551-876-782',
-        json=mocked_templates_response[0],
+        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
+        json=[mocked_templates_response[0]],
     )
 
     mocked_responses.add(
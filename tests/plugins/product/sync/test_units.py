@@ -0,0 +1,51 @@
+import json
+
+from connect.cli.plugins.product.sync.units import get_unit_resolver
+from connect.client import ConnectClient
+
+
+def get_client():
+    return ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+
+
+def test_resolve(mocked_responses):
+    with open('./tests/fixtures/units_response.json') as response:
+        mocked_responses.add(
+            method='GET',
+            url='https://localhost/public/v1/settings/units',
+            json=json.load(response),
+        )
+    resolver = get_unit_resolver(get_client())
+
+    assert resolver.resolve('boolean', 'ppu') == 'boolean'
+    assert resolver.resolve('Boolean', 'reservation') == 'boolean'
+    assert resolver.resolve('Boolean', 'ppu') is None
+    assert len(mocked_responses.calls) == 1
+
+
+def test_get_or_create_records_created_units(mocked_responses):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/settings/units',
+        json=[],
+    )
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/settings/units',
+        json={'id': 'unit-new', 'unit': 'unit', 'description': 'Seats', 'type': 'reservation'},
+    )
+
+    assert get_unit_resolver(get_client()).get_or_create('Seats', 'reservation') == 'unit-new'
+    assert get_unit_resolver(get_client()).get_or_create('Seats', 'reservation') == 'unit-new'
+    assert get_unit_resolver(get_client()).resolve('unit-new', 'ppu') == 'unit-new'
+
+    assert len(mocked_responses.calls) == 2
+    assert json.loads(mocked_responses.calls[1].request.body) == {
+        'description': 'Seats',
+        'type': 'reservation',
+        'unit': 'unit',
+    }
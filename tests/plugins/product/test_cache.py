@@ -0,0 +1,105 @@
+import os
+
+from connect.cli.plugins.product.cache import MediaCache
+
+
+def _write(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def test_put_get_copy(fs):
+    cache = MediaCache(os.path.join(fs.root_path, 'cache'))
+    _write(f'{fs.root_path}/a.png', b'aaaa')
+    cache.put('https://localhost/a.png', f'{fs.root_path}/a.png', 'digest_a', 4, etag='"a"')
+
+    entry = cache.get('https://localhost/a.png')
+    assert entry['digest'] == 'digest_a'
+    assert MediaCache.get_validation_headers(entry) == {'If-None-Match': '"a"'}
+
+    cache.copy(entry, f'{fs.root_path}/copy.png')
+    with open(f'{fs.root_path}/copy.png', 'rb') as f:
+        assert f.read() == b'aaaa'
+    assert cache.get('https://localhost/unknown.png') is None
+
+
+def test_deduplicate(fs):
+    cache = MediaCache(os.path.join(fs.root_path, 'cache'))
+    _write(f'{fs.root_path}/a.png', b'aaaa')
+    cache.put('https://localhost/PRD-1/a.png', f'{fs.root_path}/a.png', 'digest_a', 4)
+    cache.put('https://localhost/PRD-2/a.png', f'{fs.root_path}/a.png', 'digest_a', 4)
+
+    assert cache.size == 4
+    assert os.listdir(os.path.join(fs.root_path, 'cache', 'objects')) == ['digest_a']
+
+
+def test_save_load(fs):
+    path = os.path.join(fs.root_path, 'cache')
+    cache = MediaCache(path)
+    _write(f'{fs.root_path}/a.png', b'aaaa')
+    cache.put(
+        'https://localhost/a.png', f'{fs.root_path}/a.png', 'digest_a', 4,
+        last_modified='Wed, 21 Oct 2015 07:28:00 GMT',
+    )
+    cache.save()
+
+    entry = MediaCache(path).get('https://localhost/a.png')
+    assert MediaCache.get_validation_headers(entry) == {
+        'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT',
+    }
+
+
+def test_evict_least_recently_used(fs, mocker):
+    mocker.patch('connect.cli.plugins.product.cache.time.time', side_effect=[1, 2, 3])
+    cache = MediaCache(os.path.join(fs.root_path, 'cache'), max_size=8)
+    for name in ('a', 'b'):
+        _write(f'{fs.root_path}/{name}.png', name.encode() * 4)
+        cache.put(f'https://localhost/{name}.png', f'{fs.root_path}/{name}.png', name, 4)
+    cache.copy(cache.get('https://localhost/a.png'), f'{fs.root_path}/copy.png')
+
+    _write(f'{fs.root_path}/c.png', b'cccc')
+    mocker.patch('connect.cli.plugins.product.cache.time.time', return_value=4)
+    cache.put('https://localhost/c.png', f'{fs.root_path}/c.png', 'c', 4)
+    cache.save()
+
+    assert cache.size == 8
+    assert cache.get('https://localhost/a.png') is not None
+    assert cache.get('https://localhost/b.png') is None
+    assert cache.get('https://localhost/c.png') is not None
+
+
+def test_save_merges_concurrent_caches(fs):
+    path = os.path.join(fs.root_path, 'cache')
+    first = MediaCache(path)
+    second = MediaCache(path)
+    for cache, name in ((first, 'a'), (second, 'b')):
+        _write(f'{fs.root_path}/{name}.png', name.encode() * 4)
+        cache.put(f'https://localhost/{name}.png', f'{fs.root_path}/{name}.png', name, 4)
+    first.save()
+    second.save()
+
+    cache = MediaCache(path)
+    assert cache.get('https://localhost/a.png')['digest'] == 'a'
+    assert cache.get('https://localhost/b.png')['digest'] == 'b'
+
+
+def test_copy_evicted_by_another_cache(fs, mocker):
+    path = os.path.join(fs.root_path, 'cache')
+    mocker.patch('connect.cli.plugins.product.cache.time.time', return_value=1)
+    first = MediaCache(path, max_size=4)
+    _write(f'{fs.root_path}/a.png', b'aaaa')
+    first.put('https://localhost/a.png', f'{fs.root_path}/a.png', 'a', 4)
+    first.save()
+
+    second = MediaCache(path, max_size=4)
+    entry = second.get('https://localhost/a.png')
+    mocker.patch('connect.cli.plugins.product.cache.time.time', return_value=2)
+    _write(f'{fs.root_path}/b.png', b'bbbb')
+    first.put('https://localhost/b.png', f'{fs.root_path}/b.png', 'b', 4)
+    first.save()
+
+    assert second.copy(entry, f'{fs.root_path}/copy.png') is False
+    second.save()
+    cache = MediaCache(path)
+    assert cache.get('https://localhost/a.png') is None
+    assert cache.get('https://localhost/b.png') is not None
@@ -1,93 +1,102 @@
-import os
+import json
+import re
 
 import pytest
 
 from click import ClickException
 
-from openpyxl import load_workbook
-
 from connect.cli.core.config import Config
-from connect.cli.plugins.product.clone import ProductCloner
+from connect.cli.plugins.product.clone import get_item_payload, ProductCloner
 
 
-def test_dump(mocker, config_mocker):
-    mock = mocker.patch(
-        'connect.cli.plugins.product.clone.dump_product',
-    )
+def _get_cloner():
     config = Config()
     config.load('/tmp')
-    cloner = ProductCloner(
+    config.add_account('VA-000', 'Account 0', 'Api 0', 'https://localhost/public/v1')
+
+    return ProductCloner(
         config=config,
         source_account='VA-000',
         destination_account='VA-000',
-        product_id='PRD-123',
+        product_id='PRD-276-377-545',
     )
 
-    cloner.dump()
 
-    mock.assert_called_once()
+def test_get_item_payload_null_commitment(mocked_items_response):
+    item = dict(mocked_items_response[0], type='reservation', commitment=None)
+
+    payload = get_item_payload(item, 'unit-0001')
+
+    assert payload['commitment'] == {'count': 1}
 
 
-def test_clean_wb(
+def test_load(
     config_mocker,
-    fs,
+    mocked_responses,
+    mocked_product_response,
+    mocked_items_response,
+    mocked_media_response,
+    mocked_templates_response,
+    mocked_actions_response,
+    mocked_ordering_params_response,
 ):
-    config = Config()
-    config.load('/tmp')
+    cloner = _get_cloner()
 
-    cloner = ProductCloner(
-        config=config,
-        source_account='VA-000',
-        destination_account='VA-000',
-        product_id='PRD-123',
-    )
-
-    os.mkdir(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-        ),
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545',
+        json=mocked_product_response,
     )
-    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
-    wb.save(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-            'PRD-123.xlsx',
-        ),
+    for collection, response in (
+        ('items', mocked_items_response),
+        ('parameters', mocked_ordering_params_response),
+        ('templates', mocked_templates_response),
+        ('actions', mocked_actions_response),
+        ('media', mocked_media_response),
+    ):
+        mocked_responses.add(
+            method='GET',
+            url=f'https://localhost/public/v1/products/PRD-276-377-545/{collection}?limit=100&offset=0',
+            json=response,
+        )
+    mocked_responses.add(
+        method='GET',
+        url=re.compile(r'https://localhost/media/.*\.png'),
+        body=b'image',
     )
-    cloner.load_wb()
-    cloner.clean_wb()
-
-    cloned_wb = load_workbook(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-            'PRD-123.xlsx',
-        ),
+
+    cloner.load()
+
+    assert cloner.source['product']['id'] == 'PRD-276-377-545'
+    assert cloner.source['items'] == mocked_items_response
+    assert cloner.source['media'] == mocked_media_response
+    assert cloner._files[mocked_product_response['icon']] == b'image'
+    assert all(cloner._files[media['thumbnail']] == b'image' for media in mocked_media_response)
+
+
+def test_load_error(config_mocker, mocked_responses):
+    cloner = _get_cloner()
+
+    mocked_responses.add(
+        method='GET',
+        url=re.compile(r'https://localhost/public/v1/products/PRD-276-377-545.*'),
+        status=404,
     )
 
-    for row in range(2, 11):
-        assert cloned_wb['Capabilities'][f'B{row}'].value == 'update'
+    with pytest.raises(ClickException) as e:
+        cloner.load()
+
+    assert 'Error while reading product PRD-276-377-545' in str(e)
 
 
 def test_create_product(
     config_mocker,
-    fs,
     mocked_responses,
     mocked_categories_response,
     mocked_product_response,
 ):
-    config = Config()
-    config.load('/tmp')
-    config.add_account('VA-000', 'Account 0', 'Api 0', 'https://localhost/public/v1')
-
-    cloner = ProductCloner(
-        config=config,
-        source_account='VA-000',
-        destination_account='VA-000',
-        product_id='PRD-123',
-    )
+    cloner = _get_cloner()
+    cloner.source = {'product': mocked_product_response}
 
     mocked_responses.add(
         method='GET',
@@ -100,51 +109,19 @@ def test_create_product(
         json=mocked_product_response,
     )
 
-    os.mkdir(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-        ),
-    )
-    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
-    wb.save(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-            'PRD-123.xlsx',
-        ),
-    )
-    cloner.load_wb()
     cloner.create_product()
 
-    wb = load_workbook(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-            'PRD-123.xlsx',
-        ),
-    )
-
-    assert wb['General Information']['B5'].value == 'PRD-276-377-545'
+    assert cloner.destination_product == 'PRD-276-377-545'
 
 
-def test_create_product_errordef(
+def test_create_product_error(
     config_mocker,
-    fs,
     mocked_responses,
     mocked_categories_response,
     mocked_product_response,
 ):
-    config = Config()
-    config.load('/tmp')
-    config.add_account('VA-000', 'Account 0', 'Api 0', 'https://localhost/public/v1')
-
-    cloner = ProductCloner(
-        config=config,
-        source_account='VA-000',
-        destination_account='VA-000',
-        product_id='PRD-123',
-    )
+    cloner = _get_cloner()
+    cloner.source = {'product': mocked_product_response}
 
     mocked_responses.add(
         method='GET',
@@ -157,99 +134,107 @@ def test_create_product_errordef(
         status=500,
     )
 
-    os.mkdir(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-        ),
-    )
-    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
-    wb.save(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-            'PRD-123.xlsx',
-        ),
-    )
-    cloner.load_wb()
     with pytest.raises(ClickException) as e:
         cloner.create_product()
 
     assert 'Error on product creation' in str(e)
 
 
-def test_inject(
+def test_clone(
     config_mocker,
-    fs,
     mocked_responses,
-    mocker,
+    mocked_product_response,
+    mocked_items_response,
+    mocked_media_response,
+    mocked_templates_response,
+    mocked_actions_response,
+    mocked_ordering_params_response,
 ):
-    config = Config()
-    config.load('/tmp')
-    config.add_account('VA-000', 'Account 0', 'Api 0', 'https://localhost/public/v1')
-
-    cloner = ProductCloner(
-        config=config,
-        source_account='VA-000',
-        destination_account='VA-000',
-        product_id='PRD-123',
-    )
-
-    os.mkdir(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-        ),
-    )
-    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
-    wb.save(
-        os.path.join(
-            cloner.fs.root_path,
-            'PRD-123',
-            'PRD-123.xlsx',
-        ),
-    )
-
-    mocker.patch(
-        'connect.cli.plugins.product.clone.GeneralSynchronizer',
-    )
-    mocker.patch(
-        'connect.cli.plugins.product.clone.CapabilitiesSynchronizer',
-    )
-    mocker.patch(
-        'connect.cli.plugins.product.clone.TemplatesSynchronizer',
-    )
-    mocker.patch(
-        'connect.cli.plugins.product.clone.ParamsSynchronizer',
-    )
-    mocker.patch(
-        'connect.cli.plugins.product.clone.ActionsSynchronizer',
-    )
-    mocker.patch(
-        'connect.cli.plugins.product.clone.MediaSynchronizer',
-    )
-    mocker.patch(
-        'connect.cli.plugins.product.clone.ItemSynchronizer',
-        return_value=FakeItemSynchronizer,
-    )
+    cloner = _get_cloner()
+    cloner.destination_product = 'PRD-999'
+    item = dict(mocked_items_response[0], unit={'id': 'boxes'})
+    cloner.source = {
+        'product': mocked_product_response,
+        'items': [item],
+        'parameters': mocked_ordering_params_response[:1],
+        'templates': mocked_templates_response[:1],
+        'actions': mocked_actions_response[:1],
+        'media': mocked_media_response[:1],
+    }
+    cloner._files = {
+        mocked_product_response['icon']: b'icon',
+        mocked_media_response[0]['thumbnail']: b'thumbnail',
+    }
+    base_url = 'https://localhost/public/v1/products/PRD-999'
+
+    with open('./tests/fixtures/units_response.json') as response:
+        mocked_responses.add(
+            method='GET',
+            url='https://localhost/public/v1/settings/units?limit=100&offset=0',
+            json=json.load(response),
+        )
+    mocked_responses.add(method='GET', url=base_url, json=mocked_product_response)
+    mocked_responses.add(method='PUT', url=base_url, json=mocked_product_response)
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/items',
-        json=[],
+        url=f'{base_url}/items?limit=100&offset=0',
+        json=[{'id': 'PRD-999-0001'}],
     )
+    mocked_responses.add(method='DELETE', url=f'{base_url}/items/PRD-999-0001', status=204)
     mocked_responses.add(
         method='GET',
-        url='https://localhost/public/v1/products/PRD-276-377-545/templates?limit=100&offset=0',
-        json=[],
-    )
-    cloner.inject()
+        url=f'{base_url}/templates?limit=100&offset=0',
+        json=[{'id': 'TL-DEFAULT'}],
+    )
+    mocked_responses.add(method='DELETE', url=f'{base_url}/templates/TL-DEFAULT', status=204)
+    for collection, new_id in (
+        ('items', 'PRD-999-0002'),
+        ('parameters', 'PRM-999-0001'),
+        ('templates', 'TL-999-0001'),
+        ('actions', 'ACT-999-0001'),
+        ('media', 'PRDM-999-0001'),
+    ):
+        mocked_responses.add(method='POST', url=f'{base_url}/{collection}', json={'id': new_id})
+
+    cloner.clone()
+
+    assert cloner.id_map == {
+        item['id']: 'PRD-999-0002',
+        mocked_ordering_params_response[0]['id']: 'PRM-999-0001',
+        mocked_templates_response[0]['id']: 'TL-999-0001',
+        mocked_actions_response[0]['id']: 'ACT-999-0001',
+        mocked_media_response[0]['id']: 'PRDM-999-0001',
+    }
+    item_request = next(
+        call.request for call in mocked_responses.calls
+        if call.request.method == 'POST' and call.request.url.endswith('/items')
+    )
+    assert b'"boxes"' in item_request.body
+
+
+def test_clone_error(
+    config_mocker,
+    mocked_responses,
+    mocked_product_response,
+):
+    cloner = _get_cloner()
+    cloner.destination_product = 'PRD-999'
+    cloner.source = {
+        'product': mocked_product_response,
+        'items': [],
+        'parameters': [],
+        'templates': [],
+        'actions': [],
+        'media': [],
+    }
 
+    mocked_responses.add(
+        method='GET',
+        url=re.compile(r'https://localhost/public/v1/products/PRD-999.*'),
+        status=500,
+    )
 
-class FakeItemSynchronizer:
-    @staticmethod
-    def open(first, second):
-        return 'PRD-276-377-545'
+    with pytest.raises(ClickException) as e:
+        cloner.clone()
 
-    @staticmethod
-    def sync():
-        pass
+    assert 'Error while cloning product' in str(e)
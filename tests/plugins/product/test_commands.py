@@ -1,6 +1,9 @@
 import json
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from threading import Event
 
 import pytest
 
@@ -10,10 +13,18 @@ from click.testing import CliRunner
 from openpyxl import load_workbook
 
 from connect.cli.core.config import Config
-from connect.cli.plugins.product.export import dump_product
+from connect.cli.plugins.product.commands import (
+    print_results,
+    print_sync_results,
+    sync_products,
+    sync_sheets,
+)
+from connect.cli.plugins.product.export import dump_product, dump_products
+from connect.cli.plugins.product.formats import load_product_files
+from connect.cli.plugins.product.sync.base import SyncSession
 
 
-def test_sync_general_sync(fs, get_general_env, mocked_responses, ccli):
+def test_sync_general_sync(fs, get_general_env, mocked_responses, mocker, ccli):
     config = Config()
     config.load(fs.root_path)
     config.add_account(
@@ -40,6 +51,10 @@ def test_sync_general_sync(fs, get_general_env, mocked_responses, ccli):
                 json=json.load(prod_response),
             )
             get_general_env.save(f'{fs.root_path}/test.xlsx')
+            load = mocker.patch(
+                'connect.cli.plugins.product.sync.base.load_workbook',
+                wraps=load_workbook,
+            )
 
             runner = CliRunner()
             result = runner.invoke(
@@ -55,6 +70,124 @@ def test_sync_general_sync(fs, get_general_env, mocked_responses, ccli):
             )
 
             assert result.exit_code == 0
+            assert len([call for call in load.call_args_list if call.kwargs['read_only']]) == 1
+
+
+def test_sync_plan(fs, get_general_env, mocked_responses, mocked_items_response, ccli):
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+
+    with open('./tests/fixtures/units_response.json') as units_response:
+        mocked_responses.add(
+            method='GET',
+            url='https://localhost/public/v1/settings/units',
+            json=json.load(units_response),
+        )
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=mocked_items_response[:2],
+    )
+    get_general_env['Items']['C2'] = 'update'
+    get_general_env['Items']['C3'] = 'update'
+    get_general_env['Items']['E3'] = 'Updated description'
+    get_general_env.save(f'{fs.root_path}/test.xlsx')
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            '-c',
+            fs.root_path,
+            'product',
+            'sync',
+            '--plan',
+            f'{fs.root_path}/test.xlsx',
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert 'Items' in result.output
+    assert 'no-op' in result.output
+    assert 'Planned operations: 1 no-op, 1 update.' in result.output
+
+
+def test_validate_product(fs, ccli):
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
+    wb['Items']['C2'] = 'create'
+    wb['Actions']['C3'] = 'update'
+    wb['Actions']['G3'] = 'product'
+    wb.save(f'{fs.root_path}/test.xlsx')
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            '-c',
+            fs.root_path,
+            'product',
+            'validate',
+            f'{fs.root_path}/test.xlsx',
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert 'Module Items' in result.output
+    assert 'the `ID` must not be specified for the `create` action.' in result.output
+    assert 'Module Actions' in result.output
+    assert 'Errors at row #3' in result.output
+    assert '2 rows of' in result.output
+
+
+def test_sync_validation_errors(fs, ccli):
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+    wb = load_workbook('./tests/fixtures/comparation_product.xlsx')
+    wb['Items']['C2'] = 'create'
+    wb.save(f'{fs.root_path}/test.xlsx')
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            '-c',
+            fs.root_path,
+            'product',
+            'sync',
+            '--yes',
+            f'{fs.root_path}/test.xlsx',
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert 'the `ID` must not be specified for the `create` action.' in result.output
+    assert 'The product has not been synchronized' in result.output
 
 
 def test_list_products(fs, mocked_responses, ccli):
@@ -90,6 +223,149 @@ def test_list_products(fs, mocked_responses, ccli):
     assert "PRD-276-377-545 - My Produc" in result.output
 
 
+def test_sync_many(fs, mocker, ccli):
+    for product_id in ('PRD-000', 'PRD-001'):
+        os.makedirs(f'{fs.root_path}/products/{product_id}')
+        open(f'{fs.root_path}/products/{product_id}/{product_id}.xlsx', 'w').close()
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.sync_products',
+        side_effect=lambda *args: [
+            {
+                'input_file': f'{fs.root_path}/products/PRD-000/PRD-000.xlsx',
+                'product_id': 'PRD-000',
+                'results': [
+                    {
+                        'module': 'Items',
+                        'created': 1,
+                        'updated': 2,
+                        'deleted': 0,
+                        'skipped': 3,
+                        'errors': {},
+                    },
+                ],
+                'elapsed': 1.5,
+                'error': None,
+            },
+            {
+                'input_file': f'{fs.root_path}/products/PRD-001/PRD-001.xlsx',
+                'product_id': None,
+                'results': [],
+                'elapsed': 0.5,
+                'error': '2 rows have errors.',
+            },
+        ],
+    )
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            '-c',
+            fs.root_path,
+            'product',
+            'sync',
+            '--yes',
+            f'{fs.root_path}/products',
+            '--workers',
+            '2',
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert mock.mock_calls[0][1][1] == [
+        f'{fs.root_path}/products/PRD-000/PRD-000.xlsx',
+        f'{fs.root_path}/products/PRD-001/PRD-001.xlsx',
+    ]
+    assert mock.mock_calls[0][1][4] == 2
+    assert 'Total' in result.output
+    assert '1.50' in result.output
+    assert '2 rows have errors.' in result.output
+    assert '1 of 2 products could not be synchronized.' in result.output
+
+
+def test_sync_many_not_found(fs, ccli):
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            '-c',
+            fs.root_path,
+            'product',
+            'sync',
+            '--yes',
+            f'{fs.root_path}/products/*.xlsx',
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert f'No workbooks to synchronize have been found in {fs.root_path}/products/*.xlsx.' in result.output
+
+
+def test_sync_products(fs, get_general_env, mocked_responses, mocker):
+    mocker.patch(
+        'connect.cli.plugins.product.commands.ProcessPoolExecutor',
+        ThreadPoolExecutor,
+    )
+    with open('./tests/fixtures/units_response.json') as units_response:
+        mocked_responses.add(
+            method='GET',
+            url='https://localhost/public/v1/settings/units',
+            json=json.load(units_response),
+        )
+    with open('./tests/fixtures/product_response.json') as prod_response:
+        mocked_responses.add(
+            method='PUT',
+            url='https://localhost/public/v1/products/PRD-276-377-545',
+            json=json.load(prod_response),
+        )
+    get_general_env.save(f'{fs.root_path}/PRD-276-377-545.xlsx')
+    config = Config()
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.silent = False
+
+    results = sync_products(
+        config,
+        [f'{fs.root_path}/PRD-276-377-545.xlsx', f'{fs.root_path}/missing.xlsx'],
+        1,
+        False,
+        workers=2,
+    )
+
+    assert results[0]['product_id'] == 'PRD-276-377-545'
+    assert results[0]['error'] is None
+    assert results[0]['results']
+    assert results[1]['input_file'] == f'{fs.root_path}/missing.xlsx'
+    assert results[1]['product_id'] is None
+    assert results[1]['error']
+    assert config.silent is False
+
+
 def test_export(config_mocker, mocker, ccli):
 
     mock = mocker.patch(
@@ -137,6 +413,208 @@ def test_export_custom_file(config_mocker, mocker, ccli):
     assert 'The product PRD-000 has been successfully exported to /tmp/my_product.xlsx.\n' in result.output
 
 
+def test_export_jobs(config_mocker, mocker, ccli):
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.dump_product',
+        side_effect=lambda *args: 'PRD-000.xlsx',
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            'product',
+            'export',
+            'PRD-000',
+            '--jobs',
+            '4',
+        ],
+    )
+    mock.assert_called_once()
+    assert mock.mock_calls[0][1][7] == 4
+    assert result.exit_code == 0
+
+
+def test_export_format(config_mocker, mocker, ccli):
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.dump_product',
+        side_effect=lambda *args: 'PRD-000',
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            'product',
+            'export',
+            'PRD-000',
+            '--format',
+            'ndjson',
+        ],
+    )
+    mock.assert_called_once()
+    assert mock.mock_calls[0][1][9] == 'ndjson'
+    assert result.exit_code == 0
+
+
+def test_export_incremental(config_mocker, mocker, ccli):
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.dump_product',
+        side_effect=lambda *args: 'PRD-000.xlsx',
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            'product',
+            'export',
+            'PRD-000',
+            '--incremental',
+        ],
+    )
+    mock.assert_called_once()
+    assert mock.mock_calls[0][1][10] is True
+    assert result.exit_code == 0
+
+
+def test_export_many(config_mocker, mocker, ccli):
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.dump_products',
+        side_effect=lambda *args: [
+            {
+                'product_id': 'PRD-000',
+                'output_file': 'PRD-000/PRD-000.xlsx',
+                'elapsed': 1.5,
+                'error': None,
+            },
+            {
+                'product_id': 'PRD-001',
+                'output_file': None,
+                'elapsed': 0.5,
+                'error': '404 - Not Found: Product PRD-001 not found.',
+            },
+        ],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            'product',
+            'export',
+            'PRD-000',
+            'PRD-001',
+            '--workers',
+            '2',
+        ],
+    )
+    mock.assert_called_once()
+    assert mock.mock_calls[0][1][2] == ('PRD-000', 'PRD-001')
+    assert mock.mock_calls[0][1][10] == 2
+    assert result.exit_code == 0
+    assert 'PRD-000/PRD-000.xlsx' in result.output
+    assert '1 of 2 products could not be exported.' in result.output
+
+
+def test_export_query(fs, mocked_responses, mocker, ccli):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products?eq(status,published)&limit=100&offset=0',
+        json=[{'id': 'PRD-000'}, {'id': 'PRD-001'}],
+        match_querystring=True,
+    )
+    mock = mocker.patch(
+        'connect.cli.plugins.product.commands.dump_products',
+        side_effect=lambda *args: [],
+    )
+    config = Config()
+    config.load(fs.root_path)
+    config.add_account(
+        'VA-000',
+        'Account 1',
+        'ApiKey XXXX:YYYY',
+        endpoint='https://localhost/public/v1',
+    )
+    config.activate('VA-000')
+    config.store()
+
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            '-c',
+            fs.root_path,
+            'product',
+            'export',
+            'PRD-000',
+            '--query',
+            'eq(status,published)',
+        ],
+    )
+    assert result.exit_code == 0
+    assert mock.mock_calls[0][1][2] == ('PRD-000', 'PRD-001')
+
+
+def test_export_many_output_file(config_mocker, ccli):
+    runner = CliRunner()
+    result = runner.invoke(
+        ccli,
+        [
+            'product',
+            'export',
+            'PRD-000',
+            'PRD-001',
+            '-o',
+            'output.xlsx',
+        ],
+    )
+    assert result.exit_code == 1
+    assert 'The output file name can not be set when exporting many products.' in result.output
+
+
+def test_export_no_products(config_mocker, ccli):
+    runner = CliRunner()
+    result = runner.invoke(ccli, ['product', 'export'])
+
+    assert result.exit_code == 1
+    assert 'Provide one or more product ids or a query' in result.output
+
+
+def test_export_products(fs, mocker):
+    mocker.patch(
+        'connect.cli.plugins.product.export.ProcessPoolExecutor',
+        ThreadPoolExecutor,
+    )
+
+    def dump(**kwargs):
+        if kwargs['product_id'] == 'PRD-001':
+            raise ClickException('404 - Not Found: Product PRD-001 not found.')
+        return f'{kwargs["product_id"]}.xlsx'
+
+    mock = mocker.patch(
+        'connect.cli.plugins.product.export.dump_product',
+        side_effect=dump,
+    )
+
+    results = dump_products(
+        api_url='https://localhost/public/v1',
+        api_key='ApiKey SU111:1111',
+        product_ids=('PRD-000', 'PRD-001'),
+        output_path=fs.root_path,
+        silent=True,
+        workers=2,
+    )
+
+    assert mock.call_count == 2
+    assert mock.mock_calls[0][2]['silent'] is True
+    assert [result['product_id'] for result in results] == ['PRD-000', 'PRD-001']
+    assert results[0]['output_file'] == 'PRD-000.xlsx'
+    assert results[0]['error'] is None
+    assert results[1]['output_file'] is None
+    assert results[1]['error'] == '404 - Not Found: Product PRD-001 not found.'
+
+
 def test_export_product_not_exists(fs, mocked_responses):
     mocked_responses.add(
         method='GET',
@@ -156,7 +634,30 @@ def test_export_product_not_exists(fs, mocked_responses):
     assert str(e.value) == '404 - Not Found: Product PRD-0000 not found.'
 
 
+def _load_exported_product(output_file, output_format):
+    if output_format == 'xlsx':
+        return load_workbook(output_file)
+    assert os.path.isfile(os.path.join(output_file, f'items.{output_format}'))
+    return load_product_files(output_file)
+
+
+@pytest.mark.parametrize(
+    ('jobs', 'output_format'),
+    (
+        (1, 'xlsx'),
+        (4, 'xlsx'),
+        (1, 'ndjson'),
+        (4, 'json'),
+        pytest.param(
+            4,
+            'parquet',
+            marks=pytest.mark.skipif(find_spec('pyarrow') is None, reason='pyarrow is not installed'),
+        ),
+    ),
+)
 def test_export_product(
+    jobs,
+    output_format,
     fs,
     mocked_responses,
     mocked_product_response,
@@ -201,11 +702,12 @@ def test_export_product(
         body=open('./tests/fixtures/image.png', 'rb').read(),
         status=200,
     )
-    mocked_responses.add(
-        method='GET',
-        url='https://localhost/public/v1/categories',
-        json=mocked_categories_response,
-    )
+    if output_format == 'xlsx':
+        mocked_responses.add(
+            method='GET',
+            url='https://localhost/public/v1/categories',
+            json=mocked_categories_response,
+        )
     mocked_responses.add(
         method='GET',
         url='https://localhost/public/v1/products/PRD-276-377-545/media',
@@ -289,9 +791,10 @@ def test_export_product(
         output_file='output.xlsx',
         output_path=fs.root_path,
         silent=True,
+        jobs=jobs,
+        output_format=output_format,
     )
-
-    product_wb = load_workbook(output_file)
+    product_wb = _load_exported_product(output_file, output_format)
     for name in sample_product_workbook.sheetnames:
         assert name in product_wb.sheetnames
     for sheet in sample_product_workbook.sheetnames:
@@ -312,6 +815,16 @@ def test_export_product(
             letter_idx = 0
             row_idx = row_idx + 1
 
+    if output_format == 'xlsx':
+        assert product_wb['Items']['N1'].value == 'Fingerprint'
+        assert product_wb['Items'].column_dimensions['N'].hidden is True
+        session = SyncSession(None, output_file)
+        for worksheet in ('Items', 'Ordering Parameters', 'Templates', 'Actions', 'Configuration'):
+            rows = list(session.iter_rows(worksheet))
+            assert rows
+            for row_idx, data in rows:
+                assert session.is_row_unchanged(worksheet, row_idx, data)
+
 
 def _get_col_limit_by_type(ws_type):
     if ws_type == 'General Information':
@@ -337,3 +850,71 @@ def _get_col_limit_by_type(ws_type):
     elif ws_type == 'Configuration':
         return 'G'
     return 'Z'
+
+
+def test_sync_sheets_product_updates_not_concurrent(mocker):
+    capabilities_done = Event()
+    static_resources_started = Event()
+
+    def capabilities_sync(*args):
+        static_resources_started.wait(0.5)
+        capabilities_done.set()
+        return {'module': 'Capabilities'}
+
+    def static_resources_sync(*args):
+        static_resources_started.set()
+        assert capabilities_done.is_set()
+        return {'module': 'Static Resources'}
+
+    for name in (
+        'item_sync', 'templates_sync', 'params_sync', 'actions_sync', 'media_sync', 'config_values_sync',
+    ):
+        mocker.patch(f'connect.cli.plugins.product.commands.{name}', return_value=None)
+    mocker.patch('connect.cli.plugins.product.commands.capabilities_sync', capabilities_sync)
+    mocker.patch('connect.cli.plugins.product.commands.static_resources_sync', static_resources_sync)
+    session = mocker.MagicMock()
+
+    results = sync_sheets(None, Config(), 'PRD-000.xlsx', session)
+
+    assert results == [{'module': 'Capabilities'}, {'module': 'Static Resources'}]
+    session.save.assert_called_once()
+
+
+def _media_result():
+    return {
+        'module': 'Media',
+        'created': 1,
+        'updated': 1,
+        'deleted': 0,
+        'skipped': 0,
+        'errors': {},
+        'uploaded_bytes': 4096,
+        'elapsed': 2,
+    }
+
+
+def test_print_results_uploads(capsys):
+    print_results(silent=False, product_id='PRD-000', results_tracker=[_media_result()])
+
+    row = next(line for line in capsys.readouterr().out.splitlines() if 'Media' in line)
+    assert '4096' in row
+    assert '2.00' in row
+
+
+def test_print_sync_results_uploads(capsys):
+    print_sync_results(
+        False,
+        [
+            {
+                'input_file': 'PRD-000.xlsx',
+                'product_id': 'PRD-000',
+                'results': [_media_result()],
+                'elapsed': 3,
+                'error': None,
+            },
+        ],
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert '2.00' in next(line for line in lines if 'Media' in line)
+    assert '4096' in next(line for line in lines if 'Total' in line)
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+
+import pytest
+import responses
+from click import ClickException
+
+from connect.cli.plugins.product.cache import MediaCache
+from connect.cli.plugins.product.downloader import MediaDownloader
+
+
+def test_download(fs, mocked_responses):
+    with open('./tests/fixtures/image.png', 'rb') as f:
+        content = f.read()
+    for name in ('a.png', 'b.png'):
+        mocked_responses.add(
+            method='GET',
+            url=f'https://localhost/media/{name}',
+            body=content,
+            status=200,
+        )
+
+    downloader = MediaDownloader(fs.root_path, workers=2, chunk_size=128)
+    downloader.download('https://localhost/media/a.png', 'a.png')
+    downloader.download('https://localhost/media/b.png', 'b.png')
+    count, total_bytes, _ = downloader.wait()
+    downloader.close()
+
+    assert count == 2
+    assert total_bytes == 2 * len(content)
+    for name in ('a.png', 'b.png'):
+        with open(os.path.join(fs.root_path, name), 'rb') as f:
+            assert f.read() == content
+    assert not os.path.exists(os.path.join(fs.root_path, 'a.png.part'))
+    with open(os.path.join(fs.root_path, 'checksums.json')) as f:
+        checksums = json.load(f)
+    assert checksums == {name: hashlib.sha256(content).hexdigest() for name in ('a.png', 'b.png')}
+
+
+def test_download_error(fs, mocked_responses):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/media/a.png',
+        status=404,
+    )
+
+    downloader = MediaDownloader(fs.root_path)
+    downloader.download('https://localhost/media/a.png', 'a.png')
+    with pytest.raises(ClickException) as e:
+        downloader.wait()
+    downloader.close()
+
+    assert str(e.value) == 'Error obtaining image from https://localhost/media/a.png'
+    assert not os.path.exists(os.path.join(fs.root_path, 'a.png'))
+
+
+def test_download_not_modified(fs, mocked_responses):
+    cache = MediaCache(os.path.join(fs.root_path, 'cache'))
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/media/a.png',
+        body=b'aaaa',
+        status=200,
+        headers={'ETag': '"a"'},
+    )
+    downloader = MediaDownloader(fs.root_path, cache=cache)
+    downloader.download('https://localhost/media/a.png', 'a.png')
+    downloader.wait()
+    downloader.close()
+
+    mocked_responses.replace(
+        responses.GET,
+        'https://localhost/media/a.png',
+        status=304,
+    )
+    os.remove(os.path.join(fs.root_path, 'a.png'))
+    downloader = MediaDownloader(fs.root_path, cache=MediaCache(os.path.join(fs.root_path, 'cache')))
+    downloader.download('https://localhost/media/a.png', 'a.png')
+    count, total_bytes, _ = downloader.wait()
+    downloader.close()
+
+    assert count == 1
+    assert total_bytes == 0
+    assert downloader.cached == 1
+    assert mocked_responses.calls[-1].request.headers['If-None-Match'] == '"a"'
+    with open(os.path.join(fs.root_path, 'a.png'), 'rb') as f:
+        assert f.read() == b'aaaa'
+
+
+def test_download_same_size(fs, mocked_responses):
+    cache = MediaCache(os.path.join(fs.root_path, 'cache'))
+    with open(os.path.join(fs.root_path, 'src.png'), 'wb') as f:
+        f.write(b'aaaa')
+    cache.put('https://localhost/media/a.png', os.path.join(fs.root_path, 'src.png'), 'digest', 4)
+    mocked_responses.add(
+        method='HEAD',
+        url='https://localhost/media/a.png',
+        status=200,
+        headers={'Content-Length': '4'},
+    )
+
+    downloader = MediaDownloader(fs.root_path, cache=cache)
+    downloader.download('https://localhost/media/a.png', 'a.png')
+    downloader.wait()
+    downloader.close()
+
+    assert downloader.cached == 1
+    assert len(mocked_responses.calls) == 1
+
+
+def test_download_evicted_from_cache(fs, mocked_responses, mocker):
+    cache = MediaCache(os.path.join(fs.root_path, 'cache'))
+    with open(os.path.join(fs.root_path, 'src.png'), 'wb') as f:
+        f.write(b'aaaa')
+    cache.put('https://localhost/media/a.png', os.path.join(fs.root_path, 'src.png'), 'digest', 4, etag='"a"')
+    entry = cache.get('https://localhost/media/a.png')
+    os.remove(os.path.join(fs.root_path, 'cache', 'objects', 'digest'))
+    mocker.patch.object(cache, 'get', return_value=entry)
+    mocked_responses.add(method='GET', url='https://localhost/media/a.png', status=304)
+    mocked_responses.add(method='GET', url='https://localhost/media/a.png', body=b'bbbb', status=200)
+
+    downloader = MediaDownloader(fs.root_path, cache=cache)
+    downloader.download('https://localhost/media/a.png', 'a.png')
+    count, total_bytes, _ = downloader.wait()
+    downloader.close()
+
+    assert (count, total_bytes, downloader.cached) == (1, 4, 0)
+    assert 'If-None-Match' not in mocked_responses.calls[-1].request.headers
+    with open(os.path.join(fs.root_path, 'a.png'), 'rb') as f:
+        assert f.read() == b'bbbb'
@@ -0,0 +1,145 @@
+import json
+import os
+
+import pytest
+from click import ClickException
+
+from connect.cli.plugins.product.formats import (
+    FILE_READERS,
+    FILE_WRITERS,
+    get_files_format,
+    get_resource_file,
+    get_resource_headers,
+    load_product_files,
+)
+from connect.cli.plugins.product.sync.actions import ActionsSynchronizer
+from connect.cli.plugins.product.sync.base import SyncSession
+from connect.client import ConnectClient
+
+
+@pytest.mark.parametrize('output_format', ('ndjson', 'json'))
+def test_write_read(fs, output_format):
+    path = os.path.join(fs.root_path, f'items.{output_format}')
+    writer = FILE_WRITERS[output_format](path, ['ID', 'MPN'])
+    writer.write(('PRD-000-0001', 'MPN-1'))
+    writer.write(('PRD-000-0002', None))
+    writer.close()
+
+    assert writer.count == 2
+    assert list(FILE_READERS[output_format](path)) == [
+        {'ID': 'PRD-000-0001', 'MPN': 'MPN-1'},
+        {'ID': 'PRD-000-0002', 'MPN': None},
+    ]
+
+
+def test_write_read_parquet(fs, mocker):
+    pq = pytest.importorskip('pyarrow.parquet')
+    mocker.patch('connect.cli.plugins.product.formats.PARQUET_BATCH_SIZE', 2)
+    path = os.path.join(fs.root_path, 'capabilities.parquet')
+    writer = FILE_WRITERS['parquet'](path, ['Position', 'Value', 'Notes'])
+    rows = [
+        (1, 'Disabled', None),
+        (2, 'Disabled', None),
+        (3, 1, 'a'),
+    ]
+    for row in rows:
+        writer.write(row)
+    writer.close()
+
+    assert str(pq.read_schema(path).field('Position').type) == 'int64'
+    assert list(FILE_READERS['parquet'](path)) == [
+        {'Position': position, 'Value': value, 'Notes': notes}
+        for position, value, notes in rows
+    ]
+
+
+def test_write_empty_json(fs):
+    path = os.path.join(fs.root_path, 'actions.json')
+    FILE_WRITERS['json'](path, ['ID']).close()
+
+    with open(path) as f:
+        assert json.load(f) == []
+
+
+def test_load_product_files(fs, sample_product_workbook):
+    path = fs.root_path
+    assert get_files_format(path) is None
+
+    general = sample_product_workbook['General Information']
+    with open(get_resource_file(path, 'general', 'ndjson'), 'w') as f:
+        for row in general.iter_rows(min_row=3, max_col=2, values_only=True):
+            f.write(json.dumps({'Field': row[0], 'Value': row[1]}, default=str) + '\n')
+    headers = get_resource_headers('parameters')
+    with open(get_resource_file(path, 'parameters', 'ndjson'), 'w') as f:
+        for sheet in ('Ordering Parameters', 'Fulfillment Parameters'):
+            rows = sample_product_workbook[sheet].iter_rows(min_row=2, values_only=True)
+            for row in rows:
+                f.write(json.dumps(dict(zip(headers, row)), default=str) + '\n')
+
+    assert get_files_format(path) == 'ndjson'
+    wb = load_product_files(path)
+
+    assert wb['General Information']['B5'].value == 'PRD-276-377-545'
+    assert 'Items' not in wb.sheetnames
+    for sheet in ('Ordering Parameters', 'Fulfillment Parameters'):
+        assert wb[sheet].max_row == sample_product_workbook[sheet].max_row
+        assert wb[sheet]['B2'].value == sample_product_workbook[sheet]['B2'].value
+    assert wb['Configuration Parameters'].max_row == 1
+
+
+def test_load_product_files_invalid_phase(fs, sample_product_workbook):
+    path = fs.root_path
+    general = sample_product_workbook['General Information']
+    with open(get_resource_file(path, 'general', 'ndjson'), 'w') as f:
+        for row in general.iter_rows(min_row=3, max_col=2, values_only=True):
+            f.write(json.dumps({'Field': row[0], 'Value': row[1]}, default=str) + '\n')
+    headers = get_resource_headers('parameters')
+    parameters_file = get_resource_file(path, 'parameters', 'ndjson')
+    with open(parameters_file, 'w') as f:
+        row = next(sample_product_workbook['Ordering Parameters'].iter_rows(min_row=2, values_only=True))
+        record = dict(zip(headers, row))
+        f.write(json.dumps(record, default=str) + '\n')
+        f.write(json.dumps(dict(record, Phase='billing'), default=str) + '\n')
+
+    with pytest.raises(ClickException) as e:
+        load_product_files(path)
+
+    assert str(e.value) == (
+        f'Invalid file {parameters_file}: record 2 has phase `billing`, '
+        'valid phases are ordering, fulfillment, configuration.'
+    )
+
+
+def test_sync_product_files(fs, get_sync_actions_env, mocked_responses, mocked_actions_response):
+    path = fs.root_path
+    general = get_sync_actions_env['General Information']
+    with open(get_resource_file(path, 'general', 'json'), 'w') as f:
+        json.dump(
+            [
+                {'Field': field, 'Value': value}
+                for field, value in general.iter_rows(min_row=3, max_col=2, values_only=True)
+            ],
+            f,
+            default=str,
+        )
+    headers = get_resource_headers('actions')
+    actions_file = get_resource_file(path, 'actions', 'json')
+    with open(actions_file, 'w') as f:
+        row = dict(zip(headers, next(get_sync_actions_env['Actions'].iter_rows(min_row=2, values_only=True))))
+        json.dump([dict(row, **{'Verbose ID': None, 'Action': 'create'})], f)
+    mocked_responses.add(
+        method='POST',
+        url='https://localhost/public/v1/products/PRD-276-377-545/actions',
+        json=mocked_actions_response[0],
+    )
+    client = ConnectClient(use_specs=False, api_key='ApiKey SU:123', endpoint='https://localhost/public/v1')
+
+    session = SyncSession(client, path)
+    synchronizer = ActionsSynchronizer(client, True, session)
+    synchronizer.open(path, 'Actions')
+    assert synchronizer.sync()[1] == 1
+    session.save()
+
+    assert next(FILE_READERS['json'](actions_file))['Verbose ID'] == mocked_actions_response[0]['id']
+    assert load_product_files(path)['Actions']['A2'].value == mocked_actions_response[0]['id']
+    assert not os.path.isfile(f'{actions_file}.tmp')
@@ -0,0 +1,43 @@
+import pytest
+
+from connect.cli.plugins.product.pipeline import ExportPipeline
+
+
+def test_run():
+    pipeline = ExportPipeline(buffer_size=2)
+    rows = []
+
+    pipeline.run('items', range(10), lambda value: (value, value * 2), rows.append)
+
+    assert rows == [(value, value * 2) for value in range(10)]
+    assert set(pipeline.timings['items']) == {'source', 'projector', 'sink'}
+
+
+def test_run_source_error():
+    def source():
+        yield 1
+        raise ValueError('page error')
+
+    rows = []
+    with pytest.raises(ValueError) as e:
+        ExportPipeline().run('items', source(), lambda value: value, rows.append)
+
+    assert str(e.value) == 'page error'
+    assert rows == [1]
+
+
+def test_run_sink_error():
+    produced = []
+
+    def source():
+        for value in range(1000):
+            produced.append(value)
+            yield value
+
+    def sink(row):
+        raise ValueError('sink error')
+
+    with pytest.raises(ValueError):
+        ExportPipeline(buffer_size=5).run('items', source(), lambda value: value, sink)
+
+    assert len(produced) < 1000
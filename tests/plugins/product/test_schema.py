@@ -0,0 +1,88 @@
+from connect.cli.plugins.product.schema import (
+    CAPABILITIES_SCHEMA,
+    CONFIGURATION_SCHEMA,
+    ITEMS_SCHEMA,
+    PARAMS_SCHEMA,
+)
+
+
+def test_schema_layout():
+    assert ITEMS_SCHEMA.col_limit == 'M'
+    assert ITEMS_SCHEMA.headers['C'] == 'Action'
+    assert ITEMS_SCHEMA.col_idx['billing_period'] == 9
+    assert ITEMS_SCHEMA.col_letter['commitment'] == 'J'
+    assert PARAMS_SCHEMA.columns[PARAMS_SCHEMA.col_idx['json_properties'] - 1].width == 100
+
+
+def test_schema_project_item():
+    item = {
+        'id': 'PRD-276-377-545-0001',
+        'mpn': 'MPN-R-001',
+        'display_name': 'Item',
+        'description': 'Description',
+        'type': 'reservation',
+        'precision': 'integer',
+        'unit': {'unit': 'users'},
+        'period': 'years_2',
+        'commitment': {'count': 1, 'multiplier': 'billing_period'},
+        'status': 'published',
+        'events': {'created': {'at': '2021-01-01'}},
+    }
+
+    assert ITEMS_SCHEMA.project(item) == (
+        'PRD-276-377-545-0001',
+        'MPN-R-001',
+        '-',
+        'Item',
+        'Description',
+        'reservation',
+        'integer',
+        'users',
+        '2 years',
+        '-',
+        'published',
+        '2021-01-01',
+        '-',
+    )
+
+
+def test_schema_project_configuration():
+    configuration = {
+        'parameter': {'id': 'PRM-001', 'scope': 'item'},
+        'item': {'id': 'PRD-001-0001', 'name': 'Item'},
+        'structured_value': {'a': 1},
+    }
+
+    row = CONFIGURATION_SCHEMA.project(configuration)
+
+    assert row[:8] == ('PRM-001#PRD-001-0001#', 'PRM-001', 'item', '-', 'PRD-001-0001', 'Item', '-', '-')
+    assert row[8] == '{\n    "a": 1\n}'
+
+
+def test_schema_project_capability():
+    assert CAPABILITIES_SCHEMA.project(('Tier Accounts Sync', 'Enabled')) == (
+        'Tier Accounts Sync',
+        '-',
+        'Enabled',
+    )
+
+
+def test_schema_get_validations():
+    validations = ITEMS_SCHEMA.get_validations()
+
+    assert list(validations) == ['C', 'F', 'G', 'I', 'J']
+    assert validations['C'].formula1 == '"-,create,update,delete"'
+    assert validations['F'].formula1 == '"reservation,ppu"'
+    assert validations['J'].formula1 == '"-,1 year,2 years,3 years,4 years,5 years"'
+
+
+def test_schema_fingerprint():
+    row = ('Tier Accounts Sync', '-', 'Enabled')
+
+    assert CAPABILITIES_SCHEMA.fingerprint_col_letter == 'D'
+    assert CAPABILITIES_SCHEMA.fingerprint(row) == CAPABILITIES_SCHEMA.fingerprint(
+        ('Tier Accounts Sync', 'update', 'Enabled'),
+    )
+    assert CAPABILITIES_SCHEMA.fingerprint(row) != CAPABILITIES_SCHEMA.fingerprint(
+        ('Tier Accounts Sync', '-', 'Disabled'),
+    )
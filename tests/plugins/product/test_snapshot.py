@@ -0,0 +1,135 @@
+import json
+import os
+
+from connect.cli.plugins.product.snapshot import ExportSnapshot
+from connect.client import ConnectClient
+
+
+def _item(item_id, updated_at):
+    return {'id': item_id, 'events': {'updated': {'at': updated_at}}}
+
+
+def _client():
+    return ConnectClient(
+        use_specs=False,
+        api_key='ApiKey SU:123',
+        endpoint='https://localhost/public/v1',
+    )
+
+
+def test_fetch_full(fs, mocked_responses):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items',
+        json=[_item('PRD-1', '2021-01-01T00:00:00+00:00'), _item('PRD-2', '2021-01-02T00:00:00+00:00')],
+    )
+    path = os.path.join(fs.root_path, 'snapshot.json')
+    snapshot = ExportSnapshot(path, 'PRD-276-377-545')
+    items = snapshot.fetch('items', _client().products['PRD-276-377-545'].items.all())
+    snapshot.save()
+
+    assert [item['id'] for item in items] == ['PRD-1', 'PRD-2']
+    assert snapshot.fetched == 2
+    with open(path) as f:
+        data = json.load(f)
+    assert data['collections']['items']['updated_at'] == '2021-01-02T00:00:00+00:00'
+
+
+def _write_snapshot(path, objects, updated_at='2021-01-02T00:00:00+00:00'):
+    with open(path, 'w') as f:
+        json.dump(
+            {
+                'product_id': 'PRD-276-377-545',
+                'collections': {'items': {'updated_at': updated_at, 'objects': objects}},
+            },
+            f,
+        )
+
+
+def _add_changed(mocked_responses, objects):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?'
+            'or(ge(events.updated.at,2021-01-02T00:00:00+00:00),'
+            'ge(events.created.at,2021-01-02T00:00:00+00:00))&limit=100&offset=0',
+        json=objects,
+        match_querystring=True,
+    )
+
+
+def _add_ids(mocked_responses, ids):
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?select(id)&limit=100&offset=0',
+        json=[{'id': item_id} for item_id in ids],
+        match_querystring=True,
+    )
+
+
+def test_fetch_changed(fs, mocked_responses):
+    path = os.path.join(fs.root_path, 'snapshot.json')
+    _write_snapshot(
+        path,
+        [_item('PRD-1', '2021-01-01T00:00:00+00:00'), _item('PRD-2', '2021-01-02T00:00:00+00:00')],
+    )
+    _add_changed(
+        mocked_responses,
+        [_item('PRD-2', '2021-01-03T00:00:00+00:00'), _item('PRD-3', '2021-01-03T00:00:00+00:00')],
+    )
+    _add_ids(mocked_responses, ['PRD-1', 'PRD-2', 'PRD-3'])
+
+    snapshot = ExportSnapshot(path, 'PRD-276-377-545')
+    items = snapshot.fetch('items', _client().products['PRD-276-377-545'].items.all())
+
+    assert [item['id'] for item in items] == ['PRD-1', 'PRD-2', 'PRD-3']
+    assert items[1]['events']['updated']['at'] == '2021-01-03T00:00:00+00:00'
+    assert snapshot.fetched == 2
+    assert snapshot.deleted == 0
+
+
+def test_fetch_deleted_and_created(fs, mocked_responses):
+    path = os.path.join(fs.root_path, 'snapshot.json')
+    _write_snapshot(
+        path,
+        [_item('PRD-1', '2021-01-01T00:00:00+00:00'), _item('PRD-2', '2021-01-02T00:00:00+00:00')],
+    )
+    created = {'id': 'PRD-3', 'events': {'created': {'at': '2021-01-03T00:00:00+00:00'}}}
+    _add_changed(mocked_responses, [created])
+    _add_ids(mocked_responses, ['PRD-2', 'PRD-3'])
+
+    snapshot = ExportSnapshot(path, 'PRD-276-377-545')
+    items = snapshot.fetch('items', _client().products['PRD-276-377-545'].items.all())
+    snapshot.save()
+
+    assert items == [_item('PRD-2', '2021-01-02T00:00:00+00:00'), created]
+    assert snapshot.fetched == 1
+    assert snapshot.deleted == 1
+    with open(path) as f:
+        assert json.load(f)['collections']['items']['updated_at'] == '2021-01-03T00:00:00+00:00'
+
+
+def test_fetch_missing(fs, mocked_responses):
+    path = os.path.join(fs.root_path, 'snapshot.json')
+    _write_snapshot(path, [_item('PRD-1', '2021-01-01T00:00:00+00:00')])
+    _add_changed(mocked_responses, [])
+    _add_ids(mocked_responses, ['PRD-1', 'PRD-2'])
+    mocked_responses.add(
+        method='GET',
+        url='https://localhost/public/v1/products/PRD-276-377-545/items?limit=100&offset=0',
+        json=[_item('PRD-1', '2021-01-01T00:00:00+00:00'), {'id': 'PRD-2'}],
+        match_querystring=True,
+    )
+
+    snapshot = ExportSnapshot(path, 'PRD-276-377-545')
+    items = snapshot.fetch('items', _client().products['PRD-276-377-545'].items.all())
+
+    assert [item['id'] for item in items] == ['PRD-1', 'PRD-2']
+    assert snapshot.fetched == 2
+    assert snapshot._collections['items']['updated_at'] == '2021-01-01T00:00:00+00:00'
+
+
+def test_other_product(fs):
+    path = os.path.join(fs.root_path, 'snapshot.json')
+    ExportSnapshot(path, 'PRD-000').save()
+
+    assert ExportSnapshot(path, 'PRD-001')._collections == {}
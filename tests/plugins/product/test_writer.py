@@ -0,0 +1,36 @@
+import os
+
+from openpyxl import load_workbook
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from connect.cli.plugins.product.writer import (
+    create_workbook,
+    HEADER_STYLE,
+    SheetWriter,
+    WRAP_STYLE,
+)
+
+
+def test_sheet_writer(fs):
+    wb = create_workbook()
+    writer = SheetWriter(wb, 'Items')
+    writer.set_column_width('A', 50)
+    writer.merge_cells('A1:B1')
+    validation = DataValidation(type='list', formula1='"-,create"', allow_blank=False)
+    writer.add_data_validation(validation)
+
+    assert writer.append(('ID', 'Name'), (HEADER_STYLE, HEADER_STYLE)) == 1
+    row_idx = writer.append(('PRD-000', 'Product'), (None, WRAP_STYLE))
+    validation.add(f'A{row_idx}')
+
+    output_file = os.path.join(fs.root_path, 'test.xlsx')
+    wb.save(output_file)
+
+    ws = load_workbook(output_file)['Items']
+    assert ws['A1'].style == HEADER_STYLE
+    assert ws['B2'].value == 'Product'
+    assert ws['B2'].alignment.wrap_text
+    assert ws['A2'].style == 'Normal'
+    assert ws.column_dimensions['A'].width == 50
+    assert 'A1:B1' in ws.merged_cells
+    assert str(ws.data_validations.dataValidation[0].sqref) == 'A2'